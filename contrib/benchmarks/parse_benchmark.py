@@ -0,0 +1,556 @@
+#! /usr/bin/env python
+
+"""
+Parse throughput benchmarks for the languages in Langkit's "contrib" directory.
+
+This script builds the generated libraries for the Python and Lkt grammars,
+then parses synthetic and real corpora of increasing size through the
+generated Python bindings. For each corpus, it reports:
+
+* the number of tokens and nodes processed per second;
+* the peak memory growth per analysis unit;
+* the latency of a full reparse after a small edit.
+
+Results are written to a JSON file, so that the "compare" subcommand can show
+how a change in Langkit affects generated parsers and lexers.
+
+Each corpus is measured in a dedicated worker process, so that peak memory
+measurements for one corpus are not polluted by the previous ones.
+"""
+
+import argparse
+import datetime
+import glob
+import json
+import os
+from os import path as P
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+
+BENCH_DIR = P.dirname(P.abspath(__file__))
+CONTRIB_DIR = P.dirname(BENCH_DIR)
+LANGKIT_ROOT = P.dirname(CONTRIB_DIR)
+
+
+def synthetic_python(size):
+    """
+    Return Python source code with ``size`` top-level "blocks".
+
+    Note that the Python grammar in contrib/python is a Python 2 grammar, so
+    the generated code must avoid Python 3 specific constructs.
+
+    :param int size: Number of blocks to generate.
+    :rtype: str
+    """
+    chunks = []
+    for i in range(size):
+        chunks.append(
+            'class Class{i}(object):\n'
+            '    """Docstring for class {i}."""\n'
+            '\n'
+            '    def __init__(self, a, b=None, *args, **kwargs):\n'
+            '        self.a = a\n'
+            '        self.b = b if b is not None else [a, {i}, "s{i}"]\n'
+            '\n'
+            '    def method(self, x):\n'
+            '        total = 0\n'
+            '        for i in range(x):\n'
+            '            if i % 2 == 0 and not self.a:\n'
+            '                total += i * {i}\n'
+            '            elif i > 10:\n'
+            '                total -= self.compute(i, key=lambda y: y + 1)\n'
+            '            else:\n'
+            '                total = {{"k": total, "i": [i, i + 1]}}["k"]\n'
+            '        while total > 100:\n'
+            '            total //= 2\n'
+            '        return total\n'
+            '\n'
+            '\n'
+            'def function_{i}(arg):\n'
+            '    # Comment for function {i}\n'
+            '    try:\n'
+            '        return Class{i}(arg).method(arg)\n'
+            '    except ValueError as exc:\n'
+            '        raise RuntimeError(str(exc))\n'
+            '\n'
+            '\n'.format(i=i)
+        )
+    return ''.join(chunks)
+
+
+def synthetic_lkt(size):
+    """
+    Return Lkt source code with ``size`` "blocks".
+
+    :param int size: Number of blocks to generate.
+    :rtype: str
+    """
+    chunks = []
+    for i in range(size):
+        chunks.append(
+            '# Comment for block {i}\n'
+            'struct Struct{i} {{\n'
+            '    key : Symbol\n'
+            '    value : Int\n'
+            '}}\n'
+            '\n'
+            'class Node{i} : FooNode {{\n'
+            '    @parse_field f_name : Name\n'
+            '\n'
+            '    ## Documentation for prop_{i}\n'
+            '    @export fun prop_{i} (a : Int, b : Bool = false): Int = {{\n'
+            '        val c = [a, {i}, a + 1].find((v) => v = a);\n'
+            '        val d = if b then c * 2 else c - {i};\n'
+            '\n'
+            '        match node.parent {{\n'
+            '            case n : Node{i} => d + n.prop_{i}(a, not b)\n'
+            '            case _ => d\n'
+            '        }}\n'
+            '    }}\n'
+            '\n'
+            '    fun helper_{i} (): Struct{i} = '
+            'Struct{i}(key="k{i}", value={i})\n'
+            '}}\n'
+            '\n'.format(i=i)
+        )
+    return ''.join(chunks)
+
+
+class Language:
+    """
+    Description of a contrib language to benchmark.
+    """
+
+    def __init__(self, name, module_name, extension, synthetic,
+                 default_corpus):
+        """
+        :param str name: Name of the language (also name of its directory in
+            "contrib").
+        :param str module_name: Name of the Python module for the generated
+            library.
+        :param str extension: File extension for source files.
+        :param (int) -> str synthetic: Function to generate synthetic
+            corpora.
+        :param list[str] default_corpus: List of glob patterns (relative to
+            the Langkit root directory) for the real corpus to use when the
+            user provides none.
+        """
+        self.name = name
+        self.module_name = module_name
+        self.extension = extension
+        self.synthetic = synthetic
+        self.default_corpus = default_corpus
+
+    @property
+    def lang_dir(self):
+        return P.join(CONTRIB_DIR, self.name)
+
+    def default_files(self):
+        """
+        Return the sorted list of files for this language's default real
+        corpus.
+
+        :rtype: list[str]
+        """
+        result = set()
+        for pattern in self.default_corpus:
+            result.update(glob.glob(P.join(LANGKIT_ROOT, pattern),
+                                    recursive=True))
+        return sorted(result)
+
+
+LANGUAGES = {
+    lang.name: lang for lang in [
+        Language('python', 'libpythonlang', '.py', synthetic_python, []),
+        Language('lkt', 'liblktlang', '.lkt', synthetic_lkt,
+                 ['testsuite/**/*.lkt']),
+    ]
+}
+
+
+def langkit_revision():
+    """
+    Return a description of the current Langkit revision: commit hash plus a
+    flag to tell whether the working tree has local changes.
+
+    :rtype: dict[str, str|bool|None]
+    """
+    def git(*args):
+        try:
+            return subprocess.check_output(
+                ['git'] + list(args), cwd=LANGKIT_ROOT,
+                stderr=subprocess.DEVNULL, universal_newlines=True
+            ).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    status = git('status', '--porcelain', '--untracked-files=no')
+    return {'commit': git('rev-parse', 'HEAD'),
+            'dirty': bool(status) if status is not None else None}
+
+
+def manage(lang, build_dir, *args, capture=False):
+    """
+    Run the "manage.py" script for the given language.
+
+    :param Language lang: Language to process.
+    :param str build_dir: Build directory for the generated library.
+    :param list[str] args: Subcommand and arguments to pass to manage.py.
+    :param bool capture: Whether to capture and return the standard output.
+    :rtype: None|str
+    """
+    argv = [sys.executable, P.join(lang.lang_dir, 'manage.py'), args[0],
+            '--build-dir', build_dir] + list(args[1:])
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [LANGKIT_ROOT] + ([env['PYTHONPATH']] if 'PYTHONPATH' in env else [])
+    )
+
+    if capture:
+        return subprocess.check_output(argv, cwd=lang.lang_dir, env=env,
+                                       universal_newlines=True)
+    subprocess.check_call(argv, cwd=lang.lang_dir, env=env)
+
+
+def library_env(lang, build_dir):
+    """
+    Return the environment to use in order to load the generated library for
+    ``lang``.
+
+    :param Language lang: Language to process.
+    :param str build_dir: Build directory for the generated library.
+    :rtype: dict[str, str]
+    """
+    env = dict(os.environ)
+    for name, value in json.loads(
+        manage(lang, build_dir, 'setenv', '--json', '--build-mode=prod',
+               capture=True)
+    ).items():
+        env[name] = (value + os.pathsep + env[name]
+                     if env.get(name) else value)
+    return env
+
+
+def corpora(lang, args):
+    """
+    Return the list of corpora to measure for the given language.
+
+    Each corpus is a dict suitable to be passed to a worker process.
+
+    :param Language lang: Language to process.
+    :param argparse.Namespace args: Command-line arguments.
+    :rtype: list[dict]
+    """
+    result = [{'name': 'synthetic-{}'.format(size), 'synthetic': size}
+              for size in args.sizes]
+
+    files = []
+    for spec in args.corpus:
+        lang_name, pattern = spec.split('=', 1)
+        if lang_name == lang.name:
+            if P.isdir(pattern):
+                pattern = P.join(pattern, '**', '*' + lang.extension)
+            files.extend(sorted(glob.glob(pattern, recursive=True)))
+    if not files and not args.no_default_corpus:
+        files = lang.default_files()
+    if files:
+        result.append({'name': 'real', 'files': files})
+
+    return result
+
+
+def run_worker(lang, env, corpus, args):
+    """
+    Measure one corpus in a dedicated process and return the results.
+
+    :param Language lang: Language to process.
+    :param dict[str, str] env: Environment for the worker process.
+    :param dict corpus: Corpus description.
+    :param argparse.Namespace args: Command-line arguments.
+    :rtype: dict
+    """
+    request = dict(corpus, module=lang.module_name, language=lang.name,
+                   repeat=args.repeat, reparse_samples=args.reparse_samples)
+    output = subprocess.check_output(
+        [sys.executable, P.abspath(__file__), 'worker'],
+        input=json.dumps(request), env=env, universal_newlines=True
+    )
+    return json.loads(output)
+
+
+def do_run(args):
+    """
+    Build libraries (unless told otherwise), then measure all corpora.
+    """
+    results = {
+        'langkit': langkit_revision(),
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'languages': {},
+    }
+
+    for lang_name in args.languages:
+        lang = LANGUAGES[lang_name]
+        build_dir = P.abspath(P.join(args.build_root, lang.name))
+
+        if not args.no_build:
+            print('Building {}...'.format(lang.module_name), file=sys.stderr)
+            manage(lang, build_dir, 'make', '-vnone', '--disable-all-mains',
+                   '--build-mode=prod', '--no-ada-api')
+        env = library_env(lang, build_dir)
+
+        lang_results = results['languages'][lang.name] = {}
+        for corpus in corpora(lang, args):
+            print('Measuring {}/{}...'.format(lang.name, corpus['name']),
+                  file=sys.stderr)
+            lang_results[corpus['name']] = r = run_worker(lang, env, corpus,
+                                                          args)
+            print('  {:>12.0f} tokens/s  {:>12.0f} nodes/s'
+                  '  {:>10.1f} KiB/unit  {:>8.3f} ms reparse'.format(
+                      r['tokens_per_sec'], r['nodes_per_sec'],
+                      r['peak_memory_per_unit'] / 1024,
+                      r['reparse_latency'] * 1000),
+                  file=sys.stderr)
+
+    output = args.output or 'parse-bench-{}.json'.format(
+        (results['langkit']['commit'] or 'unknown')[:12]
+    )
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print('Results written to {}'.format(output), file=sys.stderr)
+
+
+METRICS = [
+    # Name, unit, whether higher is better
+    ('tokens_per_sec', 'tok/s', True),
+    ('nodes_per_sec', 'nodes/s', True),
+    ('peak_memory_per_unit', 'B/unit', False),
+    ('reparse_latency', 's', False),
+]
+
+
+def do_compare(args):
+    """
+    Compare two result files produced by the "run" subcommand.
+    """
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+
+    print('Baseline: {} ({})'.format(baseline['langkit']['commit'],
+                                     baseline['date']))
+    print('New:      {} ({})'.format(new['langkit']['commit'], new['date']))
+
+    for lang_name, new_corpora in sorted(new['languages'].items()):
+        old_corpora = baseline['languages'].get(lang_name, {})
+        for corpus_name, new_r in sorted(new_corpora.items()):
+            old_r = old_corpora.get(corpus_name)
+            if old_r is None:
+                continue
+            print('')
+            print('== {}/{} =='.format(lang_name, corpus_name))
+            for name, unit, higher_is_better in METRICS:
+                old_v, new_v = old_r[name], new_r[name]
+                if old_v:
+                    change = (new_v - old_v) / old_v * 100
+                    better = (change > 0) == higher_is_better
+                    change_str = '{:+.1f}%{}'.format(
+                        change, '' if abs(change) < args.threshold else
+                        (' (better)' if better else ' (WORSE)')
+                    )
+                else:
+                    change_str = 'n/a'
+                print('  {:<22} {:>14.6g} -> {:<14.6g} {:<8} {}'.format(
+                    name, old_v, new_v, unit, change_str
+                ))
+
+
+def peak_rss():
+    """
+    Return the peak resident set size of the current process, in bytes.
+
+    :rtype: int
+    """
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux, but in bytes on macOS
+    return usage if sys.platform == 'darwin' else usage * 1024
+
+
+def count_nodes(root):
+    """
+    Return the number of nodes in the tree rooted at ``root``.
+    """
+    result = 0
+    queue = [root]
+    while queue:
+        node = queue.pop()
+        if node is None:
+            continue
+        result += 1
+        queue.extend(node)
+    return result
+
+
+def edit_buffer(buffer):
+    """
+    Return ``buffer`` with a small edit (an empty line inserted at a line
+    boundary in the middle of the buffer), which is valid in both languages.
+    """
+    middle = buffer.find(b'\n', len(buffer) // 2)
+    if middle == -1:
+        return buffer + b'\n'
+    return buffer[:middle + 1] + b'\n' + buffer[middle + 1:]
+
+
+def do_worker(args):
+    """
+    Measure the corpus described on the standard input. Must be run in an
+    environment in which the generated library is available.
+    """
+    import importlib
+
+    request = json.load(sys.stdin)
+    lib = importlib.import_module(request['module'])
+
+    # Load the sources to parse
+    if 'synthetic' in request:
+        source = LANGUAGES[request['language']].synthetic(
+            request['synthetic']
+        )
+        buffers = [('synthetic' + LANGUAGES[request['language']].extension,
+                    source.encode('utf-8'))]
+    else:
+        buffers = []
+        for filename in request['files']:
+            with open(filename, 'rb') as f:
+                buffers.append((filename, f.read()))
+
+    def parse_all():
+        ctx = lib.AnalysisContext()
+        start = time.perf_counter()
+        units = [ctx.get_from_buffer(filename, buffer)
+                 for filename, buffer in buffers]
+        return time.perf_counter() - start, ctx, units
+
+    # Measure the memory peak on the first parse only, after the library is
+    # loaded.
+    rss_before = peak_rss()
+    parse_time, ctx, units = parse_all()
+    rss_after = peak_rss()
+
+    tokens = sum(u.token_count + u.trivia_count for u in units)
+    nodes = sum(count_nodes(u.root) for u in units)
+    diagnostics = sum(len(u.diagnostics) for u in units)
+
+    # Keep the best time over several runs to get rid of noise
+    for _ in range(request['repeat'] - 1):
+        parse_time = min(parse_time, parse_all()[0])
+
+    # Measure the time it takes to reparse a unit after a small edit
+    reparse_times = []
+    for (_, buffer), unit in zip(buffers[:request['reparse_samples']], units):
+        edited = edit_buffer(buffer)
+        start = time.perf_counter()
+        unit.reparse(buffer=edited)
+        reparse_times.append(time.perf_counter() - start)
+
+    json.dump({
+        'units': len(units),
+        'bytes': sum(len(b) for _, b in buffers),
+        'lines': sum(b.count(b'\n') for _, b in buffers),
+        'tokens': tokens,
+        'nodes': nodes,
+        'diagnostics': diagnostics,
+        'parse_time': parse_time,
+        'tokens_per_sec': tokens / parse_time if parse_time else 0.0,
+        'nodes_per_sec': nodes / parse_time if parse_time else 0.0,
+        'peak_memory_per_unit': (rss_after - rss_before) / len(units),
+        'reparse_latency': (statistics.median(reparse_times)
+                            if reparse_times else 0.0),
+    }, sys.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    subparsers = parser.add_subparsers()
+
+    run_parser = subparsers.add_parser(
+        'run', help='Build libraries and run benchmarks.'
+    )
+    run_parser.set_defaults(func=do_run)
+    run_parser.add_argument(
+        '--languages', '-l', nargs='+', choices=sorted(LANGUAGES),
+        default=sorted(LANGUAGES),
+        help='Languages to benchmark (default: all).'
+    )
+    run_parser.add_argument(
+        '--build-root', default=P.join(BENCH_DIR, 'build'),
+        help='Directory in which to build the generated libraries (one'
+             ' subdirectory per language).'
+    )
+    run_parser.add_argument(
+        '--no-build', action='store_true',
+        help='Do not build libraries: assume they are already built in the'
+             ' build root directory.'
+    )
+    run_parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[10, 100, 1000, 10000],
+        help='Sizes (in number of blocks) for synthetic corpora.'
+    )
+    run_parser.add_argument(
+        '--corpus', action='append', default=[],
+        help='Real corpus to parse, as LANG=PATH where PATH is either a'
+             ' directory (all sources in it are parsed) or a glob pattern.'
+             ' Can be passed multiple times.'
+    )
+    run_parser.add_argument(
+        '--no-default-corpus', action='store_true',
+        help='Do not parse the default real corpus for languages that have'
+             ' no corpus specified with --corpus.'
+    )
+    run_parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='Number of times each corpus is parsed. The best time is kept.'
+    )
+    run_parser.add_argument(
+        '--reparse-samples', type=int, default=20,
+        help='Maximum number of units to reparse for each corpus in order to'
+             ' measure reparse latency.'
+    )
+    run_parser.add_argument(
+        '--output', '-o',
+        help='Output JSON file. By default, parse-bench-REVISION.json.'
+    )
+
+    compare_parser = subparsers.add_parser(
+        'compare', help='Compare two result files.'
+    )
+    compare_parser.set_defaults(func=do_compare)
+    compare_parser.add_argument('baseline', help='Baseline result file.')
+    compare_parser.add_argument('new', help='New result file.')
+    compare_parser.add_argument(
+        '--threshold', type=float, default=5.0,
+        help='Changes (in percent) below this threshold are considered'
+             ' noise.'
+    )
+
+    worker_parser = subparsers.add_parser('worker')
+    worker_parser.set_defaults(func=do_worker)
+
+    args = parser.parse_args()
+    if not hasattr(args, 'func'):
+        parser.print_help()
+        sys.exit(1)
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from contextlib import contextmanager
 import itertools
 from typing import DefaultDict, Iterator, Union
 
@@ -84,3 +85,23 @@ def gen_name(var_name: Union[str, names.Name]) -> names.Name:
 
     var_id = next(__next_ids[var_name.lower])
     return var_name + names.Name(str(var_id))
+
+
+@contextmanager
+def local_names_scope() -> Iterator[None]:
+    """
+    Context manager to make ``gen_name`` start numbering names from scratch.
+
+    This is meant to generate names that only need to be unique in a given
+    scope of generated code (for instance the local variables of a
+    subprogram), so that this code does not depend on what was generated
+    before. Numbering for names generated outside of this scope resumes when
+    leaving it.
+    """
+    global __next_ids
+    saved_next_ids = __next_ids
+    __next_ids = defaultdict(lambda: itertools.count(0))
+    try:
+        yield
+    finally:
+        __next_ids = saved_next_ids
@@ -12,11 +12,14 @@ this is the way it is done for the Ada language::
 from __future__ import annotations
 
 from collections import defaultdict
-from contextlib import contextmanager
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
 from functools import reduce
 import importlib
+import io
+import multiprocessing
 import os
 from os import path
+import sys
 from typing import (Any, Callable, Dict, List, Optional, TYPE_CHECKING, Union,
                     cast)
 
@@ -31,7 +34,8 @@ from langkit.diagnostics import (
     context_stack, error, print_error, print_error_from_sem_result
 )
 from langkit.utils import (TopologicalSortError, collapse_concrete_nodes,
-                           memoized, memoized_with_default, topological_sort)
+                           memoization_scope, memoized, memoized_with_default,
+                           topological_sort)
 
 
 if TYPE_CHECKING:
@@ -574,6 +578,38 @@ class CompileCtx:
         :type: set[langkit.expressions.base.PropertyDef]
         """
 
+        self.dead_properties = []
+        """
+        List of properties that the "eliminate dead properties" pass removed,
+        as they are unreachable from public APIs, env specs and the grammar.
+
+        :type: list[langkit.expressions.base.PropertyDef]
+        """
+
+        self.dead_composite_types = []
+        """
+        List of array and struct types that the "eliminate dead properties"
+        pass removed, as only dead properties used them.
+
+        :type: list[langkit.compiled_types.CompiledType]
+        """
+
+        self.inlined_calls = []
+        """
+        List of property calls that the "inline trivial properties" pass
+        inlined, as (caller, callee) couples.
+
+        :type: list[(langkit.expressions.base.PropertyDef,
+                     langkit.expressions.base.PropertyDef)]
+        """
+
+        self.builtin_array_types = set()
+        """
+        Set of array types that exist before properties are constructed.
+
+        :type: set[langkit.compiled_types.ArrayType]
+        """
+
         self.memoization_keys = set()
         """
         Set of all CompiledType instances that are used as key in the hashed
@@ -1056,6 +1092,11 @@ class CompileCtx:
         ):
             _ = resolve_type(t)
 
+        # Array types created so far are either used in templated code or
+        # come from the language spec declarations: the dead properties
+        # elimination pass must not remove them.
+        self.builtin_array_types = set(CompiledTypeRepo.array_types)
+
         # Now that all types are known, construct default values for fields
         for st in CompiledTypeRepo.struct_types:
             for f in st.get_abstract_node_data():
@@ -1248,7 +1289,7 @@ class CompileCtx:
                 for prop in typ.get_properties(*args, **kwargs):
                     yield prop
 
-    @memoized
+    @memoized(max_size=1)
     def properties_logging(self):
         """
         Return whether logging is activated for any properties in the compile
@@ -1296,12 +1337,11 @@ class CompileCtx:
                 add_forward(from_prop, over_prop)
 
         def traverse_expr(expr):
-            for ref_prop in expr.flat_subexprs(
-                lambda e: isinstance(e, PropertyDef)
-            ):
-                add_forward(prop, ref_prop)
-            for subexpr in expr.flat_subexprs():
-                traverse_expr(subexpr)
+            for subexpr in expr.preorder():
+                for ref_prop in subexpr.flat_subexprs(
+                    lambda e: isinstance(e, PropertyDef)
+                ):
+                    add_forward(prop, ref_prop)
 
         forwards = {}
         backwards = {}
@@ -1353,31 +1393,30 @@ class CompileCtx:
         # entities.
 
         def process_expr(expr):
-            if isinstance(expr, FieldAccess.Expr):
-                context_mgr = (
-                    expr.abstract_expr.diagnostic_context
-                    if expr.abstract_expr else
-                    Context(None)
-                )
-
-                with context_mgr:
-                    check_source_language(
-                        not expr.node_data.uses_entity_info
-                        or expr.node_data.optional_entity_info
-                        or expr.implicit_deref,
-                        'Call to {} must be done on an entity'.format(
-                            expr.node_data.qualname
-                        ),
-                        severity=Severity.non_blocking_error
-                    )
+            context_mgr = (
+                expr.abstract_expr.diagnostic_context
+                if expr.abstract_expr else
+                Context(None)
+            )
 
-            for subexpr in expr.flat_subexprs():
-                process_expr(subexpr)
+            with context_mgr:
+                check_source_language(
+                    not expr.node_data.uses_entity_info
+                    or expr.node_data.optional_entity_info
+                    or expr.implicit_deref,
+                    'Call to {} must be done on an entity'.format(
+                        expr.node_data.qualname
+                    ),
+                    severity=Severity.non_blocking_error
+                )
 
         for prop in all_props:
             with prop.diagnostic_context:
                 if prop.constructed_expr:
-                    process_expr(prop.constructed_expr)
+                    for expr in prop.constructed_expr.preorder(
+                        FieldAccess.Expr
+                    ):
+                        process_expr(expr)
 
     def compute_uses_envs_attr(self):
         """
@@ -1420,14 +1459,69 @@ class CompileCtx:
         WarningSet.undocumented_nodes.warn_if(
             not node._doc, 'This node lacks documentation')
 
-    def warn_unused_private_properties(self):
+    def properties_entry_points(self, properties):
         """
-        Check that all private properties are actually used: if one is not,
-        it is useless, so emit a warning for it.
+        Return the subset of properties that are used from outside the
+        properties callgraph: public and internal properties (assume that the
+        latter are used) among the given ``properties``, plus properties
+        called by Predicate parsers in the grammar and properties used as
+        entity/env resolvers in env specs.
+
+        :param collections.Iterable[PropertyDef] properties: Properties among
+            which to look for public/internal ones.
+        :rtype: set[PropertyDef]
         """
         from langkit.expressions import resolve_property
         from langkit.parsers import Predicate
 
+        result = {p for p in properties if p.is_public or p.is_internal}
+
+        # Add the set of properties called by Predicate parsers
+        def visit_parser(parser):
+            if isinstance(parser, Predicate):
+                result.add(resolve_property(parser.property_ref))
+            for child in parser.children:
+                visit_parser(child)
+
+        for rule in self.grammar.rules.values():
+            visit_parser(rule)
+
+        # Don't forget properties used as entity/env resolvers
+        for astnode in self.astnode_types:
+            if astnode.env_spec:
+                result.update(
+                    action.resolver for action in astnode.env_spec.actions
+                    if action.resolver
+                )
+
+        return result
+
+    @staticmethod
+    def reachable_properties(forward_map, entry_points):
+        """
+        Return the set of properties that are transitively called from the
+        given entry points.
+
+        :param dict[PropertyDef, set[PropertyDef]] forward_map: Forwards
+            callgraph, as computed by ``properties_callgraphs``.
+        :param collections.Iterable[PropertyDef] entry_points: Properties to
+            start the traversal from.
+        :rtype: set[PropertyDef]
+        """
+        result = set()
+        queue = set(entry_points)
+        while queue:
+            prop = queue.pop()
+            result.add(prop)
+            queue.update(p for p in forward_map.get(prop, ())
+                         if p not in result)
+        return result
+
+    def warn_unused_private_properties(self):
+        """
+        Check that all private properties are actually used: if one is not,
+        it is useless, so emit a warning for it.
+        """
         forwards_strict, _ = self.properties_callgraphs()
 
         # Compute the callgraph with flattened subclassing information:
@@ -1440,44 +1534,15 @@ class CompileCtx:
         # Compute the set of properties that are transitively called by a
         # public property or by Predicate parsers in the grammar. Assume that
         # internal properties are used.
-
-        # First compute the set of properties called by Predicate parsers
-        called_by_grammar = set()
-
-        def visit_parser(parser):
-            if isinstance(parser, Predicate):
-                called_by_grammar.add(resolve_property(parser.property_ref))
-            for child in parser.children:
-                visit_parser(child)
-
-        for rule in self.grammar.rules.values():
-            visit_parser(rule)
-
+        #
         # The first is for strict analysis while the second one simplifies
         # properties to their root.
-        reachable_by_public_strict = set()
-        reachable_by_public = set()
-
-        def compute_reachable(reachable_set, forward_map):
-            queue = {p for p in forward_map if p.is_public or p.is_internal}
-            queue.update(called_by_grammar)
-
-            # Don't forget to tag properties used as entity/env resolvers as
-            # reachable.
-            for astnode in self.astnode_types:
-                if astnode.env_spec:
-                    queue.update(
-                        action.resolver for action in astnode.env_spec.actions
-                        if action.resolver
-                    )
-
-            while queue:
-                prop = queue.pop()
-                reachable_set.add(prop)
-                queue.update(p for p in forward_map[prop]
-                             if p not in reachable_set)
-        compute_reachable(reachable_by_public_strict, forwards_strict)
-        compute_reachable(reachable_by_public, forwards)
+        reachable_by_public_strict = self.reachable_properties(
+            forwards_strict, self.properties_entry_points(forwards_strict)
+        )
+        reachable_by_public = self.reachable_properties(
+            forwards, self.properties_entry_points(forwards)
+        )
 
         # Get properties that were explicitly marked as "no-warning" by the
         # user.
@@ -1510,6 +1575,222 @@ class CompileCtx:
         warn(unreachable_private, 'This private property is unused')
         warn(unused_abstractions, 'This private abstraction is unused')
 
+    def inline_properties(self):
+        """
+        Replace calls to trivial properties with their bodies, so that the
+        generated code does not pay the overhead of property calls for them.
+        See ``PropertyDef.inlining_body`` for the properties that qualify.
+
+        As inlining removes property calls, this does nothing when properties
+        are profiled.
+        """
+        if self.profile_properties:
+            return
+
+        forwards, _ = self.properties_callgraphs()
+        inlinable = {}
+        processed = set()
+
+        def process(prop):
+            """
+            Inline calls in `prop`, then determine whether calls to `prop`
+            can be inlined. Process called properties first, so that
+            inlining is transitive.
+            """
+            if prop in processed:
+                return
+            processed.add(prop)
+
+            for callee in sorted(forwards.get(prop, ()),
+                                 key=lambda p: p.qualname):
+                process(callee)
+
+            with prop.diagnostic_context:
+                prop.inline_calls(self, inlinable)
+                body = prop.inlining_body(self.inline_max_size)
+            if body is not None:
+                inlinable[prop] = body
+
+        for prop in self.all_properties(include_inherited=False):
+            process(prop)
+
+    def eliminate_common_subexprs(self):
+        """
+        Determine which properties are pure (see ``PropertyDef.is_pure``),
+        then run common subexpression elimination on all properties.
+
+        As this removes property calls, this does nothing when properties are
+        profiled.
+        """
+        if self.profile_properties:
+            return
+
+        _, backwards = self.properties_callgraphs()
+        all_props = list(self.all_properties(include_inherited=False))
+
+        # Properties that may have side effects, or that depend on more than
+        # their arguments, are impure, and so are all the properties that call
+        # them.
+        impure = {
+            prop for prop in all_props
+            if (prop.external
+                or prop.dynamic_vars
+                or prop.activate_tracing
+                or prop.transitive_reason_for_no_memoization)
+        }
+        queue = list(impure)
+        while queue:
+            for caller in backwards.get(queue.pop(), ()):
+                if caller not in impure:
+                    impure.add(caller)
+                    queue.append(caller)
+
+        for prop in all_props:
+            prop.is_pure = not (
+                prop in impure
+                or any(p in impure for p in prop.all_overriding_properties)
+            )
+
+        for prop in all_props:
+            with prop.diagnostic_context:
+                prop.eliminate_common_subexprs(self)
+
+    def report_inlined_properties(self):
+        """
+        Print the list of properties whose calls were inlined, along with
+        their callers.
+        """
+        callers = defaultdict(list)
+        for caller, callee in self.inlined_calls:
+            callers[callee].append(caller)
+
+        print('Inlined properties:')
+        for callee, props in sorted(callers.items(),
+                                    key=lambda item: item[0].qualname):
+            print('  {} ({} call(s)) in: {}'.format(
+                callee.qualname, len(props),
+                ', '.join(sorted({p.qualname for p in props}))
+            ))
+
+    def report_memoization_caches(self):
+        """
+        Print statistics for the caches of memoized functions in Langkit, to
+        help tuning their size caps.
+        """
+        print('Memoization caches:')
+        for stats in utils.memoization_statistics():
+            print('  {}: {} hit(s), {} miss(es), {} eviction(s),'
+                  ' {} entries{}'.format(
+                      stats.name, stats.hits, stats.misses, stats.evictions,
+                      stats.size,
+                      '' if stats.max_size is None else
+                      ' (max {})'.format(stats.max_size)
+                  ))
+
+    def eliminate_dead_properties(self):
+        """
+        Remove unreachable private properties from their owning types, so that
+        no code is emitted for them. Then remove array and struct types that
+        only these properties used.
+
+        Reachability is computed on root properties: a whole property
+        hierarchy is kept as soon as one of its properties is reachable, so
+        that dispatching is left untouched.
+        """
+        from langkit.compiled_types import CompiledType, CompiledTypeRepo, T
+        from langkit.expressions import ResolvedExpression
+
+        forwards_strict, _ = self.properties_callgraphs()
+        forwards = defaultdict(set)
+        for prop, called in forwards_strict.items():
+            forwards[prop.root_property].update(c.root_property
+                                                for c in called)
+
+        # External properties are implemented in extensions, which may call
+        # arbitrary properties, and properties explicitly marked as "maybe
+        # unused" are likely called from extensions: consider both as used.
+        entry_points = self.properties_entry_points(forwards_strict)
+        entry_points.update(p for p in forwards_strict
+                            if p.external or not p.warn_on_unused)
+        live_roots = self.reachable_properties(
+            forwards, {p.root_property for p in entry_points}
+        )
+
+        self.dead_properties = sorted(
+            (p for p in forwards_strict
+             if p.root_property not in live_roots),
+            key=lambda p: p.qualname
+        )
+        for prop in self.dead_properties:
+            prop.struct.remove_field(prop)
+
+        # Logic binders are registered when Bind expressions are constructed,
+        # including the ones in dead properties. As no code is emitted for
+        # dead properties, drop the binders that use them as conversion or
+        # equality properties: only dead properties can use these binders.
+        def is_live(prop):
+            return prop is None or prop.root_property in live_roots
+
+        self.logic_binders = {
+            (conv_prop, eq_prop)
+            for conv_prop, eq_prop in self.logic_binders
+            if is_live(conv_prop) and is_live(eq_prop)
+        }
+
+        # Now look for the composite types that remaining code still uses.
+        # Types that are required by the runtime or by user declarations are
+        # always used.
+        used_types = set()
+
+        def use_type(t):
+            if t in used_types:
+                return
+            used_types.add(t)
+            if t.is_array_type:
+                use_type(t.element_type)
+            elif t.is_struct_type or t.is_ast_node:
+                for f in t.get_fields(include_inherited=False):
+                    use_type(f.type)
+
+        def use_expr(expr):
+            for subexpr in expr.preorder():
+                use_type(subexpr.type)
+                for t in subexpr.flat_subexprs(
+                    lambda e: isinstance(e, CompiledType)
+                ):
+                    use_type(t)
+
+        for t in self.builtin_array_types:
+            use_type(t)
+        for t in CompiledTypeRepo.struct_types:
+            if t.location is None or t.is_entity_type or t is T.env_md:
+                use_type(t)
+        for t in self.astnode_types:
+            use_type(t)
+
+        for prop in self.all_properties(include_inherited=False):
+            use_type(prop.type)
+            for arg in prop.arguments:
+                use_type(arg.type)
+            for dynvar in prop.dynamic_vars:
+                use_type(dynvar.type)
+            for var in prop.vars.local_vars.values():
+                use_type(var.type)
+            if isinstance(prop.constructed_expr, ResolvedExpression):
+                use_expr(prop.constructed_expr)
+
+        self.dead_composite_types = sorted(
+            [t for t in CompiledTypeRepo.array_types if t not in used_types]
+            + [t for t in CompiledTypeRepo.struct_types
+               if t not in used_types],
+            key=lambda t: t.dsl_name
+        )
+        for t in self.dead_composite_types:
+            if t.is_array_type:
+                CompiledTypeRepo.array_types.remove(t)
+            else:
+                CompiledTypeRepo.struct_types.remove(t)
+
     def warn_unreachable_base_properties(self):
         """
         Emit a warning for properties that can never be executed because they
@@ -1568,7 +1849,7 @@ class CompileCtx:
     """
 
     @property  # type: ignore
-    @memoized
+    @memoized(max_size=1)
     def template_extensions(self):
         """
         Return the set of template extensions evaluated for this context.
@@ -1600,7 +1881,7 @@ class CompileCtx:
         return base_env
 
     @property  # type: ignore
-    @memoized
+    @memoized(max_size=1)
     def renderer(self):
         """
         Return the default renderer for this context.
@@ -1658,6 +1939,12 @@ class CompileCtx:
         default_max_call_depth: int = 1000,
         plugin_passes: List[Union[str, AbstractPass]] = [],
         strict_sound_envs: bool = False,
+        parsers_jobs: int = 1,
+        render_properties_jobs: int = 1,
+        memoization_max_entries: Optional[int] = None,
+        memoization_eviction: str = 'lru',
+        profile_properties: bool = False,
+        inline_max_size: int = 3,
         **kwargs
     ) -> None:
         """
@@ -1696,6 +1983,34 @@ class CompileCtx:
         :param bool strict_sound_envs: Whether to enable the strict behavior
             for sound environments.
 
+        :param parsers_jobs: Number of worker processes to use in order to
+            render parsers code. 1 by default, i.e. no worker process.
+
+        :param render_properties_jobs: Number of worker processes to use in
+            order to render properties code. 1 by default, i.e. no worker
+            process. Note that this only affects the "render properties"
+            pass: constructing and typing property expressions is always
+            sequential.
+
+        :param memoization_max_entries: Default maximum number of results that
+            each analysis unit keeps in its memoization table for each
+            memoized property. None by default, i.e. no limit. Properties can
+            override it with their own ``memoization_max_entries`` argument.
+
+        :param memoization_eviction: Default policy to apply when a bounded
+            memoization table is full: "lru" (the default) to evict the least
+            recently used result, or "reject" to stop memoizing new results.
+
+        :param profile_properties: If True, instrument properties in the
+            generated library so that they record call counts, execution
+            times and memoization hits. The resulting profile can be dumped as
+            JSON or as folded stacks (for flame graphs) from the generated
+            APIs.
+
+        :param inline_max_size: Maximum number of field accesses in the body
+            of properties for the "inline trivial properties" pass to inline
+            calls to them.
+
         See ``langkit.emitter.Emitter``'s constructor for other supported
         keyword arguments.
         """
@@ -1708,6 +2023,28 @@ class CompileCtx:
         self.generate_unparser = generate_unparser
         self.default_max_call_depth = default_max_call_depth
         self.strict_sound_envs = strict_sound_envs
+        self.parsers_jobs = parsers_jobs
+        self.render_properties_jobs = render_properties_jobs
+
+        from langkit.expressions.base import MEMOIZATION_EVICTIONS
+        if (
+            memoization_max_entries is not None
+            and memoization_max_entries <= 0
+        ):
+            error('The maximum number of memoization entries must be'
+                  ' positive')
+        if memoization_eviction not in MEMOIZATION_EVICTIONS:
+            error('Invalid memoization eviction policy: {}'.format(
+                memoization_eviction
+            ))
+        self.memoization_max_entries = memoization_max_entries
+        self.memoization_eviction = memoization_eviction
+        self.profile_properties = profile_properties
+
+        if inline_max_size < 0:
+            error('The maximum size of inlined properties must be positive or'
+                  ' null')
+        self.inline_max_size = inline_max_size
 
         self.check_only = check_only
 
@@ -1745,7 +2082,8 @@ class CompileCtx:
         """
         Compile the DSL and emit sources for the generated library.
         """
-        with names.camel_with_underscores, global_context(self):
+        with names.camel_with_underscores, global_context(self), \
+                memoization_scope():
             try:
                 self.run_passes(self.all_passes)
                 if not self.check_only and self.emitter is not None:
@@ -1972,6 +2310,33 @@ class CompileCtx:
                          PropertyDef.warn_on_undocumented_public_property),
             ASTNodePass('warn on undocumented nodes',
                         CompileCtx.warn_on_undocumented),
+            GlobalPass('inline trivial properties',
+                       CompileCtx.inline_properties),
+            PropertyPass('simplify expressions',
+                         PropertyDef.simplify_expressions),
+            GlobalPass('eliminate common subexpressions',
+                       CompileCtx.eliminate_common_subexprs).optional(
+                """
+                In property bodies, evaluate only once the field accesses,
+                casts and calls to pure properties that are repeated, and
+                re-use their results.
+                """
+            ),
+            GlobalPass('eliminate dead properties',
+                       CompileCtx.eliminate_dead_properties).optional(
+                """
+                Do not emit code for private properties that are unreachable
+                from public properties, env specs and the grammar, nor for the
+                array and struct types that only these properties use.
+                """
+            ),
+            GlobalPass('report inlined properties',
+                       CompileCtx.report_inlined_properties).optional(
+                """
+                Print the list of properties whose calls the "inline trivial
+                properties" pass inlined, along with their callers.
+                """
+            ),
             GlobalPass('compute composite types',
                        CompileCtx.compute_composite_types),
             ASTNodePass('expose public structs and arrays types in APIs',
@@ -2007,11 +2372,10 @@ class CompileCtx:
         Return the list of passes to emit sources for the generated library.
         """
         from langkit.emitter import Emitter
-        from langkit.expressions import PropertyDef
-        from langkit.parsers import Parser
+        from langkit.parsers import Grammar, Parser
         from langkit.passes import (
-            EmitterPass, GlobalPass, GrammarRulePass, MajorStepPass,
-            PropertyPass, errors_checkpoint_pass
+            EmitterPass, GlobalPass, GrammarPass, GrammarRulePass,
+            MajorStepPass, errors_checkpoint_pass
         )
 
         from langkit.dsl_unparse import unparse_lang
@@ -2026,8 +2390,8 @@ class CompileCtx:
             GlobalPass('finalize symbol literals',
                        CompileCtx.finalize_symbol_literals),
 
-            GrammarRulePass('render parsers code', Parser.render_parser),
-            PropertyPass('render property', PropertyDef.render_property),
+            GrammarPass('render parsers code', Grammar.render_parsers),
+            GlobalPass('render properties', CompileCtx.render_properties),
             GlobalPass('annotate fields types',
                        CompileCtx.annotate_fields_types).optional(
                 """
@@ -2071,6 +2435,14 @@ class CompileCtx:
 
             GlobalPass('RA22-015: Unparse language to concrete syntax',
                        unparse_lang),
+
+            GlobalPass('report memoization caches',
+                       CompileCtx.report_memoization_caches).optional(
+                """
+                Print hit, miss and size statistics for the memoization
+                caches that Langkit uses during code generation.
+                """
+            ),
         ]
 
     def run_passes(self, passes):
@@ -2776,6 +3148,55 @@ class CompileCtx:
 
         return '\n'.join(result) or 'null;'
 
+    def render_properties(self):
+        """
+        Emit code for all properties.
+
+        If ``render_properties_jobs`` is greater than 1 and if the platform
+        supports it, properties are split among that many forked worker
+        processes. The code for each property only depends on the property
+        itself, so the result does not depend on the number of jobs.
+
+        Workers do not report errors themselves: the parent process renders
+        again the properties for which workers failed, so that diagnostics
+        and other exceptions are raised in the parent process, with the
+        property as the diagnostic context, just as when rendering
+        sequentially.
+        """
+        props = list(self.all_properties(include_inherited=False))
+        jobs = min(self.render_properties_jobs, len(props))
+
+        if (
+            jobs <= 1
+            or 'fork' not in multiprocessing.get_all_start_methods()
+        ):
+            for prop in props:
+                with prop.diagnostic_context:
+                    prop.render_property(self)
+            return
+
+        # Give each worker an interleaved slice of the properties, so that big
+        # and small ones are more likely to be evenly spread. Workers inherit
+        # the list of properties, so they just need indexes.
+        slices = [list(range(i, len(props), jobs)) for i in range(jobs)]
+        with multiprocessing.get_context('fork').Pool(jobs) as pool:
+            results = pool.map(_render_properties_worker, slices)
+
+        # Merge results in the parent process, in the order of properties so
+        # that the output of workers and the first error do not depend on the
+        # number of jobs.
+        by_index = {}
+        for indexes, slice_results in zip(slices, results):
+            by_index.update(zip(indexes, slice_results))
+        for i, prop in enumerate(props):
+            code, output = by_index.get(i, (None, ''))
+            if code is None:
+                with prop.diagnostic_context:
+                    prop.render_property(self)
+            else:
+                sys.stdout.write(output)
+                prop.rendered_code = code
+
     @property
     def has_memoization(self):
         """
@@ -2791,6 +3212,46 @@ class CompileCtx:
         )
         return has_keys
 
+    @property
+    def bounded_memoized_properties(self):
+        """
+        Return the list of memoized properties whose memoization tables are
+        bounded, sorted by qualified name.
+
+        :rtype: list[langkit.expressions.base.PropertyDef]
+        """
+        return sorted(
+            (p for p in self.memoized_properties
+             if p.memoization_max_entries is not None),
+            key=lambda p: p.qualname
+        )
+
+    @property
+    def has_property_profiling(self):
+        """
+        Return whether the generated library must include the properties
+        profiler.
+
+        :rtype: bool
+        """
+        return self.profile_properties and bool(self.profiled_properties)
+
+    @property  # type: ignore
+    @memoized(max_size=1)
+    def profiled_properties(self):
+        """
+        Return the list of properties that are instrumented when property
+        profiling is enabled, i.e. all properties that have a body in the
+        generated library, sorted by qualified name.
+
+        :rtype: list[langkit.expressions.base.PropertyDef]
+        """
+        return sorted(
+            (p for p in self.all_properties(include_inherited=False)
+             if not p.external and not p.abstract),
+            key=lambda p: p.qualname
+        )
+
     def check_memoized(self):
         """
         Check that various invariants for memoized properties are respected.
@@ -2870,6 +3331,8 @@ class CompileCtx:
                     if tr_reason is not None and not prop.call_memoizable:
                         annotations[prop] = Annotation(tr_reason, [prop])
 
+                    prop.check_memoization_policy()
+
                     if not prop.memoized:
                         continue
 
@@ -2936,3 +3399,34 @@ class CompileCtx:
     collapse_concrete_nodes = staticmethod(
         utils.collapse_concrete_nodes
     )
+
+
+def _render_properties_worker(indexes):
+    """
+    Worker for ``CompileCtx.render_properties``: render the properties at the
+    given indexes in ``CompileCtx.all_properties`` in a forked process.
+
+    For each property, return the corresponding code (see
+    ``PropertyDef.rendered_code``) and the output that rendering it produced.
+    If rendering a property fails, return None as its code and stop there:
+    the parent process will render it again (as well as the remaining
+    properties) to report the error.
+
+    :param list[int] indexes: Indexes of the properties to render.
+    :rtype: list[(tuple[str, str, str, str]|None, str)]
+    """
+    context = get_context()
+    props = list(context.all_properties(include_inherited=False))
+    result = []
+    for i in indexes:
+        prop = props[i]
+        output = io.StringIO()
+        try:
+            with redirect_stdout(output), redirect_stderr(output), \
+                    prop.diagnostic_context:
+                prop.render_property(context)
+        except Exception:
+            result.append((None, ''))
+            break
+        result.append((prop.rendered_code, output.getvalue()))
+    return result
@@ -85,6 +85,8 @@ def template_extensions(ctx):
         'unit_provider_get_unit_from_name_type':
             CAPIType(capi,
                      'unit_provider_get_unit_from_name_callback').name,
+        'unparse_callback_type':
+            CAPIType(capi, 'unparse_callback').name,
         'token_kind':            CAPIType(capi, 'token_kind').name,
         'token_type':            CAPIType(capi, 'token').name,
         'sloc_type':             CAPIType(capi, 'source_location').name,
@@ -93,6 +95,11 @@ def template_extensions(ctx):
         'text_type':             CAPIType(capi, 'text').name,
         'big_integer_type':      CAPIType(capi, 'big_integer').name,
         'diagnostic_type':       CAPIType(capi, 'diagnostic').name,
+        'memoization_stats_type':
+            CAPIType(capi, 'memoization_statistics').name,
+        'token_columns_type':    CAPIType(capi, 'token_columns').name,
+        'property_profile_format_type':
+            CAPIType(capi, 'property_profile_format').name,
         'exception_type':        CAPIType(capi, 'exception').name,
         'exception_kind_type':   CAPIType(capi, 'exception_kind').name
     }
@@ -1413,8 +1420,25 @@ class CompiledType:
 
         # Invalidate the field lookup cache for this node and all derivations,
         # as this new field can be looked up by derivations.
+        self._reset_fields_cache()
 
-        def reset_cache(t: CompiledType):
+    def remove_field(self, field):
+        """
+        Remove a field from this Struct/AST node.
+
+        :param AbstractNodeData field: Field to remove. It must have been
+            added to this type with ``add_field``.
+        """
+        assert self._fields[field.indexing_name] is field
+        del self._fields[field.indexing_name]
+        self._reset_fields_cache()
+
+    def _reset_fields_cache(self) -> None:
+        """
+        Invalidate the field lookup cache for this type and all its
+        derivations.
+        """
+        def reset_cache(t: CompiledType) -> None:
             t._abstract_node_data_dict_cache = {}
             for dt in t.derivations:
                 reset_cache(dt)
@@ -180,6 +180,27 @@ base_langkit_docs = {
         Diagnostic for an analysis unit: cannot open the source file, parsing
         error, ...
     """,
+    'langkit.memoization_statistics_type': """
+        Counters for the memoization of property results in an analysis
+        context: number of cache hits and misses, number of results discarded
+        to make room for new ones in bounded memoization tables (evictions),
+        number of results that full memoization tables refused to store
+        (rejections), number of entries currently stored and an estimation of
+        the memory they use, in bytes.
+    """,
+    'langkit.token_columns_type': """
+        Set of arrays to export the tokens and trivia of an analysis unit in
+        columnar form: element I of each array describes the Ith token or
+        trivia of the unit, in source order. For each one, these arrays store
+        its kind, the 0-based offsets in the unit's source buffer of its first
+        character and of the character past its last one, the line and column
+        numbers of its start and end, and whether it is a trivia (1) or not
+        (0).
+    """,
+    'langkit.property_profile_format_type': """
+        Output format for properties profiles: JSON or folded stacks (for flame
+        graph generators).
+    """,
     'langkit.exception_kind_type': """
         Enumerated type describing all possible exceptions that need to be
         handled in the C bindings.
@@ -286,6 +307,19 @@ base_langkit_docs = {
 
         ``Tab_Stop`` is a positive number to describe the effect of tabulation
         characters on the column number in source files.
+        % if lang == 'python':
+
+        ``node_cache_policy`` determines which node wrappers analysis units
+        keep alive. With ``"strong"``, they keep all wrappers alive until they
+        are reparsed. With ``"lru"``, they keep alive only the
+        ``node_cache_size`` most recently used ones. With ``"weak"``, they
+        keep none alive. In all cases, the same wrapper is returned for a
+        given node as long as this wrapper is alive.
+
+        If ``node_cache_statistics`` is true, node caches count wrapper
+        lookups: see ``AnalysisUnit.node_cache_statistics``. This has a small
+        cost on every node wrapping, so it is disabled by default.
+        % endif
     """,
 
     'langkit.context_incref': """
@@ -315,6 +349,58 @@ base_langkit_docs = {
         relations.  If ``Timeout`` is zero, disable the timeout. By default,
         the timeout is ``100 000`` steps.
     """,
+    'langkit.context_memoization_statistics': """
+        % if lang == 'c':
+        Fill ``Stats`` with
+        % else:
+        Return
+        % endif
+        memoization counters for this context. Hits, misses, evictions and
+        rejections are accumulated since the context was created, while the
+        number of entries
+        and their estimated size (which only accounts for memoization keys and
+        values, not for the data they reference) reflect the current state of
+        memoization tables.
+    """,
+    'langkit.context_property_profile': """
+        % if lang == 'c':
+        Set ``Result`` to
+        % else:
+        Return
+        % endif
+        the profile of the properties that ran in this context since it was
+        created, or since the last profile reset. The profile is formatted
+        according to ``Format``:
+
+        % if lang == 'python':
+        * ``"json"``: a JSON object whose ``properties`` entry is a list of
+        % else:
+        * JSON: a JSON object whose ``properties`` entry is a list of
+        % endif
+          records, one per property that was called. Each record gives the
+          name and the DSL source location of the property, its number of
+          calls, its number of memoization hits and the total time, in
+          seconds, spent in it including (inclusive time) and excluding
+          (exclusive time) the properties it called.
+
+        % if lang == 'python':
+        * ``"folded-stacks"``: one line per property call path, giving the
+        % else:
+        * Folded stacks: one line per property call path, giving the
+        % endif
+          semicolon-separated list of properties in the path and the
+          exclusive time spent in the last one, in microseconds. This is the
+          input format of flame graph generators.
+        % if lang == 'c':
+
+        The caller is responsible for deallocating ``Result`` with
+        ``${capi.get_name('destroy_text')}``.
+        % endif
+    """,
+    'langkit.context_reset_property_profile': """
+        Discard all the properties profile data collected so far in this
+        context.
+    """,
 
     'langkit.get_unit_from_file': """
         Create a new analysis unit for ``Filename`` or return the existing one
@@ -330,6 +416,22 @@ base_langkit_docs = {
         parsing failure, return an analysis unit anyway: errors are described
         as diagnostics of the returned analysis unit.
     """,
+    'langkit.get_units_from_files': """
+        Create or reparse the analysis unit for each file in ``Filenames``, in
+        the same way as for a single file, and return them in the same order.
+
+        Lexing and parsing, which are where most of the time is spent, are done
+        concurrently by up to ``Jobs`` native threads. Creating units and
+        updating the context afterwards are done sequentially.
+
+        % if lang == 'c':
+            ``Filenames`` and ``Units_P`` must both point to arrays of
+            ``Count`` elements: the analysis units are stored in ``Units_P``.
+        % elif lang == 'python':
+            The GIL is released while parsing. If ``Jobs`` is None, use as
+            many threads as there are CPUs.
+        % endif
+    """,
     'langkit.get_unit_from_buffer': """
         Create a new analysis unit for ``Filename`` or return the existing one
         if any. Whether the analysis unit already exists or not, (re)parse it
@@ -414,9 +516,22 @@ base_langkit_docs = {
         Return the number of trivias in this unit. This is 0 for units that
         were parsed with trivia analysis disabled.
     """,
+    'langkit.unit_token_columns': """
+        Store the kind, bounds and trivia flag of the first COUNT tokens and
+        trivia of this unit in the arrays that COLUMNS designates, which must
+        have at least COUNT elements each. Return the total number of tokens
+        and trivia in this unit.
+    """,
     'langkit.unit_text': """
         Return the source buffer associated to this unit.
     """,
+    'langkit.unit_source_buffer': """
+        Store in BUFFER a reference to the source buffer of this unit. The
+        buffer still belongs to the unit: it is valid only until the unit is
+        reparsed or destroyed, and it must not be deallocated by the caller.
+        Texts for this unit's tokens (and thus for its nodes) are slices of
+        this buffer.
+    """,
     'langkit.unit_lookup_token': """
         Look for a token in this unit that contains the given source location.
         If this falls before the first token, return the first token. If this
@@ -493,6 +608,26 @@ base_langkit_docs = {
 
         Note that this returns the sloc of the parent for synthetic nodes.
     """,
+    'langkit.node_unparse': """
+        Unparse ``Node`` and call ``Callback`` on consecutive chunks of the
+        resulting text, encoded with the charset of ``Node``'s unit, as
+        unparsing goes. This avoids holding the whole unparsed text in memory.
+
+        % if lang == 'c':
+        ``Data`` is passed to each call to ``Callback``.
+        % endif
+
+        Note that this requires that ``Node``'s unit has no parsing error.
+    """,
+    'langkit.node_unparse_to_file': """
+        Unparse ``Node`` and write the resulting text, encoded with the charset
+        of ``Node``'s unit, to the ``Filename`` file. If this file already
+        exists, it is overwritten.
+
+        Text is written as unparsing goes, so that it is never held entirely
+        in memory. Note that this requires that ``Node``'s unit has no parsing
+        error.
+    """,
     'langkit.lookup_in_node': """
         Return the bottom-most node from in ``Node`` and its children which
         contains ``Sloc``, or ``${null}`` if there is none.
@@ -504,6 +639,27 @@ base_langkit_docs = {
         Return the Nth child for in this node's fields and store it into
         *CHILD_P.  Return zero on failure (when N is too big).
     """,
+    'langkit.node_children_array': """
+        Store the first N children of this node in the array that CHILDREN_P
+        points to, where N is the minimum of COUNT and the number of children
+        in this node. Null children are stored as null nodes. Return N.
+
+        This fetches all the children of a node in a single call: allocate
+        an array with as many elements as the result of
+        ${capi.get_name('node_children_count')} and pass it here.
+    """,
+    'langkit.node_find': """
+        Look, in prefix order, for the nodes in the subtree for NODE (NODE
+        excluded) whose kind is one of the KINDS_COUNT kinds in the array that
+        KINDS points to. Store the first COUNT of them in the array that
+        RESULTS_P points to, stop the search there and return the number of
+        stored nodes: a result smaller than COUNT means that there is no other
+        matching node.
+
+        If START is null, search the whole subtree. Otherwise, START must be a
+        node in this subtree (for instance the last node that a previous call
+        returned), and the search resumes right after it.
+    """,
     'langkit.node_is_null': """
         Return whether this node is a null node reference.
     """,
@@ -637,6 +793,11 @@ base_langkit_docs = {
         Callback type for functions that are called to turn a unit reference
         encoded as a unit name into an analysis unit.
     """,
+    'langkit.unparse_callback_type': """
+        Callback type for functions that are called with chunks of unparsed
+        text. ``Bytes`` points to the ``Length`` bytes of the chunk and is
+        valid only during the call.
+    """,
 
     #
     # Misc
@@ -794,6 +955,14 @@ base_langkit_docs = {
     'langkit.rewriting.unit_unparse': """
         Return the text associated to the given unit.
     """,
+    'langkit.rewriting.unit_unparse_to_file': """
+        Write the text associated to the given unit to the Filename file,
+        encoded with the unit's charset. If this file already exists, it is
+        overwritten.
+
+        Text is written as unparsing goes, so that it is never held entirely
+        in memory.
+    """,
     'langkit.rewriting.node_handle': """
         Return the rewriting handle corresponding to Node.
 
@@ -899,9 +1068,31 @@ base_langkit_docs = {
     'langkit.python.AnalysisUnit.iter_tokens': """
         Iterator over the tokens in an analysis unit.
     """,
+    'langkit.python.AnalysisUnit.node_cache_statistics': """
+        Statistics for the cache of node wrappers in this unit since it was
+        last parsed.
+
+        :rtype: NodeCacheStatistics
+    """,
+    'langkit.python.AnalysisUnit.token_columns': """
+        Export all the tokens and trivia in this unit at once, in columnar
+        form.
+
+        :rtype: TokenColumns
+    """,
     'langkit.python.AnalysisUnit.diagnostics': """
         Diagnostics for this unit.
     """,
+    'langkit.python.AnalysisUnit.source_text': """
+        Source buffer for this unit.
+
+        The buffer is decoded only once per version of this unit: once it is
+        available, ``Token.text``, ``Token.text_range`` and the ``text``
+        property of nodes return slices of it instead of fetching text from
+        the native library.
+
+        :rtype: unicode
+    """,
     'langkit.python.Token.__eq__': """
         Return whether the two tokens refer to the same token in the same unit.
 
@@ -914,6 +1105,53 @@ base_langkit_docs = {
     'langkit.python.Token.to_data': """
         Return a dict representation of this Token.
     """,
+    'langkit.python.AnalysisUnitList': """
+        List of analysis units, as returned by
+        ``AnalysisContext.get_from_files``.
+    """,
+    'langkit.python.AnalysisUnitList.diagnostics': """
+        Diagnostics for all the units in this list, as ``(unit, diagnostic)``
+        pairs, in unit order.
+    """,
+    'langkit.python.NodeCacheStatistics': """
+        Counters for the cache of node wrappers in an analysis unit: number of
+        wrapper lookups that found an existing wrapper (hits) and that had to
+        create one (misses), number of wrappers that the ``"lru"`` policy
+        stopped keeping alive (evictions) and number of wrappers currently in
+        the cache (size). Hits and misses are None unless the analysis context
+        was created with ``node_cache_statistics=True``.
+    """,
+    'langkit.python.TokenColumns': """
+        Tokens and trivia of an analysis unit, exported in columnar form. Each
+        attribute is an ``array.array`` that has one element per token or
+        trivia, in source order:
+
+        * ``kinds``: token kinds, as integers (see ``kind_name``);
+        * ``start_offsets``/``end_offsets``: 0-based offsets in the source
+          buffer of the first character and of the character past the last
+          one;
+        * ``start_lines``/``start_columns``/``end_lines``/``end_columns``:
+          source location range;
+        * ``is_trivia``: 1 for trivia, 0 for regular tokens.
+
+        These arrays support the buffer protocol, so ``memoryview`` gives
+        access to them without copying.
+    """,
+    'langkit.python.TokenColumns.kind_name': """
+        Return the name of the token kind that ``kind``, an element of
+        ``kinds``, designates. This is the same as ``Token.kind`` for the
+        corresponding token.
+
+        :type kind: int
+        :rtype: str
+    """,
+    'langkit.python.TokenColumns.as_numpy': """
+        Return a dict that maps attribute names to NumPy arrays that share
+        memory with the corresponding ``array.array`` attributes. Raise an
+        ImportError if NumPy is not installed.
+
+        :rtype: dict[str, numpy.ndarray]
+    """,
     'langkit.python.UnitProvider.__init__': """
         This constructor is an implementation detail, and is not meant to be
         used directly.
@@ -994,6 +1232,39 @@ base_langkit_docs = {
     'langkit.python.root_node.to_json': """
         Return a JSON representation of this node.
     """,
+    'langkit.python.root_node.write_json': """
+        Write a JSON representation of this node to the ``file`` text file
+        object. The tree is processed iteratively and written in chunks, so
+        this works on arbitrarily deep trees without building the whole
+        representation in memory.
+
+        By default, the output is the same as for ``to_json``, except that
+        this does not go through ``to_data``, so overriding it has no effect
+        here. If ``kind``, ``sloc`` or ``text`` is true, add the kind name
+        (``"@kind"``), the source location range (``"@sloc"``) and the text of
+        token nodes (``"@text"``) to the object for each node. List nodes are
+        then represented as objects too, their children going to
+        ``"@items"``.
+    """,
+    'langkit.python.root_node.write_binary': """
+        Write a compact binary representation of this node to the ``file``
+        binary file object. All integers are little-endian. The output starts
+        with:
+
+        * the ``LKBT`` magic number;
+        * the format version (1) and flags (``1`` if ``sloc``, ``2`` if
+          ``text``), as 8-bit integers;
+        * the number of node kinds, as a 16-bit integer, then for each kind,
+          its code and the length of its name as 16-bit integers, followed by
+          the UTF-8 encoded name.
+
+        Then comes one record per node, in prefix order: its kind code (16-bit
+        integer, ``0`` for a null node, in which case the record stops there),
+        its number of children (32-bit integer), then if ``sloc``, its start
+        line, start column, end line and end column (32-bit integers), then if
+        ``text``, the length of its UTF-8 encoded text followed by that text
+        for token nodes, or ``0xffffffff`` for other nodes.
+    """,
     'langkit.python.root_node.is_a': """
         Shortcut for isinstance(self, types).
         :rtype: bool
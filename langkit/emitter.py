@@ -604,6 +604,12 @@ class Emitter:
             os.path.join(self.python_pkg_dir, '_py2to3.py'),
             'python_api/py2to3_py'
         )
+        render_python_template(
+            os.path.join(self.python_pkg_dir, 'aio.py'),
+            'python_api/aio_py',
+            pyapi=ctx.python_api_settings,
+            module_name=ctx.python_api_settings.module_name
+        )
 
         # Emit stub files for Mypy (type hints)
         render_python_template(
@@ -615,6 +621,12 @@ class Emitter:
             os.path.join(self.python_pkg_dir, '_py2to3.pyi'),
             'python_api/py2to3_pyi'
         )
+        render_python_template(
+            os.path.join(self.python_pkg_dir, 'aio.pyi'),
+            'python_api/aio_pyi',
+            pyapi=ctx.python_api_settings,
+            module_name=ctx.python_api_settings.module_name
+        )
 
         # Emit the setup.py script to easily install the Python binding
         setup_py_file = os.path.join(self.lib_root, 'python', 'setup.py')
@@ -4,6 +4,7 @@ from contextlib import contextmanager
 from functools import partial
 import inspect
 from itertools import count
+import operator
 from typing import Any, Dict, List, Optional as Opt, Set, Tuple
 
 from enum import Enum
@@ -22,11 +23,17 @@ from langkit.diagnostics import (
 )
 from langkit.expressions.utils import assign_var
 from langkit.utils import (
-    assert_type, dispatch_on_type, inherited_property, memoized, nested,
-    not_implemented_error, self_memoized
+    Colors, assert_type, dispatch_on_type, inherited_property, memoized,
+    nested, not_implemented_error, printcol, self_memoized
 )
 
 
+MEMOIZATION_EVICTIONS = ('lru', 'reject')
+"""
+Names for the policies to apply when bounded memoization tables are full.
+"""
+
+
 def unsugar(expr, ignore_errors=False):
     """
     Given a Python expession that can be unsugared to an AbstractExpression,
@@ -325,9 +332,16 @@ class Frozable:
         # noinspection PyAttributeOutsideInit
         self._frozen = value
 
-        for _, val in self.__dict__.items():
-            if isinstance(val, Frozable):
-                val.freeze()
+        # Components are always frozen. Use an explicit stack rather than
+        # recursion, so that deeply nested expressions can be frozen.
+        stack = [val for val in self.__dict__.values()
+                 if isinstance(val, Frozable)]
+        while stack:
+            obj = stack.pop()
+            if not obj.frozen:
+                obj._frozen = True
+                stack.extend(val for val in obj.__dict__.values()
+                             if isinstance(val, Frozable))
 
     def freeze(self):
         self.trigger_freeze()
@@ -1279,6 +1293,57 @@ class ResolvedExpression:
         """
         return []
 
+    _subexprs_leaves = None
+    """
+    Cache for the "subexprs_leaves" property.
+
+    :type: None|tuple[object]
+    """
+
+    @property
+    def subexprs_leaves(self):
+        """
+        Tuple of all the leaves in "subexprs", in order.
+
+        This is computed once: expressions are not supposed to change once
+        constructed. Passes that replace sub-expressions must call
+        "reset_subexprs_cache".
+
+        :rtype: tuple[object]
+        """
+        if self._subexprs_leaves is None:
+            leaves = []
+            stack = [self.subexprs]
+            while stack:
+                values = stack.pop()
+                if values is None:
+                    continue
+                elif isinstance(values, (list, tuple)):
+                    stack.extend(reversed(values))
+                elif isinstance(values, dict):
+                    stack.extend(reversed(list(values.values())))
+                else:
+                    leaves.append(values)
+            self._subexprs_leaves = tuple(leaves)
+        return self._subexprs_leaves
+
+    @property
+    def children(self):
+        """
+        Tuple of all the operands of this expression, in order.
+
+        :rtype: tuple[ResolvedExpression]
+        """
+        return tuple(e for e in self.subexprs_leaves
+                     if isinstance(e, ResolvedExpression))
+
+    def reset_subexprs_cache(self):
+        """
+        Reset the cache for "subexprs_leaves". This must be called after
+        replacing the sub-expressions of this expression.
+        """
+        self._subexprs_leaves = None
+
     def flat_subexprs(
         self, filter=lambda expr: isinstance(expr, ResolvedExpression)
     ):
@@ -1292,19 +1357,164 @@ class ResolvedExpression:
 
         :rtype: list[ResolvedExpression]
         """
-        def explore(values):
-            if values is None:
-                return []
-            elif isinstance(values, (list, tuple)):
-                return funcy.lmapcat(explore, values)
-            elif isinstance(values, dict):
-                return funcy.lmapcat(explore, values.values())
-            elif filter(values):
-                return [values]
+        return [e for e in self.subexprs_leaves if filter(e)]
+
+    def preorder(self, cls=None):
+        """
+        Iterate on all the expressions in this expression tree (including
+        this expression itself) in pre-order. This uses no recursion, so it
+        works on arbitrarily deep trees.
+
+        :param cls: If provided, only yield expressions that are instances of
+            this class. Sub-expressions of other expressions are still
+            visited.
+        :type cls: None|type
+        :rtype: collections.Iterator[ResolvedExpression]
+        """
+        stack = [self]
+        while stack:
+            expr = stack.pop()
+            if cls is None or isinstance(expr, cls):
+                yield expr
+            stack.extend(reversed(expr.children))
+
+    def postorder(self, cls=None):
+        """
+        Like "preorder", but iterate in post-order: sub-expressions are
+        yielded before the expressions that contain them.
+
+        :type cls: None|type
+        :rtype: collections.Iterator[ResolvedExpression]
+        """
+        # Each stack item is an expression and whether its sub-expressions
+        # have already been pushed to the stack.
+        stack = [(self, False)]
+        while stack:
+            expr, expanded = stack.pop()
+            if expanded:
+                if cls is None or isinstance(expr, cls):
+                    yield expr
             else:
-                return []
+                stack.append((expr, True))
+                stack.extend((e, False) for e in reversed(expr.children))
 
-        return explore(self.subexprs)
+    replaceable_subexprs = True
+    """
+    Whether "rewrite_tree" can replace the sub-expressions of this expression
+    with their rewritten forms. Expressions that rely on the identity of their
+    operands (for instance to re-use their result variable) must redefine this
+    to False.
+    """
+
+    def simplify(self):
+        """
+        Return an expression that is equivalent to this one but cheaper to
+        evaluate, or this expression itself if there is no such
+        simplification.
+
+        This assumes that sub-expressions are already simplified. Subclasses
+        can override this method: as this runs after properties construction,
+        overriding methods must return either a literal or one of the
+        sub-expressions of "self".
+
+        :rtype: ResolvedExpression
+        """
+        return self
+
+    evaluates_subexprs_in_order = False
+    """
+    Whether the code generated for this expression always evaluates all its
+    sub-expressions, exactly once and in order, before doing anything else.
+    Common subexpression elimination relies on this to determine which
+    results are available when evaluating a sub-expression.
+    """
+
+    def cse_key(self, subkey):
+        """
+        Return a hashable value that identifies the result of this expression,
+        so that two expressions with the same key always compute the same
+        value, without side effects, when evaluated in the same context.
+        Return None if there is no such value (the default).
+
+        Subclasses can override this method to enable common subexpression
+        elimination on them.
+
+        :param subkey: Function that returns the key for a sub-expression.
+        :type subkey: (ResolvedExpression) -> object
+        :rtype: object
+        """
+        return None
+
+    def rewrite_tree(self, rewrite, on_rewrite=None):
+        """
+        Rewrite sub-expressions in this expression tree (bottom-up), then
+        rewrite this expression itself. Return the resulting expression.
+
+        :param rewrite: Function to call on each expression once its
+            sub-expressions are rewritten. It must return either the expression
+            itself, or an equivalent expression to replace it.
+        :type rewrite: (ResolvedExpression) -> ResolvedExpression
+        :param on_rewrite: If provided, callback to invoke with the original
+            expression and its rewritten form for each sub-expression that is
+            replaced. Note that the rewrite of "self" itself is up to the
+            caller.
+        :type on_rewrite: None|(ResolvedExpression, ResolvedExpression) -> None
+        :rtype: ResolvedExpression
+        """
+        # Mapping from the id of each rewritten expression to the expression
+        # itself and its rewritten form. Keeping the expression alive
+        # guarantees that ids are not re-used during the traversal.
+        rewritten = {}
+
+        for expr in self.postorder():
+            replacements = {}
+            for subexpr in expr.children:
+                _, new_subexpr = rewritten[id(subexpr)]
+                if new_subexpr is not subexpr:
+                    replacements[id(subexpr)] = (subexpr, new_subexpr)
+
+            # Sub-expressions are stored in arbitrary attributes, so look for
+            # references to the rewritten ones in direct attributes and in
+            # lists/tuples.
+            if replacements and expr.replaceable_subexprs:
+                # Reset the cache first, so that the loop below does not see it
+                expr.reset_subexprs_cache()
+                replaced = []
+
+                def replace(value):
+                    try:
+                        old, new = replacements[id(value)]
+                    except KeyError:
+                        return value
+                    replaced.append((old, new))
+                    return new
+
+                for attr, value in list(vars(expr).items()):
+                    if isinstance(value, ResolvedExpression):
+                        setattr(expr, attr, replace(value))
+                    elif isinstance(value, list):
+                        value[:] = [replace(v) for v in value]
+                    elif isinstance(value, tuple):
+                        setattr(expr, attr, tuple(replace(v) for v in value))
+
+                if on_rewrite:
+                    for old, new in replaced:
+                        on_rewrite(old, new)
+
+            rewritten[id(expr)] = (expr, rewrite(expr))
+
+        return rewritten[id(self)][1]
+
+    def simplify_tree(self, on_rewrite=None):
+        """
+        Simplify sub-expressions in this expression tree (bottom-up), then
+        simplify this expression itself. Return the resulting expression.
+
+        :param on_rewrite: See "rewrite_tree".
+        :type on_rewrite: None|(ResolvedExpression, ResolvedExpression) -> None
+        :rtype: ResolvedExpression
+        """
+        return self.rewrite_tree(lambda expr: expr.simplify(), on_rewrite)
 
     @property
     def bindings(self):
@@ -1315,10 +1525,9 @@ class ResolvedExpression:
 
         :rtype: list[VariableExpr]
         """
-        # Do a copy to avoid mutating the expression own's data structures
-        result = list(self._bindings())
-        for expr in self.flat_subexprs():
-            result.extend(expr.bindings)
+        result = []
+        for expr in self.preorder():
+            result.extend(expr._bindings())
         return result
 
     def _bindings(self):
@@ -1445,6 +1654,9 @@ class VariableExpr(ResolvedExpression):
             self.name.lower,
             ' ({})'.format(src_name.lower) if src_name else '')
 
+    def cse_key(self, subkey):
+        return ('var', self.name.lower)
+
     @property
     def is_self(self):
         """
@@ -1554,6 +1766,10 @@ class LiteralExpr(ResolvedExpression):
     def _render_expr(self):
         return self.template.format(*[o.render_expr() for o in self.operands])
 
+    def cse_key(self, subkey):
+        return (None if self.operands else
+                ('literal', self.type, self.template))
+
     def render_python_constant(self):
         """
         Assuming this expression is a valid constant, return Python code to
@@ -1771,6 +1987,19 @@ class EnumLiteralExpr(BindableLiteralExpr):
         )
 
 
+def is_constant_literal(expr):
+    """
+    Return whether `expr` is a boolean, integer, character or enumeration
+    literal, i.e. a literal whose value is known at compile time and available
+    as its "value" attribute.
+
+    :param ResolvedExpression expr: Expression to test.
+    :rtype: bool
+    """
+    return isinstance(expr, (BooleanLiteralExpr, IntegerLiteralExpr,
+                             CharacterLiteralExpr, EnumLiteralExpr))
+
+
 class NullExpr(BindableLiteralExpr):
     """
     Resolved expression for the null expression corresponding to some type.
@@ -1835,6 +2064,12 @@ class UncheckedCastExpr(ResolvedExpression):
             return self.expr.render_expr()
         return '{} ({})'.format(self.dest_type.name, self.expr.render_expr())
 
+    evaluates_subexprs_in_order = True
+
+    def cse_key(self, subkey):
+        key = subkey(self.expr)
+        return None if key is None else ('unchecked-cast', self.type, key)
+
     @property
     def subexprs(self):
         return {'0-type': self.dest_type, '1-expr': self.expr}
@@ -1872,6 +2107,10 @@ class SavedExpr(ResolvedExpression):
     otherwise we re-use it.
     """
 
+    # If it exists, the result variable of the input expression is re-used,
+    # so the input expression must not be replaced.
+    replaceable_subexprs = False
+
     def __init__(self, result_var_name, expr, abstract_expr=None):
         self.expr = expr
         self.static_type = expr.type
@@ -1916,6 +2155,11 @@ class SavedExpr(ResolvedExpression):
     def _render_expr(self):
         return self.exposed_result_var.name.camel_with_underscores
 
+    evaluates_subexprs_in_order = True
+
+    def cse_key(self, subkey):
+        return subkey(self.expr)
+
     @property
     def subexprs(self):
         return {'expr': self.expr}
@@ -1933,6 +2177,8 @@ class SequenceExpr(ResolvedExpression):
     be repeated multiple times later on (as we forbid tree sharing).
     """
 
+    evaluates_subexprs_in_order = True
+
     def __init__(self, pre_expr, post_expr, abstract_expr=None):
         """
         This expression will evaluate `pre_expr`, then `post_expr`, and will
@@ -2332,14 +2578,11 @@ class DynamicVariableBindExpr(ComputingExpr):
             return False
 
         def traverse_expr(expr):
-            if len(expr.flat_subexprs(is_expr_using_self)) > 0:
-                return True
-
-            for subexpr in expr.flat_subexprs():
-                if traverse_expr(subexpr):
-                    return True
-
-            return False
+            return any(
+                is_expr_using_self(leaf)
+                for e in expr.preorder()
+                for leaf in e.subexprs_leaves
+            )
 
         WarningSet.unused_bindings.warn_if(
             not (is_expr_using_self(self.to_eval_expr) or
@@ -2627,6 +2870,8 @@ class Let(AbstractExpression):
             # is no ref-counting issue is fine.
             super().__init__('Let_Result', abstract_expr=abstract_expr)
 
+        evaluates_subexprs_in_order = True
+
         def _render_pre(self):
             prop = PropertyDef.get()
             debug_info = prop.has_debug_info
@@ -2916,18 +3161,8 @@ class ArrayLiteral(AbstractExpression):
 
     @staticmethod
     def construct_static(elements, array_type, abstract_expr=None):
-        if len(elements) == 0:
-            return CallExpr('Array_Lit', array_type.constructor_name,
-                            array_type, ['Items_Count => 0'],
-                            abstract_expr=abstract_expr)
-        else:
-            return CallExpr(
-                'Array_Lit', array_type.constructor_name, array_type,
-                [aggregate_expr(
-                    array_type.array_type_name.camel_with_underscores,
-                    [(i, el) for i, el in enumerate(elements, 1)])],
-                abstract_expr=abstract_expr
-            )
+        return ArrayLiteralExpr(elements, array_type,
+                                abstract_expr=abstract_expr)
 
     def construct(self):
         self.element_type = resolve_type(self.element_type)
@@ -3093,7 +3328,10 @@ class PropertyDef(AbstractNodeData):
                  optional_entity_info=False, warn_on_unused=True,
                  ignore_warn_on_node=None, call_non_memoizable_because=None,
                  activate_tracing=False, dump_ir=False,
-                 lazy_field: Opt[bool] = None):
+                 lazy_field: Opt[bool] = None,
+                 memoization_max_entries: Opt[int] = None,
+                 memoization_eviction: Opt[str] = None,
+                 inline: bool = True):
         """
         :param expr: The expression for the property. It can be either:
             * An expression.
@@ -3206,6 +3444,20 @@ class PropertyDef(AbstractNodeData):
         :param lazy_field: Whether the goal of this property is to initialize a
             lazy field. If None, inherit this status from the root property, or
             default to False if this is the root property.
+
+        :param memoization_max_entries: If this property is memoized, maximum
+            number of results to keep in the memoization table of each analysis
+            unit. If None, use the default limit for the context (see
+            ``CompileCtx.create_all_passes``).
+
+        :param memoization_eviction: If this property is memoized and its
+            memoization tables are bounded, policy to use when they are full:
+            "lru" to evict the least recently used result, or "reject" to stop
+            memoizing new results. If None, use the default policy for the
+            context.
+
+        :param inline: Whether calls to this property can be replaced with its
+            body when it is trivial. See ``CompileCtx.inline_properties``.
         """
 
         self.prefix = prefix
@@ -3343,6 +3595,9 @@ class PropertyDef(AbstractNodeData):
         self.memoized = memoized
         self.call_memoizable = call_memoizable
         self.memoize_in_populate = memoize_in_populate
+        self._memoization_max_entries = memoization_max_entries
+        self._memoization_eviction = memoization_eviction
+        self.inline = inline
 
         self.external = external
 
@@ -3366,6 +3621,16 @@ class PropertyDef(AbstractNodeData):
 
         self._call_non_memoizable_because = call_non_memoizable_because
 
+        self.is_pure = False
+        """
+        Whether calls to this property (including dispatching ones) return the
+        same value each time they are evaluated with the same arguments, with
+        no side effect that matters. This is computed by
+        ``CompileCtx.eliminate_common_subexprs``.
+
+        :type: bool
+        """
+
         self.dynvar_binding_stack: List[DynamicVariable] = []
         """
         Stack of dynamic variable bindings. This is used to determine the set
@@ -4179,6 +4444,294 @@ class PropertyDef(AbstractNodeData):
                 '{} returns a node type'.format(self.qualname),
             )
 
+    def simplify_expressions(self, context):
+        """
+        Simplify the tree of resolved expressions for this property: fold
+        compile-time known sub-expressions into literals and remove dead
+        branches.
+
+        In debug mode, log each rewrite to the standard output.
+
+        :type context: langkit.compile_context.CompileCtx
+        """
+        if not self.constructed_expr:
+            return
+
+        def log_rewrite(old, new):
+            if context.verbosity.debug:
+                printcol('Simplifying {} in {}:'.format(old, self.qualname),
+                         Colors.YELLOW)
+                print(old.ir_dump)
+                printcol('into {}:'.format(new), Colors.YELLOW)
+                print(new.ir_dump)
+
+        expr = self.constructed_expr.simplify_tree(log_rewrite)
+        if expr is not self.constructed_expr:
+            log_rewrite(self.constructed_expr, expr)
+            self.constructed_expr = expr
+
+    def inlining_body(self, max_size):
+        """
+        If calls to this property can be inlined, return a description of its
+        body: a tuple for 1) the list of field accesses that it performs,
+        starting from Self, and 2) the literal it returns, if any. Return None
+        otherwise.
+
+        Only trivial properties can be inlined: their body must be either a
+        literal, or a chain of at most `max_size` field accesses/argument-less
+        property calls on Self. They must also not be dispatching, memoized,
+        external, traced, nor use arguments, dynamic variables or entity info.
+
+        :param int max_size: Maximum number of field accesses in the body.
+        :rtype: None|(list[FieldAccess.Expr|FieldAccessExpr],
+                      None|LiteralExpr)
+        """
+        from langkit.expressions.structs import FieldAccess
+
+        if (
+            not self.inline
+            or self.constructed_expr is None
+            or not self.struct.is_ast_node
+            or self.dispatching
+            or self.memoized
+            or self.external
+            or self.lazy_field
+            or self.activate_tracing
+            or self.natural_arguments
+            or self.dynamic_vars
+            or self.uses_entity_info
+        ):
+            return None
+
+        # Properties created from functions have their body wrapped in a Let
+        # expression, even when it has no binding.
+        expr = self.constructed_expr
+        while isinstance(expr, Let.Expr) and not expr.vars:
+            expr = expr.expr
+
+        if is_constant_literal(expr) or isinstance(expr, NullExpr):
+            return ([], expr)
+
+        steps = []
+        while True:
+            if isinstance(expr, FieldAccessExpr):
+                steps.append(expr)
+                expr = expr.prefix_expr
+            elif isinstance(expr, FieldAccess.Expr):
+                if (
+                    expr.implicit_deref
+                    or expr.arguments
+                    or (expr.node_data.is_property
+                        and expr.node_data.dynamic_vars)
+                ):
+                    return None
+                steps.append(expr)
+                expr = expr.receiver_expr
+                if isinstance(expr, NullCheckExpr):
+                    expr = expr.expr
+            else:
+                break
+
+        if (
+            not isinstance(expr, VariableExpr)
+            or expr.abstract_var is not Self
+            or len(steps) > max_size
+        ):
+            return None
+        return (list(reversed(steps)), None)
+
+    def inline_calls(self, context, inlinable):
+        """
+        Replace calls to the given properties in the tree of resolved
+        expressions for this property with equivalent expressions built from
+        their bodies (see ``inlining_body``). Record each inlined call in
+        ``context.inlined_calls``.
+
+        In debug mode, log each rewrite to the standard output.
+
+        :type context: langkit.compile_context.CompileCtx
+        :param inlinable: Mapping from inlinable properties to the
+            description of their bodies.
+        :type inlinable:
+            dict[PropertyDef, (list[FieldAccess.Expr|FieldAccessExpr],
+                               None|LiteralExpr)]
+        """
+        from langkit.expressions.structs import FieldAccess
+
+        if not self.constructed_expr:
+            return
+
+        def inline(expr):
+            if (
+                not isinstance(expr, FieldAccess.Expr)
+                or expr.simple_field_access
+                or expr.node_data not in inlinable
+            ):
+                return expr
+
+            steps, literal = inlinable[expr.node_data]
+
+            # Evaluate the receiver as the call did, then replay the body of
+            # the callee on it. Make sure variables for the new expressions
+            # live in the same scope as the result of the call.
+            receiver = expr.receiver_expr
+            if isinstance(receiver, NullCheckExpr):
+                receiver = receiver.expr
+
+            with expr.result_var._scope.use():
+                if expr.implicit_deref:
+                    receiver = FieldAccessExpr(
+                        receiver, 'Node', receiver.type.astnode,
+                        do_explicit_incref=False
+                    )
+
+                if literal is not None:
+                    result = SequenceExpr(
+                        NullCheckExpr(receiver),
+                        (NullExpr(literal.type)
+                         if isinstance(literal, NullExpr) else
+                         type(literal)(literal.value)),
+                        abstract_expr=expr.abstract_expr
+                    )
+                elif not steps:
+                    result = NullCheckExpr(receiver)
+                else:
+                    # The first field access is performed on the receiver
+                    # of the call: it needs the same null check as the call.
+                    result = receiver
+                    for i, step in enumerate(steps):
+                        if isinstance(step, FieldAccessExpr):
+                            result = FieldAccessExpr(
+                                result, step.field_name, step.type,
+                                step.requires_incref,
+                                abstract_expr=expr.abstract_expr
+                            )
+                        else:
+                            result = FieldAccess.Expr(
+                                result, step.original_node_data,
+                                None if step.arguments is None else [],
+                                unsafe=step.unsafe if i else expr.unsafe,
+                                abstract_expr=expr.abstract_expr
+                            )
+
+            return result if result.type == expr.type else expr
+
+        def log_rewrite(old, new):
+            context.inlined_calls.append((self, old.node_data))
+            if context.verbosity.debug:
+                printcol('Inlining {} in {}:'.format(old.node_data.qualname,
+                                                     self.qualname),
+                         Colors.YELLOW)
+                print(old.ir_dump)
+                printcol('into {}:'.format(new), Colors.YELLOW)
+                print(new.ir_dump)
+
+        with self.bind():
+            expr = self.constructed_expr.rewrite_tree(inline, log_rewrite)
+        if expr is not self.constructed_expr:
+            log_rewrite(self.constructed_expr, expr)
+            self.constructed_expr = expr
+
+    def eliminate_common_subexprs(self, context):
+        """
+        Evaluate only once the sub-expressions that this property computes
+        several times: the result of the first evaluation is re-used instead
+        of evaluating the next occurrences.
+
+        This is conservative: it only considers expressions that have a
+        ``cse_key`` and that do not involve ref-counted or logic types, and
+        it re-uses results only when the first occurrence is always evaluated
+        before the next ones. This means for instance that results are never
+        re-used across the branches of a conditional expression, or from the
+        inside of a DynamicVariableBindExpr, a Try expression or a logic
+        construct.
+
+        In debug mode, log each rewrite to the standard output.
+
+        :type context: langkit.compile_context.CompileCtx
+        """
+        if not self.constructed_expr:
+            return
+
+        def excluded_type(t):
+            return t.is_refcounted or t.is_logic_var_type or t.is_equation_type
+
+        # Compute keys bottom-up. Expressions that involve an excluded type
+        # get no key, and neither do the expressions that contain them.
+        keys = {}
+
+        def subkey(expr):
+            return keys[id(expr)]
+
+        for expr in self.constructed_expr.postorder():
+            keys[id(expr)] = (
+                None
+                if (excluded_type(expr.type)
+                    or any(subkey(e) is None for e in expr.children))
+                else expr.cse_key(subkey)
+            )
+
+        def is_visible(var, scope):
+            while scope is not None:
+                if scope is var._scope:
+                    return True
+                scope = scope.parent
+            return False
+
+        # Traverse the tree in evaluation order. Each expression is associated
+        # to the path of conditionally evaluated operands that leads to it, so
+        # that one expression is always evaluated before another one if it
+        # comes first and if its path is a prefix of the other's.
+        occurrences = {}
+        replacements = {}
+        stack = [(self.constructed_expr, None, ())]
+        while stack:
+            expr, parent, path = stack.pop()
+            key = keys[id(expr)]
+
+            if (
+                key is not None
+                and expr.result_var is not None
+                and not isinstance(expr, (VariableExpr, SavedExpr))
+                and (parent is None or parent.replaceable_subexprs)
+            ):
+                for first, first_path in occurrences.get(key, ()):
+                    if (path[:len(first_path)] == first_path
+                            and is_visible(first.result_var,
+                                           expr.result_var._scope)):
+                        replacements[id(expr)] = first.result_var.ref_expr
+                        break
+                else:
+                    occurrences.setdefault(key, []).append((expr, path))
+
+                # No need to look for repetitions in sub-expressions that
+                # are not evaluated anymore.
+                if id(expr) in replacements:
+                    continue
+
+            children = expr.children
+            for i, subexpr in reversed(list(enumerate(children))):
+                stack.append((
+                    subexpr, expr,
+                    path if expr.evaluates_subexprs_in_order else
+                    path + ((id(expr), i), )
+                ))
+
+        if not replacements:
+            return
+
+        def log_rewrite(old, new):
+            if context.verbosity.debug:
+                printcol('Re-using {} for {} in {}:'.format(
+                    new, old, self.qualname
+                ), Colors.YELLOW)
+                print(old.ir_dump)
+
+        expr = self.constructed_expr.rewrite_tree(
+            lambda expr: replacements.get(id(expr), expr), log_rewrite
+        )
+        assert expr is self.constructed_expr
+
     def render_property(self, context):
         """
         Render the given property to generated code.
@@ -4202,6 +4755,23 @@ class PropertyDef(AbstractNodeData):
                 else:
                     self.untyped_wrapper_decl = self.untyped_wrapper_def = ''
 
+    @property
+    def rendered_code(self):
+        """
+        Code that ``render_property`` generated for this property: its
+        declaration, its definition, and the declaration and definition of its
+        untyped wrapper.
+
+        :rtype: (str, str, str, str)
+        """
+        return (self.prop_decl, self.prop_def, self.untyped_wrapper_decl,
+                self.untyped_wrapper_def)
+
+    @rendered_code.setter
+    def rendered_code(self, code):
+        (self.prop_decl, self.prop_def, self.untyped_wrapper_decl,
+         self.untyped_wrapper_def) = code
+
     @property
     def doc(self):
         return self._doc
@@ -4279,6 +4849,66 @@ class PropertyDef(AbstractNodeData):
                 self.struct.name +
                 self.name).camel_with_underscores
 
+    @property
+    def profiling_enum(self) -> str:
+        """
+        Return the enumerator name to materialize references to this property
+        in the properties profiler.
+        """
+        return (names.Name('Prf') +
+                self.struct.name +
+                self.name).camel_with_underscores
+
+    @property
+    def profiling_location(self) -> str:
+        """
+        Return the DSL source location for this property, as displayed in
+        properties profiles, or an empty string if it is unknown.
+        """
+        return ('{}:{}'.format(self.location.file, self.location.line)
+                if self.location else '')
+
+    @property
+    def memoization_max_entries(self) -> Opt[int]:
+        """
+        Maximum number of results to keep in the memoization table of each
+        analysis unit for this property, or None if there is no limit.
+        """
+        if self._memoization_max_entries is not None:
+            return self._memoization_max_entries
+        return get_context().memoization_max_entries
+
+    @property
+    def memoization_eviction(self) -> str:
+        """
+        Policy to use when the memoization table of an analysis unit is full
+        for this property. See the ``memoization_eviction`` constructor
+        argument.
+        """
+        return (self._memoization_eviction
+                or get_context().memoization_eviction)
+
+    def check_memoization_policy(self) -> None:
+        """
+        Check that the memoization cache policy for this property is valid.
+        """
+        check_source_language(
+            self.memoized or (self._memoization_max_entries is None
+                              and self._memoization_eviction is None),
+            'Only memoized properties can have a memoization cache policy'
+        )
+        check_source_language(
+            self._memoization_max_entries is None
+            or self._memoization_max_entries > 0,
+            'The maximum number of memoization entries must be positive'
+        )
+        check_source_language(
+            self._memoization_eviction in (None, ) + MEMOIZATION_EVICTIONS,
+            'Invalid memoization eviction policy: {} (valid ones are: {})'
+            .format(repr(self._memoization_eviction),
+                    ', '.join(MEMOIZATION_EVICTIONS))
+        )
+
     @property
     def reason_for_no_memoization(self):
         """
@@ -4344,16 +4974,19 @@ class PropertyDef(AbstractNodeData):
         }
 
         def mark_vars(expr):
-            if isinstance(expr, BindingScope):
-                # BindingScope has bindings themselves as operands, but they
-                # must not be considered as uses for this analysis: skip them.
-                expr = expr.expr
+            stack = [expr]
+            while stack:
+                expr = stack.pop()
+                if isinstance(expr, BindingScope):
+                    # BindingScope has bindings themselves as operands, but
+                    # they must not be considered as uses for this analysis:
+                    # skip them.
+                    expr = expr.expr
 
-            if isinstance(expr, VariableExpr):
-                all_vars[expr] = True
+                if isinstance(expr, VariableExpr):
+                    all_vars[expr] = True
 
-            for sub in expr.flat_subexprs():
-                mark_vars(sub)
+                stack.extend(expr.children)
 
         mark_vars(self.constructed_expr)
         unused_vars = [var for var, is_used in all_vars.items()
@@ -4429,7 +5062,9 @@ def AbstractProperty(type, doc="", runtime_check=False, **kwargs):
 # noinspection PyPep8Naming
 def Property(expr, doc=None, public=None, type=None, dynamic_vars=None,
              memoized=False, warn_on_unused=True, uses_entity_info=None,
-             ignore_warn_on_node=None, call_non_memoizable_because=None):
+             ignore_warn_on_node=None, call_non_memoizable_because=None,
+             memoization_max_entries=None, memoization_eviction=None,
+             inline=True):
     """
     Public constructor for concrete properties. You can declare your properties
     on your AST node subclasses directly, like this::
@@ -4453,6 +5088,9 @@ def Property(expr, doc=None, public=None, type=None, dynamic_vars=None,
         uses_entity_info=uses_entity_info,
         call_non_memoizable_because=call_non_memoizable_because,
         lazy_field=False,
+        memoization_max_entries=memoization_max_entries,
+        memoization_eviction=memoization_eviction,
+        inline=inline,
     )
 
 
@@ -4468,7 +5106,9 @@ def langkit_property(public=None, return_type=None, kind=AbstractKind.concrete,
                      external=False, uses_entity_info=None, uses_envs=None,
                      warn_on_unused=True, ignore_warn_on_node=None,
                      call_non_memoizable_because=None,
-                     activate_tracing=False, dump_ir=False):
+                     activate_tracing=False, dump_ir=False,
+                     memoization_max_entries=None, memoization_eviction=None,
+                     inline=True):
     """
     Decorator to create properties from real Python methods. See Property for
     more details.
@@ -4499,6 +5139,9 @@ def langkit_property(public=None, return_type=None, kind=AbstractKind.concrete,
             activate_tracing=activate_tracing,
             dump_ir=dump_ir,
             lazy_field=False,
+            memoization_max_entries=memoization_max_entries,
+            memoization_eviction=memoization_eviction,
+            inline=inline,
         )
     return decorator
 
@@ -4683,6 +5326,8 @@ class BasicExpr(ComputingExpr):
         self.requires_incref = requires_incref
         super().__init__(result_var_name, abstract_expr=abstract_expr)
 
+    evaluates_subexprs_in_order = True
+
     def _render_pre(self):
         expr = self.template.format(*[
             (e if isinstance(e, str) else e.render_expr())
@@ -4768,6 +5413,11 @@ class FieldAccessExpr(BasicExpr):
         self.prefix_expr = prefix_expr
         self.field_name = field_name
 
+    def cse_key(self, subkey):
+        key = subkey(self.prefix_expr)
+        return (None if key is None else
+                ('field', self.field_name, self.type, key))
+
     @property
     def subexprs(self):
         return {'prefix': self.prefix_expr, 'field': self.field_name}
@@ -5055,6 +5705,36 @@ class CallExpr(BasicExpr):
         return '<CallExpr {}>'.format(self.name.camel_with_underscores)
 
 
+class ArrayLiteralExpr(CallExpr):
+    """
+    Resolved expression for array literals.
+    """
+
+    def __init__(self, elements, array_type, abstract_expr=None):
+        if len(elements) == 0:
+            args = ['Items_Count => 0']
+        else:
+            args = [aggregate_expr(
+                array_type.array_type_name.camel_with_underscores,
+                [(i, el) for i, el in enumerate(elements, 1)]
+            )]
+        super().__init__('Array_Lit', array_type.constructor_name,
+                         array_type, args, abstract_expr=abstract_expr)
+
+    @property
+    def elements(self):
+        """
+        Return the resolved expressions for the array elements.
+
+        :rtype: list[ResolvedExpression]
+        """
+        arg, = self.operands
+        return [] if isinstance(arg, str) else arg.operands
+
+    def __repr__(self):
+        return '<ArrayLiteralExpr>'
+
+
 class NullCheckExpr(ResolvedExpression):
     """
     Expression that raises a PropertyError when the input is a null pointer.
@@ -5088,6 +5768,13 @@ class NullCheckExpr(ResolvedExpression):
     def _render_expr(self):
         return self.expr.render_expr()
 
+    evaluates_subexprs_in_order = True
+
+    def cse_key(self, subkey):
+        key = subkey(self.expr)
+        return (None if key is None else
+                ('null-check', self.implicit_deref, key))
+
     @property
     def subexprs(self):
         return {'expr': self.expr}
@@ -5146,6 +5833,57 @@ class Arithmetic(AbstractExpression):
     expressions like +, -, /, *, ..
     """
 
+    class Expr(BasicExpr):
+        """
+        Resolved expression for arithmetic operators.
+        """
+
+        pretty_class_name = 'Arith'
+
+        FOLDERS = {'+': operator.add, '-': operator.sub, '*': operator.mul}
+        """
+        Python implementation for the operators that "simplify" can fold.
+        """
+
+        INT_LAST = 2 ** 31 - 1
+        """
+        Upper bound for the Ada type that implements Int in generated code.
+        """
+
+        def __init__(self, lhs, rhs, op, abstract_expr=None):
+            self.op = op
+            super().__init__('Arith_Result', '({} %s {})' % op, lhs.type,
+                             [lhs, rhs], requires_incref=False,
+                             abstract_expr=abstract_expr)
+
+        def simplify(self):
+            lhs, rhs = self.operands
+            folder = self.FOLDERS.get(self.op)
+            if (
+                folder is None
+                or not isinstance(lhs, IntegerLiteralExpr)
+                or not isinstance(rhs, IntegerLiteralExpr)
+            ):
+                return self
+
+            # Keep computations that overflow at runtime. Also keep the ones
+            # yielding negative numbers, as negative literals cannot appear as
+            # operands in the generated code.
+            value = folder(lhs.value, rhs.value)
+            if not 0 <= value <= self.INT_LAST:
+                return self
+
+            return IntegerLiteralExpr(value, abstract_expr=self.abstract_expr)
+
+        @property
+        def subexprs(self):
+            return {'0-lhs': self.operands[0],
+                    '1-op': self.op,
+                    '2-rhs': self.operands[1]}
+
+        def __repr__(self):
+            return '<Arithmetic.Expr {}>'.format(self.op)
+
     def __init__(self, l, r, op):
         """
         :param AbstractExpression l: Left operand.
@@ -5178,9 +5916,7 @@ class Arithmetic(AbstractExpression):
             "Invalid type for {}: {}".format(self.op, l.type.dsl_name)
         )
 
-        return BasicExpr('Arith_Result', '({} %s {})' % self.op, l.type,
-                         [l, r],
-                         requires_incref=False, abstract_expr=self)
+        return Arithmetic.Expr(l, r, self.op, abstract_expr=self)
 
     def __repr__(self):
         return '<Op {}>'.format(self.op)
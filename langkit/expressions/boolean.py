@@ -1,14 +1,16 @@
 from functools import reduce
 import funcy
 import inspect
+import operator
 
 from langkit import names
 from langkit.compiled_types import T
 from langkit.diagnostics import check_source_language
 from langkit.expressions.base import (
-    AbstractExpression, AbstractVariable, BasicExpr, BindingScope, CallExpr,
-    ComputingExpr, LiteralExpr, PropertyDef, attr_call, construct,
-    dsl_document, expr_or_null, render, sloc_info_arg, unsugar
+    AbstractExpression, AbstractVariable, BasicExpr, BindingScope,
+    BooleanLiteralExpr, CallExpr, ComputingExpr, IntegerLiteralExpr,
+    PropertyDef, attr_call, construct, dsl_document, expr_or_null,
+    is_constant_literal, render, sloc_info_arg, unsugar
 )
 
 
@@ -70,9 +72,9 @@ class BinaryBooleanOperator(AbstractExpression):
             # Boolean case
             if self.kind == self.AND:
                 then = rhs
-                else_then = LiteralExpr('False', T.Bool)
+                else_then = BooleanLiteralExpr(False)
             else:
-                then = LiteralExpr('True', T.Bool)
+                then = BooleanLiteralExpr(True)
                 else_then = rhs
             return If.Expr(lhs, then, else_then)
 
@@ -121,6 +123,28 @@ class Eq(AbstractExpression):
     Return whether `lhs` equals `rhs`.
     """
 
+    class Expr(BasicExpr):
+        """
+        Resolved expression for equality tests that use the native Ada
+        equality operator.
+        """
+
+        pretty_class_name = 'Eq'
+
+        def __init__(self, lhs, rhs, abstract_expr=None):
+            super().__init__('Is_Equal', '{} = {}', T.Bool, [lhs, rhs],
+                             abstract_expr=abstract_expr)
+
+        def simplify(self):
+            lhs, rhs = self.operands
+            if is_constant_literal(lhs) and is_constant_literal(rhs):
+                return BooleanLiteralExpr(lhs.value == rhs.value,
+                                          abstract_expr=self.abstract_expr)
+            return self
+
+        def __repr__(self):
+            return '<Eq.Expr>'
+
     @classmethod
     def make_expr(cls, lhs, rhs, abstract_expr=None):
         if lhs.type.is_entity_type:
@@ -129,8 +153,7 @@ class Eq(AbstractExpression):
             return CallExpr('Is_Equal', 'Equivalent', T.Bool, [lhs, rhs],
                             abstract_expr=abstract_expr)
         else:
-            return BasicExpr('Is_Equal', '{} = {}', T.Bool, [lhs, rhs],
-                             abstract_expr=abstract_expr)
+            return cls.Expr(lhs, rhs, abstract_expr=abstract_expr)
 
     @staticmethod
     def make_expr_for_entities(lhs, rhs, abstract_expr=None):
@@ -230,6 +253,13 @@ class OrderingTest(AbstractExpression):
         GE: '>=',
     }
 
+    OPERATOR_FOLDER = {
+        LT: operator.lt,
+        LE: operator.le,
+        GT: operator.gt,
+        GE: operator.ge,
+    }
+
     class Expr(BasicExpr):
         pretty_class_name = 'OrdTest'
 
@@ -251,6 +281,18 @@ class OrderingTest(AbstractExpression):
         def subexprs(self):
             return {'op': self.operator, 'lhs': self.lhs, 'rhs': self.rhs}
 
+        def simplify(self):
+            if (
+                isinstance(self.lhs, IntegerLiteralExpr)
+                and isinstance(self.rhs, IntegerLiteralExpr)
+            ):
+                folder = OrderingTest.OPERATOR_FOLDER[self.operator]
+                return BooleanLiteralExpr(
+                    folder(self.lhs.value, self.rhs.value),
+                    abstract_expr=self.abstract_expr
+                )
+            return self
+
         def __repr__(self):
             return '<OrderingTest.Expr {}>'.format(self.operator)
 
@@ -347,6 +389,25 @@ class If(AbstractExpression):
                     '1-then': self.then,
                     '2-else': self.else_then}
 
+        def simplify(self):
+            # Remove the dead branch when the condition is known
+            if isinstance(self.cond, BooleanLiteralExpr):
+                result = self.then if self.cond.value else self.else_then
+
+            # "If(Cond, True, False)" is just "Cond"
+            elif (
+                isinstance(self.then, BooleanLiteralExpr)
+                and isinstance(self.else_then, BooleanLiteralExpr)
+                and self.then.value
+                and not self.else_then.value
+            ):
+                result = self.cond
+
+            else:
+                return self
+
+            return result if result.type == self.type else self
+
         def __repr__(self):
             return '<If.Expr>'
 
@@ -395,10 +456,32 @@ class Not(AbstractExpression):
         return Not.make_expr(construct(self.expr, T.Bool),
                              abstract_expr=self)
 
+    class Expr(BasicExpr):
+        """
+        Resolved expression for the boolean negation.
+        """
+
+        pretty_class_name = 'Not'
+
+        def __init__(self, expr, abstract_expr=None):
+            super().__init__('Not_Val', 'not ({})', T.Bool, [expr],
+                             abstract_expr=abstract_expr)
+
+        def simplify(self):
+            expr, = self.operands
+            if isinstance(expr, BooleanLiteralExpr):
+                return BooleanLiteralExpr(not expr.value,
+                                          abstract_expr=self.abstract_expr)
+            elif isinstance(expr, Not.Expr):
+                return expr.operands[0]
+            return self
+
+        def __repr__(self):
+            return '<Not.Expr>'
+
     @staticmethod
     def make_expr(expr, abstract_expr=None):
-        return BasicExpr('Not_Val', 'not ({})', T.Bool, [expr],
-                         abstract_expr=abstract_expr)
+        return Not.Expr(expr, abstract_expr=abstract_expr)
 
     def __repr__(self):
         return '<Not>'
@@ -13,10 +13,10 @@ from langkit.diagnostics import (
     check_multiple, check_source_language, check_type
 )
 from langkit.expressions.base import (
-    AbstractExpression, AbstractVariable, CallExpr, ComputingExpr,
-    FieldAccessExpr, NullCheckExpr, PropertyDef, SequenceExpr, T,
-    UncheckedCastExpr, attr_call, attr_expr, auto_attr, auto_attr_custom,
-    construct, render, unsugar
+    AbstractExpression, AbstractVariable, ArrayLiteralExpr, CallExpr,
+    ComputingExpr, FieldAccessExpr, IntegerLiteralExpr, LiteralExpr,
+    NullCheckExpr, PropertyDef, SequenceExpr, T, UncheckedCastExpr, attr_call,
+    attr_expr, auto_attr, auto_attr_custom, construct, render, unsugar
 )
 from langkit.expressions.envs import make_as_entity
 
@@ -779,6 +779,32 @@ def collection_get(self, collection, index, or_null):
     return result
 
 
+class CollectionLengthExpr(CallExpr):
+    """
+    Resolved expression to compute the length of a collection.
+    """
+
+    def __init__(self, coll_expr, abstract_expr=None):
+        super().__init__('Len', 'Length', T.Int, [coll_expr],
+                         abstract_expr=abstract_expr)
+
+    def simplify(self):
+        # The length of an array literal is known at compile time. Fold it
+        # only when no element has side effects, i.e. when all elements are
+        # literals.
+        coll_expr, = self.operands
+        if isinstance(coll_expr, ArrayLiteralExpr) and all(
+            isinstance(e, LiteralExpr) and not e.operands
+            for e in coll_expr.elements
+        ):
+            return IntegerLiteralExpr(len(coll_expr.elements),
+                                      abstract_expr=self.abstract_expr)
+        return self
+
+    def __repr__(self):
+        return '<CollectionLengthExpr>'
+
+
 @auto_attr
 def length(self, collection):
     """
@@ -797,7 +823,7 @@ def length(self, collection):
         'Collection expected but got {} instead'.format(orig_type.dsl_name))
 
     coll_expr, _ = canonicalize_list(coll_expr)
-    return CallExpr('Len', 'Length', T.Int, [coll_expr], abstract_expr=self)
+    return CollectionLengthExpr(coll_expr, abstract_expr=self)
 
 
 @auto_attr
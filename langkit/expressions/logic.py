@@ -59,6 +59,10 @@ class Bind(AbstractExpression):
     """
 
     class Expr(CallExpr):
+        # Be conservative with logic constructs: do not reuse results across
+        # their operands.
+        evaluates_subexprs_in_order = False
+
         def __init__(self, conv_prop, eq_prop, cprop_uid, eprop_uid, lhs, rhs,
                      pred_func, abstract_expr=None):
             self.conv_prop = conv_prop
@@ -388,6 +392,10 @@ class Predicate(AbstractExpression):
     """
 
     class Expr(CallExpr):
+        # Be conservative with logic constructs: do not reuse results across
+        # their operands.
+        evaluates_subexprs_in_order = False
+
         def __init__(self, pred_property, pred_id, logic_var_exprs,
                      abstract_expr=None):
             self.pred_property = pred_property
@@ -56,6 +56,13 @@ class Cast(AbstractExpression):
         def _render_pre(self):
             return render('properties/cast_ada', expr=self)
 
+        evaluates_subexprs_in_order = True
+
+        def cse_key(self, subkey):
+            key = subkey(self.expr)
+            return (None if key is None else
+                    ('cast', self.type, self.do_raise, self.unsafe, key))
+
         @property
         def subexprs(self):
             return {'expr': self.expr, 'type': self.static_type.name}
@@ -793,6 +800,22 @@ class FieldAccess(AbstractExpression):
             return (self.result_var.name
                     if self.result_var else self.field_access_expr)
 
+        evaluates_subexprs_in_order = True
+
+        def cse_key(self, subkey):
+            if self.simple_field_access or (self.node_data.is_property
+                                            and not self.node_data.is_pure):
+                return None
+
+            keys = [subkey(self.receiver_expr)] + [
+                ('default', ) if arg is None else subkey(arg)
+                for arg in self.arguments or []
+            ]
+            if None in keys:
+                return None
+            return ('field-access', self.node_data, self.implicit_deref,
+                    self.unsafe, self.type, tuple(keys))
+
         @property
         def subexprs(self):
             result = {'0-prefix': self.receiver_expr,
@@ -479,6 +479,46 @@ class ManageScript:
                  ' useful in order to get portable generated sources, for'
                  ' releases for instance.'
         )
+        subparser.add_argument(
+            '--parsers-jobs', type=int, default=1,
+            help='Number of worker processes to use in order to render parsers'
+                 ' code (default: 1). Using more than one worker requires the'
+                 ' "fork" multiprocessing start method: on platforms that do'
+                 ' not support it, this option is ignored.'
+        )
+        subparser.add_argument(
+            '--render-properties-jobs', type=int, default=1,
+            help='Number of worker processes to use in order to render'
+                 ' properties code (default: 1). Constructing and typing'
+                 ' property expressions stays sequential. Like for'
+                 ' --parsers-jobs, this requires the "fork" multiprocessing'
+                 ' start method.'
+        )
+        subparser.add_argument(
+            '--memoization-max-entries', type=int, default=None,
+            help='Default maximum number of results that each analysis unit'
+                 ' keeps in its memoization table for each memoized property.'
+                 ' No limit by default.'
+        )
+        subparser.add_argument(
+            '--memoization-eviction', choices=('lru', 'reject'),
+            default='lru',
+            help='Policy to apply when a bounded memoization table is full:'
+                 ' evict the least recently used result (lru, the default) or'
+                 ' stop memoizing new results (reject).'
+        )
+        subparser.add_argument(
+            '--profile-properties', action='store_true',
+            help='Instrument properties in the generated library to collect'
+                 ' call counts, execution times and memoization hits. The'
+                 ' collected profile can be dumped from the Ada, C and Python'
+                 ' APIs.'
+        )
+        subparser.add_argument(
+            '--inline-max-size', type=int, default=3,
+            help='Maximum number of field accesses in the body of trivial'
+                 ' properties for calls to them to be inlined (default: 3).'
+        )
 
         # RA22-015: option to dump the results of the unparsing concrete syntax
         # to a file.
@@ -764,6 +804,12 @@ class ManageScript:
             unparse_script=args.unparse_script,
             explicit_passes_triggers=explicit_passes_triggers,
             strict_sound_envs=args.strict_sound_envs,
+            parsers_jobs=args.parsers_jobs,
+            render_properties_jobs=args.render_properties_jobs,
+            memoization_max_entries=args.memoization_max_entries,
+            memoization_eviction=args.memoization_eviction,
+            profile_properties=args.profile_properties,
+            inline_max_size=args.inline_max_size,
         )
 
     def gnatpp(self, project_file: str, glob_pattern: str) -> None:
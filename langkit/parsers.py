@@ -26,11 +26,12 @@ import difflib
 from funcy import keep
 import inspect
 from itertools import count
+import multiprocessing
 
 import funcy
 
 from langkit import names
-from langkit.common import gen_name
+from langkit.common import gen_name, local_names_scope
 from langkit.compile_context import CompileCtx, get_context
 from langkit.compiled_types import ASTNodeType, T, TokenType, resolve_type
 from langkit.diagnostics import (
@@ -395,6 +396,79 @@ class Grammar:
                     )
                 )
 
+    def render_parsers(self, context):
+        """
+        Emit code for all parsing rules.
+
+        If ``context.parsers_jobs`` is greater than 1 and if the platform
+        supports it, rules are split among that many forked worker processes.
+        As the code for each rule only depends on the rule itself (see
+        ``Parser.render_parser``), the result does not depend on the number of
+        jobs.
+
+        :type context: langkit.compile_context.CompileCtx
+        """
+        # Sort grammar rules by name, so that the pass order is deterministic
+        rule_names = sorted(self.rules)
+        jobs = min(context.parsers_jobs, len(rule_names))
+
+        if (
+            jobs <= 1
+            or 'fork' not in multiprocessing.get_all_start_methods()
+        ):
+            for name in rule_names:
+                rule = self.rules[name]
+                with rule.diagnostic_context:
+                    rule.render_parser()
+
+        else:
+            # Give each worker an interleaved slice of the rules, so that big
+            # and small rules are more likely to be evenly spread.
+            slices = [rule_names[i::jobs] for i in range(jobs)]
+            with multiprocessing.get_context('fork').Pool(jobs) as pool:
+                results = pool.map(_render_parsers_worker, slices)
+
+            # Merge results from workers. Rules can share the same parser
+            # (hence the same generated function), so take care of not
+            # emitting them twice.
+            rules_by_fn_name = {rule.gen_fn_name.lower: rule
+                                for rule in self.rules.values()}
+            for generated_parsers in results:
+                for p in generated_parsers:
+                    rule = rules_by_fn_name[p.name.lower]
+                    if rule not in context.fns:
+                        context.fns.add(rule)
+                        context.generated_parsers.append(p)
+
+        # Whatever the rendering order, emit parsers in a stable order
+        context.generated_parsers.sort(key=lambda p: p.name.lower)
+
+
+def _render_parsers_worker(rule_names):
+    """
+    Worker for ``Grammar.render_parsers``: render parsers for the given rules
+    in a forked process and return the list of corresponding
+    ``GeneratedParser`` instances.
+
+    :param list[str] rule_names: Names of the rules to render.
+    :rtype: list[GeneratedParser]
+    """
+    context = get_context()
+    grammar = context.grammar
+
+    # Consider parsers for rules that other workers handle as already
+    # rendered, so that Defer parsers do not render them here.
+    assigned = {grammar.rules[name] for name in rule_names}
+    for rule in grammar.rules.values():
+        if rule not in assigned:
+            context.fns.add(rule)
+
+    for name in rule_names:
+        rule = grammar.rules[name]
+        with rule.diagnostic_context:
+            rule.render_parser()
+    return context.generated_parsers
+
 
 class Parser:
     """
@@ -754,7 +828,11 @@ class Parser:
             return
         context.fns.add(self)
 
-        with add_var_context() as var_context:
+        # Names for local variables and labels only need to be unique in the
+        # generated function: number them from scratch so that the code for
+        # this parser does not depend on the order in which rules are
+        # rendered.
+        with add_var_context() as var_context, local_names_scope():
             pos_var = VarDef("pos", T.Token, create=False)
 
             # Compute no_backtrack information for this parser
@@ -742,13 +742,15 @@ def langkit_main(langkit_root, files=[]):
     """
     Run main() on Langkit sources.
     """
-    dirs = [os.path.join('contrib', 'python'),
+    dirs = [os.path.join('contrib', 'benchmarks'),
+            os.path.join('contrib', 'python'),
             os.path.join('contrib', 'lkt'),
             os.path.join('langkit'),
             os.path.join('scripts'),
             os.path.join('testsuite'),
             os.path.join('utils')]
     excludes = ['__pycache__',
+                os.path.join('contrib', 'benchmarks', 'build'),
                 os.path.join('contrib', 'python', 'build'),
                 os.path.join('contrib', 'lkt', 'build'),
                 os.path.join('langkit', 'support', 'obj'),
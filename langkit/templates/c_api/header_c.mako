@@ -116,6 +116,36 @@ typedef struct {
     ${text_type} message;
 } ${diagnostic_type};
 
+${c_doc('langkit.memoization_statistics_type')}
+typedef struct {
+    uint64_t hits;
+    uint64_t misses;
+    uint64_t evictions;
+    uint64_t rejections;
+    uint64_t entries;
+    uint64_t bytes;
+} ${memoization_stats_type};
+
+${c_doc('langkit.token_columns_type')}
+typedef struct {
+    int *kinds;
+    unsigned *start_offsets;
+    unsigned *end_offsets;
+    unsigned *start_lines;
+    unsigned short *start_columns;
+    unsigned *end_lines;
+    unsigned short *end_columns;
+    unsigned char *is_trivia;
+} ${token_columns_type};
+
+% if ctx.has_property_profiling:
+${c_doc('langkit.property_profile_format_type')}
+typedef enum {
+   ${capi.get_name('property_profile_json')},
+   ${capi.get_name('property_profile_folded_stacks')}
+} ${property_profile_format_type};
+% endif
+
 % for enum_type in ctx.enum_types:
    typedef enum {
       ${', '.join(v.c_name(capi) for v in enum_type.values)}
@@ -195,6 +225,15 @@ typedef ${analysis_unit_type} (*${unit_provider_get_unit_from_name_type})(
    int reparse
 );
 
+% if ctx.generate_unparser:
+${c_doc('langkit.unparse_callback_type')}
+typedef void (*${unparse_callback_type})(
+   void *data,
+   const char *bytes,
+   size_t length
+);
+
+% endif
 /* All the functions below can potentially raise an exception, so
    ${capi.get_name("get_last_exception")} must be checked after them even
    before trying to use the returned value.  */
@@ -243,6 +282,26 @@ ${capi.get_name("context_discard_errors_in_populate_lexical_env")}(
         ${analysis_context_type} context,
         int discard);
 
+${c_doc('langkit.context_memoization_statistics')}
+extern void
+${capi.get_name("context_memoization_statistics")}(
+        ${analysis_context_type} context,
+        ${memoization_stats_type} *stats);
+
+% if ctx.has_property_profiling:
+${c_doc('langkit.context_property_profile')}
+extern void
+${capi.get_name("context_property_profile")}(
+        ${analysis_context_type} context,
+        ${property_profile_format_type} format,
+        ${text_type} *result);
+
+${c_doc('langkit.context_reset_property_profile')}
+extern void
+${capi.get_name("context_reset_property_profile")}(
+        ${analysis_context_type} context);
+% endif
+
 ${c_doc('langkit.get_unit_from_file')}
 extern ${analysis_unit_type}
 ${capi.get_name("get_analysis_unit_from_file")}(
@@ -252,6 +311,18 @@ ${capi.get_name("get_analysis_unit_from_file")}(
         int reparse,
         ${grammar_rule_type} rule);
 
+${c_doc('langkit.get_units_from_files')}
+extern void
+${capi.get_name("get_analysis_units_from_files")}(
+        ${analysis_context_type} context,
+        const char **filenames,
+        int count,
+        const char *charset,
+        int reparse,
+        ${grammar_rule_type} rule,
+        int jobs,
+        ${analysis_unit_type} *units_p);
+
 ${c_doc('langkit.get_unit_from_buffer')}
 extern ${analysis_unit_type}
 ${capi.get_name("get_analysis_unit_from_buffer")}(
@@ -296,6 +367,17 @@ ${c_doc('langkit.unit_trivia_count')}
 extern int
 ${capi.get_name('unit_trivia_count')}(${analysis_unit_type} unit);
 
+${c_doc('langkit.unit_token_columns')}
+extern int
+${capi.get_name('unit_token_columns')}(${analysis_unit_type} unit,
+                                       ${token_columns_type} *columns,
+                                       int count);
+
+${c_doc('langkit.unit_source_buffer')}
+extern void
+${capi.get_name('unit_source_buffer')}(${analysis_unit_type} unit,
+                                       ${text_type} *buffer);
+
 ${c_doc('langkit.unit_dump_lexical_env')}
 extern void
 ${capi.get_name('unit_dump_lexical_env')}(${analysis_unit_type} unit);
@@ -380,6 +462,19 @@ extern void
 ${capi.get_name("node_sloc_range")}(${entity_type} *node,
                                     ${sloc_range_type} *sloc_range);
 
+% if ctx.generate_unparser:
+${c_doc('langkit.node_unparse')}
+extern void
+${capi.get_name("node_unparse")}(${entity_type} *node,
+                                 ${unparse_callback_type} callback,
+                                 void *data);
+
+${c_doc('langkit.node_unparse_to_file')}
+extern void
+${capi.get_name("node_unparse_to_file")}(${entity_type} *node,
+                                         const char *filename);
+
+% endif
 ${c_doc('langkit.lookup_in_node')}
 extern void
 ${capi.get_name("lookup_in_node")}(${entity_type} *node,
@@ -396,6 +491,21 @@ ${capi.get_name("node_child")}(${entity_type} *node,
                                unsigned n,
                                ${entity_type}* child_p);
 
+${c_doc('langkit.node_children_array')}
+extern unsigned
+${capi.get_name("node_children_array")}(${entity_type} *node,
+                                        ${entity_type} *children_p,
+                                        unsigned count);
+
+${c_doc('langkit.node_find')}
+extern unsigned
+${capi.get_name("node_find")}(${entity_type} *node,
+                              const ${node_kind_type} *kinds,
+                              unsigned kinds_count,
+                              ${entity_type} *start,
+                              ${entity_type} *results_p,
+                              unsigned count);
+
 ${c_doc('langkit.text_to_locale_string')}
 extern char *
 ${capi.get_name("text_to_locale_string")}(${text_type} *text);
@@ -8,6 +8,7 @@
 <% entity_type = root_entity.c_type(capi).name %>
 
 with Ada.Finalization;
+with Ada.Strings.Unbounded;
 pragma Warnings (Off, "is an internal GNAT unit");
 with Ada.Strings.Wide_Wide_Unbounded.Aux;
 use Ada.Strings.Wide_Wide_Unbounded.Aux;
@@ -23,6 +24,9 @@ with Langkit_Support.Text;        use Langkit_Support.Text;
 
 with ${ada_lib_name}.Private_Converters;
 use ${ada_lib_name}.Private_Converters;
+% if ctx.generate_unparser:
+with ${ada_lib_name}.Unparsing_Implementation;
+% endif
 
 ${exts.with_clauses(with_clauses)}
 
@@ -167,6 +171,58 @@ package body ${ada_lib_name}.Implementation.C is
          Set_Last_Exception (Exc);
    end;
 
+   procedure ${capi.get_name("context_memoization_statistics")}
+     (Context : ${analysis_context_type};
+      Stats   : access ${memoization_stats_type}) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         S : constant Memoization_Statistics :=
+            Get_Memoization_Statistics (Context);
+      begin
+         Stats.all := (Hits       => Unsigned_64 (S.Hits),
+                       Misses     => Unsigned_64 (S.Misses),
+                       Evictions  => Unsigned_64 (S.Evictions),
+                       Rejections => Unsigned_64 (S.Rejections),
+                       Entries    => Unsigned_64 (S.Entries),
+                       Bytes      => Unsigned_64 (S.Bytes));
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   % if ctx.has_property_profiling:
+   procedure ${capi.get_name("context_property_profile")}
+     (Context : ${analysis_context_type};
+      Format  : int;
+      Result  : access ${text_type}) is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         Profile : constant String := Property_Profile_Image
+           (Context, Property_Profile_Format'Val (Format));
+      begin
+         Result.all := Wrap_Alloc (To_Text (Profile));
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
+   procedure ${capi.get_name("context_reset_property_profile")}
+     (Context : ${analysis_context_type}) is
+   begin
+      Clear_Last_Exception;
+      Reset_Property_Profile (Context);
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+   % endif
+
    function ${capi.get_name("get_analysis_unit_from_file")}
      (Context           : ${analysis_context_type};
       Filename, Charset : chars_ptr;
@@ -187,6 +243,47 @@ package body ${ada_lib_name}.Implementation.C is
          return null;
    end;
 
+   procedure ${capi.get_name("get_analysis_units_from_files")}
+     (Context   : ${analysis_context_type};
+      Filenames : System.Address;
+      Count     : int;
+      Charset   : chars_ptr;
+      Reparse   : int;
+      Rule      : ${grammar_rule_type};
+      Jobs      : int;
+      Units_P   : System.Address) is
+   begin
+      Clear_Last_Exception;
+
+      if Count <= 0 then
+         return;
+      end if;
+
+      declare
+         C_Filenames : chars_ptr_array (1 .. size_t (Count))
+            with Import, Address => Filenames;
+         Units       : Internal_Unit_Array (1 .. Natural (Count))
+            with Import, Address => Units_P;
+         Names       : Unbounded_String_Array (1 .. Natural (Count));
+      begin
+         for I in Names'Range loop
+            Names (I) := Ada.Strings.Unbounded.To_Unbounded_String
+              (Value (C_Filenames (size_t (I))));
+         end loop;
+
+         Units := Get_From_Files
+           (Context,
+            Names,
+            Value_Or_Empty (Charset),
+            Reparse /= 0,
+            Rule,
+            Positive (int'Max (Jobs, 1)));
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
    function ${capi.get_name("get_analysis_unit_from_buffer")}
      (Context           : ${analysis_context_type};
       Filename, Charset : chars_ptr;
@@ -329,6 +426,91 @@ package body ${ada_lib_name}.Implementation.C is
          Set_Last_Exception (Exc);
    end;
 
+   function ${capi.get_name('unit_token_columns')}
+     (Unit    : ${analysis_unit_type};
+      Columns : access ${token_columns_type};
+      Count   : int) return int is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         N : constant Natural := Natural (int'Max (Count, 0));
+
+         Kinds : array (1 .. N) of int
+            with Import, Address => Columns.Kinds;
+         Start_Offsets : array (1 .. N) of unsigned
+            with Import, Address => Columns.Start_Offsets;
+         End_Offsets : array (1 .. N) of unsigned
+            with Import, Address => Columns.End_Offsets;
+         Start_Lines : array (1 .. N) of unsigned
+            with Import, Address => Columns.Start_Lines;
+         Start_Columns : array (1 .. N) of unsigned_short
+            with Import, Address => Columns.Start_Columns;
+         End_Lines : array (1 .. N) of unsigned
+            with Import, Address => Columns.End_Lines;
+         End_Columns : array (1 .. N) of unsigned_short
+            with Import, Address => Columns.End_Columns;
+         Trivia_Flags : array (1 .. N) of unsigned_char
+            with Import, Address => Columns.Is_Trivia;
+
+         T     : Token_Reference := First_Token (Unit);
+         Total : Natural := 0;
+      begin
+         while T /= No_Token loop
+            Total := Total + 1;
+            if Total <= N then
+               declare
+                  D  : constant Token_Data_Type := Data (T);
+                  SR : constant Source_Location_Range := Sloc_Range (D);
+
+                  Source_Buffer : Text_Cst_Access;
+                  First         : Positive;
+                  Last          : Natural;
+               begin
+                  Extract_Token_Text (D, Source_Buffer, First, Last);
+                  Kinds (Total) := int (Token_Kind'Enum_Rep (Kind (D)));
+                  Start_Offsets (Total) :=
+                    unsigned (First - Source_Buffer'First);
+                  End_Offsets (Total) :=
+                    unsigned (Last - Source_Buffer'First + 1);
+                  Start_Lines (Total) := unsigned (SR.Start_Line);
+                  Start_Columns (Total) := unsigned_short (SR.Start_Column);
+                  End_Lines (Total) := unsigned (SR.End_Line);
+                  End_Columns (Total) := unsigned_short (SR.End_Column);
+                  Trivia_Flags (Total) :=
+                    unsigned_char (Boolean'Pos (Is_Trivia (D)));
+               end;
+            end if;
+            T := Next (T);
+         end loop;
+         return int (Total);
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return -1;
+   end;
+
+   procedure ${capi.get_name('unit_source_buffer')}
+     (Unit   : ${analysis_unit_type};
+      Buffer : access ${text_type}) is
+   begin
+      Clear_Last_Exception;
+
+      if Unit.TDH.Source_Buffer = null then
+         Buffer.all := (Chars        => System.Null_Address,
+                        Length       => 0,
+                        Is_Allocated => 0);
+      else
+         Buffer.all := Wrap (Text_Cst_Access (Unit.TDH.Source_Buffer),
+                             Unit.TDH.Source_First,
+                             Unit.TDH.Source_Last);
+      end if;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+   end;
+
    procedure ${capi.get_name('unit_dump_lexical_env')}
      (Unit : ${analysis_unit_type}) is
    begin
@@ -558,6 +740,54 @@ package body ${ada_lib_name}.Implementation.C is
          Set_Last_Exception (Exc);
    end;
 
+   % if ctx.generate_unparser:
+      procedure ${capi.get_name('node_unparse')}
+        (Node     : ${entity_type}_Ptr;
+         Callback : ${unparse_callback_type};
+         Data     : System.Address)
+      is
+         procedure Write (Bytes : String);
+         --  Forward Bytes to Callback
+
+         -----------
+         -- Write --
+         -----------
+
+         procedure Write (Bytes : String) is
+         begin
+            Callback (Data, Bytes'Address, size_t (Bytes'Length));
+         end Write;
+
+      begin
+         Clear_Last_Exception;
+         Unparsing_Implementation.Unparse
+           (Unparsing_Implementation.Create_Abstract_Node (Node.Node),
+            Node.Node.Unit,
+            Preserve_Formatting => False,
+            As_Unit             => False,
+            Callback            => Write'Access);
+      exception
+         when Exc : others =>
+            Set_Last_Exception (Exc);
+      end;
+
+      procedure ${capi.get_name('node_unparse_to_file')}
+        (Node     : ${entity_type}_Ptr;
+         Filename : chars_ptr) is
+      begin
+         Clear_Last_Exception;
+         Unparsing_Implementation.Unparse_To_File
+           (Unparsing_Implementation.Create_Abstract_Node (Node.Node),
+            Node.Node.Unit,
+            Preserve_Formatting => False,
+            As_Unit             => False,
+            Filename            => Value (Filename));
+      exception
+         when Exc : others =>
+            Set_Last_Exception (Exc);
+      end;
+   % endif
+
    procedure ${capi.get_name('lookup_in_node')}
      (Node   : ${entity_type}_Ptr;
       Sloc   : ${sloc_type};
@@ -614,6 +844,148 @@ package body ${ada_lib_name}.Implementation.C is
          return 0;
    end;
 
+   function ${capi.get_name('node_children_array')}
+     (Node       : ${entity_type}_Ptr;
+      Children_P : ${entity_type}_Ptr;
+      Count      : unsigned) return unsigned is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         N : constant unsigned :=
+           unsigned'Min (Count, unsigned (Children_Count (Node.Node)));
+      begin
+         if N = 0 then
+            return 0;
+         end if;
+
+         declare
+            type Entity_Array is array (1 .. Natural (N)) of ${entity_type};
+            Children : Entity_Array
+               with Import, Address => Children_P.all'Address;
+         begin
+            for I in Children'Range loop
+               Children (I) := (Child (Node.Node, I), Node.Info);
+            end loop;
+         end;
+         return N;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
+   function ${capi.get_name('node_find')}
+     (Node        : ${entity_type}_Ptr;
+      Kinds       : access constant ${node_kind_type};
+      Kinds_Count : unsigned;
+      Start       : ${entity_type}_Ptr;
+      Results_P   : ${entity_type}_Ptr;
+      Count       : unsigned) return unsigned is
+   begin
+      Clear_Last_Exception;
+
+      declare
+         type Kind_Array is array (1 .. Natural (Kinds_Count))
+            of ${node_kind_type};
+         type Entity_Array is array (1 .. Natural (Count)) of ${entity_type};
+
+         C_Kinds : Kind_Array
+            with Import, Address => (if Kinds_Count = 0
+                                     then System.Null_Address
+                                     else Kinds.all'Address);
+         Results : Entity_Array
+            with Import, Address => (if Count = 0
+                                     then System.Null_Address
+                                     else Results_P.all'Address);
+
+         Sought : array (${T.node_kind}) of Boolean := (others => False);
+         Total  : unsigned := 0;
+
+         Cur      : ${T.root_node.name} :=
+           (if Start = null then Node.Node else Start.Node);
+         Position : Natural := 0;
+         --  Node whose children subtrees remain to be searched, and number of
+         --  its first children that must be skipped.
+
+         function Visit (N : ${T.root_node.name}) return Visit_Status;
+         --  Store N in Results if it has one of the sought kinds. Stop the
+         --  traversal once Results is full.
+
+         function Visit_Children
+           (N : ${T.root_node.name}; From : Natural) return Visit_Status;
+         --  Traverse the subtrees for the children of N that come after its
+         --  From'th child.
+
+         -----------
+         -- Visit --
+         -----------
+
+         function Visit (N : ${T.root_node.name}) return Visit_Status is
+         begin
+            if Sought (N.Kind) then
+               Total := Total + 1;
+               Results (Natural (Total)) := (N, Node.Info);
+               if Total = Count then
+                  return Stop;
+               end if;
+            end if;
+            return Into;
+         end Visit;
+
+         --------------------
+         -- Visit_Children --
+         --------------------
+
+         function Visit_Children
+           (N : ${T.root_node.name}; From : Natural) return Visit_Status
+         is
+            C : ${T.root_node.name};
+         begin
+            for I in From + 1 .. Children_Count (N) loop
+               C := Child (N, I);
+               if C /= null and then Traverse (C, Visit'Access) = Stop then
+                  return Stop;
+               end if;
+            end loop;
+            return Into;
+         end Visit_Children;
+
+      begin
+         if Count = 0 then
+            return 0;
+         end if;
+
+         for K of C_Kinds loop
+            Sought (${T.node_kind}'Enum_Val (K)) := True;
+         end loop;
+
+         --  Search the subtree for Cur (Cur excluded), then resume the search
+         --  in its parent, right after Cur, until we are done with the subtree
+         --  for Node.
+
+         while Visit_Children (Cur, Position) /= Stop
+               and then Cur /= Node.Node
+         loop
+            declare
+               P : constant ${T.root_node.name} := Parent (Cur);
+            begin
+               Position := 1;
+               while Child (P, Position) /= Cur loop
+                  Position := Position + 1;
+               end loop;
+               Cur := P;
+            end;
+         end loop;
+         return Total;
+      end;
+   exception
+      when Exc : others =>
+         Set_Last_Exception (Exc);
+         return 0;
+   end;
+
    function ${capi.get_name("text_to_locale_string")}
      (Text : ${text_type}) return System.Address is
    begin
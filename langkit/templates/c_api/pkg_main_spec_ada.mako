@@ -97,6 +97,22 @@ private package ${ada_lib_name}.Implementation.C is
      with Convention => C;
    ${ada_c_doc('langkit.diagnostic_type', 3)}
 
+   type ${memoization_stats_type} is record
+      Hits, Misses, Evictions, Rejections, Entries, Bytes : Unsigned_64;
+   end record
+     with Convention => C;
+   ${ada_c_doc('langkit.memoization_statistics_type', 3)}
+
+   type ${token_columns_type} is record
+      Kinds                      : System.Address;
+      Start_Offsets, End_Offsets : System.Address;
+      Start_Lines, Start_Columns : System.Address;
+      End_Lines, End_Columns     : System.Address;
+      Is_Trivia                  : System.Address;
+   end record
+     with Convention => C;
+   ${ada_c_doc('langkit.token_columns_type', 3)}
+
    type ${exception_kind_type} is (
       ${', '.join(str(e.kind_name) for e in ctx.sorted_exception_types)}
    ) with Convention => C;
@@ -184,6 +200,17 @@ private package ${ada_lib_name}.Implementation.C is
       with Convention => C;
    ${ada_c_doc('langkit.unit_provider_get_unit_from_name_type', 3)}
 
+   % if ctx.generate_unparser:
+      --  Types for unparsing
+
+      type ${unparse_callback_type} is access procedure
+        (Data   : System.Address;
+         Bytes  : System.Address;
+         Length : size_t)
+         with Convention => C;
+      ${ada_c_doc('langkit.unparse_callback_type', 6)}
+   % endif
+
    -------------------------
    -- Analysis primitives --
    -------------------------
@@ -230,6 +257,34 @@ private package ${ada_lib_name}.Implementation.C is
               'context_discard_errors_in_populate_lexical_env')}";
    ${ada_c_doc('langkit.context_discard_errors_in_populate_lexical_env', 3)}
 
+   procedure ${capi.get_name("context_memoization_statistics")}
+     (Context : ${analysis_context_type};
+      Stats   : access ${memoization_stats_type})
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name(
+              'context_memoization_statistics')}";
+   ${ada_c_doc('langkit.context_memoization_statistics', 3)}
+
+   % if ctx.has_property_profiling:
+   procedure ${capi.get_name("context_property_profile")}
+     (Context : ${analysis_context_type};
+      Format  : int;
+      Result  : access ${text_type})
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('context_property_profile')}";
+   ${ada_c_doc('langkit.context_property_profile', 3)}
+
+   procedure ${capi.get_name("context_reset_property_profile")}
+     (Context : ${analysis_context_type})
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name(
+              'context_reset_property_profile')}";
+   ${ada_c_doc('langkit.context_reset_property_profile', 3)}
+   % endif
+
    function ${capi.get_name('get_analysis_unit_from_file')}
      (Context           : ${analysis_context_type};
       Filename, Charset : chars_ptr;
@@ -242,6 +297,21 @@ private package ${ada_lib_name}.Implementation.C is
               "${capi.get_name('get_analysis_unit_from_file')}";
    ${ada_c_doc('langkit.get_unit_from_file', 3)}
 
+   procedure ${capi.get_name('get_analysis_units_from_files')}
+     (Context   : ${analysis_context_type};
+      Filenames : System.Address;
+      Count     : int;
+      Charset   : chars_ptr;
+      Reparse   : int;
+      Rule      : ${grammar_rule_type};
+      Jobs      : int;
+      Units_P   : System.Address)
+      with Export        => True,
+           Convention    => C,
+           External_name =>
+              "${capi.get_name('get_analysis_units_from_files')}";
+   ${ada_c_doc('langkit.get_units_from_files', 3)}
+
    function ${capi.get_name('get_analysis_unit_from_buffer')}
      (Context           : ${analysis_context_type};
       Filename, Charset : chars_ptr;
@@ -316,6 +386,23 @@ private package ${ada_lib_name}.Implementation.C is
            External_Name => "${capi.get_name('unit_lookup_token')}";
    ${ada_c_doc('langkit.unit_lookup_token', 3)}
 
+   function ${capi.get_name('unit_token_columns')}
+     (Unit    : ${analysis_unit_type};
+      Columns : access ${token_columns_type};
+      Count   : int) return int
+      with Export        => True,
+           Convention    => C,
+           External_Name => "${capi.get_name('unit_token_columns')}";
+   ${ada_c_doc('langkit.unit_token_columns', 3)}
+
+   procedure ${capi.get_name('unit_source_buffer')}
+     (Unit   : ${analysis_unit_type};
+      Buffer : access ${text_type})
+      with Export        => True,
+           Convention    => C,
+           External_Name => "${capi.get_name('unit_source_buffer')}";
+   ${ada_c_doc('langkit.unit_source_buffer', 3)}
+
    procedure ${capi.get_name('unit_dump_lexical_env')}
      (Unit : ${analysis_unit_type})
       with Export        => True,
@@ -440,6 +527,25 @@ private package ${ada_lib_name}.Implementation.C is
            External_name => "${capi.get_name('node_sloc_range')}";
    ${ada_c_doc('langkit.node_sloc_range', 3)}
 
+   % if ctx.generate_unparser:
+      procedure ${capi.get_name('node_unparse')}
+        (Node     : ${entity_type}_Ptr;
+         Callback : ${unparse_callback_type};
+         Data     : System.Address)
+         with Export        => True,
+              Convention    => C,
+              External_name => "${capi.get_name('node_unparse')}";
+      ${ada_c_doc('langkit.node_unparse', 6)}
+
+      procedure ${capi.get_name('node_unparse_to_file')}
+        (Node     : ${entity_type}_Ptr;
+         Filename : chars_ptr)
+         with Export        => True,
+              Convention    => C,
+              External_name => "${capi.get_name('node_unparse_to_file')}";
+      ${ada_c_doc('langkit.node_unparse_to_file', 6)}
+   % endif
+
    procedure ${capi.get_name('lookup_in_node')}
      (Node   : ${entity_type}_Ptr;
       Sloc   : ${sloc_type};
@@ -465,6 +571,27 @@ private package ${ada_lib_name}.Implementation.C is
            External_name => "${capi.get_name('node_child')}";
    ${ada_c_doc('langkit.node_child', 3)}
 
+   function ${capi.get_name('node_children_array')}
+     (Node       : ${entity_type}_Ptr;
+      Children_P : ${entity_type}_Ptr;
+      Count      : unsigned) return unsigned
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('node_children_array')}";
+   ${ada_c_doc('langkit.node_children_array', 3)}
+
+   function ${capi.get_name('node_find')}
+     (Node        : ${entity_type}_Ptr;
+      Kinds       : access constant ${node_kind_type};
+      Kinds_Count : unsigned;
+      Start       : ${entity_type}_Ptr;
+      Results_P   : ${entity_type}_Ptr;
+      Count       : unsigned) return unsigned
+      with Export        => True,
+           Convention    => C,
+           External_name => "${capi.get_name('node_find')}";
+   ${ada_c_doc('langkit.node_find', 3)}
+
    function ${capi.get_name('text_to_locale_string')}
      (Text : ${text_type}) return System.Address
       with Export        => True,
@@ -7,6 +7,7 @@
 
    memoized_props = sorted(ctx.memoized_properties,
                            key=lambda p: p.qualname)
+   bounded_props = ctx.bounded_memoized_properties
 
    # We want discrimanted types below to be constrained, so we want
    # discriminant default values.
@@ -51,13 +52,42 @@ end record;
 function Hash (Key : Mmz_Key) return Hash_Type;
 function Equivalent (L, R : Mmz_Key) return Boolean;
 
+% if bounded_props:
+package Mmz_Key_Lists is new Ada.Containers.Doubly_Linked_Lists (Mmz_Key);
+
+type Mmz_Key_Lists_Array is array (Mmz_Property) of Mmz_Key_Lists.List;
+--  For each memoized property, keys of the entries a unit memoization map
+--  holds for it, most recently used first. Lists are maintained only for
+--  properties whose memoization table is bounded.
+% endif
+
+type Mmz_Entry is record
+   Value : Mmz_Value;
+   --  Memoized result (or evaluation state) for the corresponding key
+
+   % if bounded_props:
+   Position : Mmz_Key_Lists.Cursor;
+   --  If the memoization table for this entry's property is bounded,
+   --  position of the entry key in the corresponding unit list. No_Element
+   --  otherwise.
+   % endif
+end record;
+
 package Memoization_Maps is new Ada.Containers.Hashed_Maps
-  (Mmz_Key, Mmz_Value, Hash, Equivalent_Keys => Equivalent);
+  (Mmz_Key, Mmz_Entry, Hash, Equivalent_Keys => Equivalent);
 
 procedure Destroy (Map : in out Memoization_Maps.Map);
 --  Free all resources stored in a memoization map. This includes destroying
 --  ref-count shares the map owns.
 
+procedure Destroy_Memoization (Unit : Internal_Unit);
+--  Free all resources stored in Unit's memoization tables
+
+procedure Add_Memoization_Statistics
+  (Unit : Internal_Unit; Stats : in out Memoization_Statistics);
+--  Add the number of entries in Unit's memoization tables, and an estimate
+--  of the memory they use, to Stats.
+
 type Memoization_Handle is record
    Key : Mmz_Key;
    --  Key for the memoization
@@ -83,6 +113,10 @@ function Find_Memoized_Value
 --  Initialize Handle and look for a memoization entry in Unit.Memoization_Map
 --  that corresponds to the key in Handle/Create_Key. If one is found, put it
 --  in Value and return True. Create such an entry and return False otherwise.
+--
+--  Creating an entry for a property whose memoization table uses the LRU
+--  eviction policy may evict the least recently used entries for that
+--  property.
 
 procedure Add_Memoized_Value
   (Unit   : Internal_Unit;
@@ -92,7 +126,8 @@ procedure Add_Memoized_Value
 --  Insert the Handle.Key/Value entry in Unit.Memoization_Map (replacing the
 --  previous entry, if present). Set Stored to whether the key/value entry was
 --  actually stored: it's not when Handle is stale, i.e. caches where reset
---  since Handle was created).
+--  since Handle was created), or when the memoization table for the
+--  corresponding property uses the "reject" eviction policy and is full.
 
 </%def>
 
@@ -101,11 +136,47 @@ procedure Add_Memoized_Value
 <%
    key_types = ctx.sorted_types(ctx.memoization_keys)
    value_types = ctx.sorted_types(ctx.memoization_values)
+   refcounted_value_types = [t for t in value_types if t.is_refcounted]
+   bounded_props = ctx.bounded_memoized_properties
 %>
 
 function Hash (Key : Mmz_Key_Item) return Hash_Type;
 function Equivalent (L, R : Mmz_Key_Item) return Boolean;
 procedure Destroy (Key : in out Mmz_Key_Array_Access);
+% if refcounted_value_types:
+procedure Destroy (Value : in out Mmz_Value);
+% endif
+
+% if bounded_props:
+Mmz_Max_Entries : constant array (Mmz_Property) of Natural :=
+  (${',\n   '.join('{} => {}'.format(p.memoization_enum,
+                                     p.memoization_max_entries)
+                   for p in bounded_props)},
+   others => 0);
+--  For each memoized property, maximum number of entries its memoization
+--  table can hold in a given unit. Zero means that the table is unbounded.
+
+Mmz_Evict_LRU : constant array (Mmz_Property) of Boolean :=
+  (${',\n   '.join('{} => {}'.format(p.memoization_enum,
+                                     p.memoization_eviction == 'lru')
+                   for p in bounded_props)},
+   others => False);
+--  For each memoized property whose memoization table is bounded, whether
+--  the least recently used entries are evicted to make room for new ones
+--  (True) or whether new entries are rejected once the table is full
+--  (False).
+
+procedure Delete_Entry
+  (Unit : Internal_Unit; Cur : in out Memoization_Maps.Cursor);
+--  Remove the entry Cur designates from Unit's memoization tables and free
+--  the resources it owns.
+
+procedure Track_New_Entry
+  (Unit : Internal_Unit; Handle : Memoization_Handle);
+--  If the memoization table for the property of the entry Handle designates
+--  is bounded, register this entry as the most recently used one and, for
+--  the LRU policy, evict entries so that the table respects its bound.
+% endif
 
 ----------------
 -- Equivalent --
@@ -212,7 +283,7 @@ procedure Destroy (Map : in out Memoization_Maps.Map) is
 begin
    for Cur in Map.Iterate loop
       Keys (I) := Key (Cur).Items;
-      Values (I) := Element (Cur);
+      Values (I) := Element (Cur).Value;
       I := I + 1;
    end loop;
 
@@ -222,17 +293,9 @@ begin
       Destroy (K_Array);
    end loop;
 
-   <% refcounted_value_types = [t for t in value_types if t.is_refcounted] %>
    % if refcounted_value_types:
       for V of Values.all loop
-         case V.Kind is
-            % for t in refcounted_value_types:
-               when ${t.memoization_kind} =>
-                  Dec_Ref (V.As_${t.name});
-            % endfor
-
-            when others => null;
-         end case;
+         Destroy (V);
       end loop;
    % endif
 
@@ -240,6 +303,64 @@ begin
    Free (Values);
 end Destroy;
 
+% if refcounted_value_types:
+-------------
+-- Destroy --
+-------------
+
+procedure Destroy (Value : in out Mmz_Value) is
+begin
+   case Value.Kind is
+      % for t in refcounted_value_types:
+         when ${t.memoization_kind} =>
+            Dec_Ref (Value.As_${t.name});
+      % endfor
+
+      when others => null;
+   end case;
+end Destroy;
+% endif
+
+-------------------------
+-- Destroy_Memoization --
+-------------------------
+
+procedure Destroy_Memoization (Unit : Internal_Unit) is
+begin
+   % if bounded_props:
+      --  Recency lists only hold copies of the memoization map keys:
+      --  destroying the map below frees the corresponding resources.
+      Unit.Memoization_Lists := (others => Mmz_Key_Lists.Empty_List);
+   % endif
+   Destroy (Unit.Memoization_Map);
+end Destroy_Memoization;
+
+--------------------------------
+-- Add_Memoization_Statistics --
+--------------------------------
+
+procedure Add_Memoization_Statistics
+  (Unit : Internal_Unit; Stats : in out Memoization_Statistics)
+is
+   use Memoization_Maps;
+
+   --  The following is only an estimate: it accounts for the size of keys
+   --  and values, but not for the bookkeeping done by the containers nor for
+   --  the memory that memoized values may reference.
+
+   Entry_Size : constant Memoization_Counter :=
+     Memoization_Counter ((Mmz_Key'Size + Mmz_Entry'Size) / 8);
+   Item_Size  : constant Memoization_Counter :=
+     Memoization_Counter (Mmz_Key_Item'Size / 8);
+begin
+   for Cur in Unit.Memoization_Map.Iterate loop
+      Stats.Entries := Stats.Entries + 1;
+      Stats.Bytes := Stats.Bytes + Entry_Size
+                     + Item_Size * Memoization_Counter
+                                     (Key (Cur).Items.all'Length);
+   end loop;
+end Add_Memoization_Statistics;
+
 -------------
 -- Destroy --
 -------------
@@ -266,6 +387,76 @@ begin
    Free (Key);
 end Destroy;
 
+% if bounded_props:
+------------------
+-- Delete_Entry --
+------------------
+
+procedure Delete_Entry
+  (Unit : Internal_Unit; Cur : in out Memoization_Maps.Cursor)
+is
+   K : Mmz_Key := Memoization_Maps.Key (Cur);
+   E : Mmz_Entry := Memoization_Maps.Element (Cur);
+begin
+   if Mmz_Key_Lists.Has_Element (E.Position) then
+      Unit.Memoization_Lists (K.Property).Delete (E.Position);
+   end if;
+   Unit.Memoization_Map.Delete (Cur);
+   Destroy (K.Items);
+   % if refcounted_value_types:
+      Destroy (E.Value);
+   % endif
+end Delete_Entry;
+
+---------------------
+-- Track_New_Entry --
+---------------------
+
+procedure Track_New_Entry
+  (Unit : Internal_Unit; Handle : Memoization_Handle)
+is
+   use Mmz_Key_Lists;
+
+   Property : constant Mmz_Property := Handle.Key.Property;
+   Max      : constant Natural := Mmz_Max_Entries (Property);
+   Keys     : List renames Unit.Memoization_Lists (Property);
+   Cur      : Cursor;
+begin
+   if Max = 0 then
+      return;
+   end if;
+
+   Keys.Prepend (Handle.Key);
+   Unit.Memoization_Map.Reference (Handle.Cur).Position := Keys.First;
+
+   if not Mmz_Evict_LRU (Property) then
+      return;
+   end if;
+
+   --  Evict least recently used entries until the table is small enough.
+   --  Entries that are still being evaluated are in use by callers up in the
+   --  call stack: keep them.
+
+   Cur := Keys.Last;
+   while Natural (Keys.Length) > Max and then Has_Element (Cur) loop
+      declare
+         Prev    : constant Cursor := Previous (Cur);
+         Map_Cur : Memoization_Maps.Cursor :=
+           Unit.Memoization_Map.Find (Element (Cur));
+      begin
+         if Memoization_Maps.Element (Map_Cur).Value.Kind
+            /= Mmz_Evaluating
+         then
+            Delete_Entry (Unit, Map_Cur);
+            Unit.Context.Memoization_Stats.Evictions :=
+              Unit.Context.Memoization_Stats.Evictions + 1;
+         end if;
+         Cur := Prev;
+      end;
+   end loop;
+end Track_New_Entry;
+% endif
+
 -------------------------
 -- Find_Memoized_Value --
 -------------------------
@@ -276,6 +467,7 @@ function Find_Memoized_Value
    Value      : out Mmz_Value;
    Create_Key : access function return Mmz_Key) return Boolean
 is
+   Stats    : Memoization_Statistics renames Unit.Context.Memoization_Stats;
    Inserted : Boolean;
 begin
    --  Make sure that we don't lookup stale caches
@@ -286,14 +478,38 @@ begin
    Handle.Key := Create_Key.all;
    Handle.Cache_Version := Unit.Cache_Version;
    Value := (Kind => Mmz_Evaluating);
-   Unit.Memoization_Map.Insert (Handle.Key, Value, Handle.Cur, Inserted);
+   Unit.Memoization_Map.Insert
+     (Handle.Key, (Value => Value, others => <>), Handle.Cur, Inserted);
 
    --  No existing entry yet? The above just created one. Otherwise, destroy
    --  our key and reuse the existing entry's.
-   if not Inserted then
+   if Inserted then
+      Stats.Misses := Stats.Misses + 1;
+      % if bounded_props:
+         Track_New_Entry (Unit, Handle);
+      % endif
+
+   else
       Destroy (Handle.Key.Items);
       Handle.Key := Memoization_Maps.Key (Handle.Cur);
-      Value := Memoization_Maps.Element (Handle.Cur);
+
+      declare
+         E : constant Mmz_Entry := Memoization_Maps.Element (Handle.Cur);
+         % if bounded_props:
+            Keys : Mmz_Key_Lists.List renames
+              Unit.Memoization_Lists (Handle.Key.Property);
+         % endif
+      begin
+         Value := E.Value;
+         % if bounded_props:
+            --  Keep track of the most recently used entries for LRU eviction
+            if Mmz_Evict_LRU (Handle.Key.Property) then
+               Keys.Splice (Before => Keys.First, Position => E.Position);
+            end if;
+         % endif
+      end;
+
+      Stats.Hits := Stats.Hits + 1;
    end if;
 
    return not Inserted;
@@ -314,9 +530,32 @@ begin
    --  triggered the memoization tables reset.
 
    Stored := Unit.Cache_Version <= Handle.Cache_Version;
-   if Stored then
-      Unit.Memoization_Map.Replace_Element (Handle.Cur, Value);
+   if not Stored then
+      return;
    end if;
+
+   % if bounded_props:
+      --  If the table for this property rejects new entries once full, drop
+      --  the entry Find_Memoized_Value created for this evaluation.
+
+      declare
+         Property : constant Mmz_Property := Handle.Key.Property;
+      begin
+         if Mmz_Max_Entries (Property) > 0
+            and then not Mmz_Evict_LRU (Property)
+            and then Natural (Unit.Memoization_Lists (Property).Length)
+                     > Mmz_Max_Entries (Property)
+         then
+            Delete_Entry (Unit, Handle.Cur);
+            Unit.Context.Memoization_Stats.Rejections :=
+              Unit.Context.Memoization_Stats.Rejections + 1;
+            Stored := False;
+            return;
+         end if;
+      end;
+   % endif
+
+   Unit.Memoization_Map.Reference (Handle.Cur).Value := Value;
 end Add_Memoized_Value;
 
 </%def>
@@ -267,6 +267,38 @@ package body ${ada_lib_name}.Analysis is
       Set_Logic_Resolution_Timeout (Unwrap_Context (Context), Timeout);
    end Set_Logic_Resolution_Timeout;
 
+   --------------------------------
+   -- Get_Memoization_Statistics --
+   --------------------------------
+
+   function Get_Memoization_Statistics
+     (Context : Analysis_Context'Class) return Memoization_Statistics is
+   begin
+      return Get_Memoization_Statistics (Unwrap_Context (Context));
+   end Get_Memoization_Statistics;
+
+   % if ctx.has_property_profiling:
+   ----------------------
+   -- Property_Profile --
+   ----------------------
+
+   function Property_Profile
+     (Context : Analysis_Context'Class;
+      Format  : Property_Profile_Format := JSON) return String is
+   begin
+      return Property_Profile_Image (Unwrap_Context (Context), Format);
+   end Property_Profile;
+
+   ----------------------------
+   -- Reset_Property_Profile --
+   ----------------------------
+
+   procedure Reset_Property_Profile (Context : Analysis_Context'Class) is
+   begin
+      Reset_Property_Profile (Unwrap_Context (Context));
+   end Reset_Property_Profile;
+   % endif
+
    --------------------------
    -- Disable_Lookup_Cache --
    --------------------------
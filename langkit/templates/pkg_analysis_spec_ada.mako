@@ -233,6 +233,20 @@ package ${ada_lib_name}.Analysis is
      (Context : Analysis_Context'Class; Timeout : Natural);
    ${ada_doc('langkit.context_set_logic_resolution_timeout', 3)}
 
+   function Get_Memoization_Statistics
+     (Context : Analysis_Context'Class) return Memoization_Statistics;
+   ${ada_doc('langkit.context_memoization_statistics', 3)}
+
+   % if ctx.has_property_profiling:
+   function Property_Profile
+     (Context : Analysis_Context'Class;
+      Format  : Property_Profile_Format := JSON) return String;
+   ${ada_doc('langkit.context_property_profile', 3)}
+
+   procedure Reset_Property_Profile (Context : Analysis_Context'Class);
+   ${ada_doc('langkit.context_reset_property_profile', 3)}
+   % endif
+
    procedure Disable_Lookup_Cache (Disable : Boolean := True);
    --  Debug helper: if ``Disable`` is true, disable the use of caches in
    --  lexical environment lookups. Otherwise, activate it.
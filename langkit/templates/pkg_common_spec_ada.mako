@@ -305,6 +305,38 @@ package ${ada_lib_name}.Common is
    function Raw_Data (T : Token_Reference) return Stored_Token_Data;
    --  Return the raw token data for ``T``
 
+   subtype Memoization_Counter is Long_Long_Integer
+      range 0 .. Long_Long_Integer'Last;
+
+   type Memoization_Statistics is record
+      Hits : Memoization_Counter := 0;
+      --  Number of memoized property calls whose result was already in
+      --  memoization tables.
+
+      Misses : Memoization_Counter := 0;
+      --  Number of memoized property calls whose result had to be computed
+
+      Evictions : Memoization_Counter := 0;
+      --  Number of results that were discarded to make room for new ones,
+      --  because of a bound on the number of memoization table entries.
+
+      Rejections : Memoization_Counter := 0;
+      --  Number of results that were not stored because their memoization
+      --  table was full and rejects new entries.
+
+      Entries : Memoization_Counter := 0;
+      --  Number of entries currently in memoization tables
+
+      Bytes : Memoization_Counter := 0;
+      --  Estimation of the memory used by these entries
+   end record;
+   ${ada_doc('langkit.memoization_statistics_type', 3)}
+
+   % if ctx.has_property_profiling:
+   type Property_Profile_Format is (JSON, Folded_Stacks);
+   ${ada_doc('langkit.property_profile_format_type', 3)}
+   % endif
+
    ## Emit declarations for all exceptions
    % for section_name, exceptions in ctx.exceptions_by_section:
    % if section_name:
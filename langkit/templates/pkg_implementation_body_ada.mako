@@ -4,6 +4,7 @@
 <%namespace name="astnode_types" file="astnode_types_ada.mako" />
 <%namespace name="exts"          file="extensions.mako" />
 <%namespace name="memoization"   file="memoization_ada.mako" />
+<%namespace name="profiling"     file="properties_profiling_ada.mako" />
 <%namespace name="struct_types"  file="struct_types_ada.mako" />
 
 <% root_node_array = T.root_node.array %>
@@ -397,6 +398,10 @@ package body ${ada_lib_name}.Implementation is
       Context.In_Populate_Lexical_Env := False;
       Context.Cache_Version := 0;
       Context.Reparse_Cache_Version := 0;
+      Context.Memoization_Stats := (others => <>);
+      % if ctx.has_property_profiling:
+         Reset_Property_Profile (Context);
+      % endif
 
       Context.Rewriting_Handle := No_Rewriting_Handle_Pointer;
       Context.Templates_Unit := No_Analysis_Unit;
@@ -428,31 +433,41 @@ package body ${ada_lib_name}.Implementation is
       return Unit;
    end Create_Unit;
 
-   --------------
-   -- Get_Unit --
-   --------------
+   procedure Prepare_Unit
+     (Context           : Internal_Context;
+      Filename, Charset : String;
+      Rule              : Grammar_Rule;
+      Input             : in out Internal_Lexer_Input;
+      Unit              : out Internal_Unit;
+      Created           : out Boolean);
+   --  Helper for Get_Unit and Get_From_Files. Look for the unit for Filename
+   --  in Context, or create it if it does not exist yet (Created tells which
+   --  case happened), and refine Input so that it can be used to (re)parse
+   --  it.
 
-   function Get_Unit
+   ------------------
+   -- Prepare_Unit --
+   ------------------
+
+   procedure Prepare_Unit
      (Context           : Internal_Context;
       Filename, Charset : String;
-      Reparse           : Boolean;
-      Input             : Internal_Lexer_Input;
-      Rule              : Grammar_Rule) return Internal_Unit
+      Rule              : Grammar_Rule;
+      Input             : in out Internal_Lexer_Input;
+      Unit              : out Internal_Unit;
+      Created           : out Boolean)
    is
       use Units_Maps;
 
       Normalized_Filename : constant GNATCOLL.VFS.Virtual_File :=
          Normalized_Unit_Filename (Context, Filename);
 
-      Cur     : constant Cursor :=
-         Context.Units.Find (Normalized_Filename);
-      Created : constant Boolean := Cur = No_Element;
-      Unit    : Internal_Unit;
+      Cur : constant Cursor := Context.Units.Find (Normalized_Filename);
 
       Actual_Charset : Unbounded_String;
-      Refined_Input  : Internal_Lexer_Input := Input;
-
    begin
+      Created := Cur = No_Element;
+
       --  Determine which encoding to use. Use the Charset parameter (if
       --  provided), otherwise use the context-wide default.
 
@@ -460,19 +475,19 @@ package body ${ada_lib_name}.Implementation is
                          then To_Unbounded_String (Charset)
                          else Context.Charset);
 
-      if Refined_Input.Kind = File then
-         Refined_Input.Filename := Normalized_Filename;
+      if Input.Kind = File then
+         Input.Filename := Normalized_Filename;
       end if;
 
-      if Refined_Input.Kind in File | Bytes_Buffer then
-         Refined_Input.Charset := Actual_Charset;
+      if Input.Kind in File | Bytes_Buffer then
+         Input.Charset := Actual_Charset;
 
          --  Unless the caller requested a specific charset for this unit,
          --  allow the lexer to automatically discover the source file encoding
          --  before defaulting to the context-specific one. We do this trying
          --  to match a byte order mark.
 
-         Refined_Input.Read_BOM := Charset'Length = 0;
+         Input.Read_BOM := Charset'Length = 0;
       end if;
 
       --  Create the Internal_Unit if needed
@@ -483,6 +498,25 @@ package body ${ada_lib_name}.Implementation is
                            To_String (Actual_Charset), Rule)
          else Element (Cur));
       Unit.Charset := Actual_Charset;
+   end Prepare_Unit;
+
+   --------------
+   -- Get_Unit --
+   --------------
+
+   function Get_Unit
+     (Context           : Internal_Context;
+      Filename, Charset : String;
+      Reparse           : Boolean;
+      Input             : Internal_Lexer_Input;
+      Rule              : Grammar_Rule) return Internal_Unit
+   is
+      Created       : Boolean;
+      Unit          : Internal_Unit;
+      Refined_Input : Internal_Lexer_Input := Input;
+   begin
+      Prepare_Unit
+        (Context, Filename, Charset, Rule, Refined_Input, Unit, Created);
 
       --  (Re)parse it if needed
 
@@ -530,6 +564,193 @@ package body ${ada_lib_name}.Implementation is
       return Get_Unit (Context, Filename, Charset, Reparse, Input, Rule);
    end Get_From_File;
 
+   --------------------
+   -- Get_From_Files --
+   --------------------
+
+   function Get_From_Files
+     (Context   : Internal_Context;
+      Filenames : Unbounded_String_Array;
+      Charset   : String;
+      Reparse   : Boolean;
+      Rule      : Grammar_Rule;
+      Jobs      : Positive) return Internal_Unit_Array
+   is
+      use Ada.Exceptions;
+
+      subtype File_Input is Internal_Lexer_Input (File);
+
+      package Unit_Sets is new Ada.Containers.Hashed_Sets
+        (Element_Type        => Internal_Unit,
+         Hash                => Hash,
+         Equivalent_Elements => "=");
+
+      Units    : Internal_Unit_Array (Filenames'Range);
+      Inputs   : array (Filenames'Range) of File_Input :=
+        (others => (Kind     => File,
+                    Charset  => <>,
+                    Read_BOM => False,
+                    Filename => <>));
+      To_Parse : array (Filenames'Range) of Boolean := (others => False);
+      Results  : array (Filenames'Range) of Reparsed_Unit;
+
+      Scheduled  : Unit_Sets.Set;
+      Work_Count : Natural := 0;
+
+      Error : Exception_Occurrence_Access;
+      --  First exception raised while parsing units, if any
+   begin
+      --  First create the units that do not exist yet and determine which
+      --  ones need to be parsed. This updates the context-wide units map, so
+      --  this must be done sequentially. If the same unit is requested
+      --  several times, parse it only once.
+
+      for I in Filenames'Range loop
+         declare
+            Created : Boolean;
+         begin
+            Prepare_Unit
+              (Context, To_String (Filenames (I)), Charset, Rule, Inputs (I),
+               Units (I), Created);
+            if (Created or else Reparse)
+               and then not Scheduled.Contains (Units (I))
+            then
+               Scheduled.Insert (Units (I));
+               To_Parse (I) := True;
+               Work_Count := Work_Count + 1;
+            end if;
+         end;
+      end loop;
+
+      --  Then do the lexing and parsing, which is where most of the time is
+      --  spent. This does not modify the context itself, except for its
+      --  symbol table, so several tasks can do it in parallel, each with its
+      --  own parser, as long as accesses to the symbol table are serialized.
+      --  This includes the symbolization of tokens during lexing, but also
+      --  accesses from properties that predicate parsers run.
+
+      if Jobs = 1 or else Work_Count <= 1 then
+         for I in Filenames'Range loop
+            if To_Parse (I) then
+               Do_Parsing (Units (I), Inputs (I), Results (I));
+            end if;
+         end loop;
+
+      else
+         declare
+            protected Queue is
+               procedure Next (Index : out Natural);
+               --  Return the index of the next unit to parse, or 0 if there
+               --  is no unit left to parse.
+
+               procedure Set_Error (Exc : Exception_Occurrence);
+               --  Record Exc in Error, unless another error was recorded
+               --  before.
+
+            private
+               Next_Index : Natural := Filenames'First;
+            end Queue;
+
+            task type Worker;
+
+            -----------
+            -- Queue --
+            -----------
+
+            protected body Queue is
+
+               ----------
+               -- Next --
+               ----------
+
+               procedure Next (Index : out Natural) is
+               begin
+                  while Next_Index <= Filenames'Last
+                        and then not To_Parse (Next_Index)
+                  loop
+                     Next_Index := Next_Index + 1;
+                  end loop;
+
+                  if Next_Index <= Filenames'Last then
+                     Index := Next_Index;
+                     Next_Index := Next_Index + 1;
+                  else
+                     Index := 0;
+                  end if;
+               end Next;
+
+               ---------------
+               -- Set_Error --
+               ---------------
+
+               procedure Set_Error (Exc : Exception_Occurrence) is
+               begin
+                  if Error = null then
+                     Error := Save_Occurrence (Exc);
+                  end if;
+               end Set_Error;
+
+            end Queue;
+
+            ------------
+            -- Worker --
+            ------------
+
+            task body Worker is
+               Parser : Parser_Type;
+               Index  : Natural;
+            begin
+               Initialize (Parser);
+               loop
+                  Queue.Next (Index);
+                  exit when Index = 0;
+
+                  begin
+                     Do_Parsing
+                       (Units (Index), Inputs (Index), Parser,
+                        Results (Index));
+                  exception
+                     when Exc : others =>
+                        Queue.Set_Error (Exc);
+                  end;
+               end loop;
+               Destroy (Parser);
+            end Worker;
+
+         begin
+            Enter_Concurrent_Access (Context.Symbols);
+            declare
+               Workers : array (1 .. Natural'Min (Jobs, Work_Count))
+                 of Worker;
+               pragma Unreferenced (Workers);
+            begin
+               --  Leaving this block waits for all workers to complete
+               null;
+            end;
+            Leave_Concurrent_Access (Context.Symbols);
+         end;
+      end if;
+
+      if Error /= null then
+         for R of Results loop
+            Destroy (R);
+         end loop;
+         Reraise_Occurrence (Error.all);
+      end if;
+
+      --  Finally replace the trees of parsed units, which updates
+      --  context-wide lexical environment data, and thus must be done
+      --  sequentially too.
+
+      for I in Filenames'Range loop
+         if To_Parse (I) then
+            Update_After_Reparse (Units (I), Results (I));
+         end if;
+      end loop;
+
+      return Units;
+   end Get_From_Files;
+
    ---------------------
    -- Get_From_Buffer --
    ---------------------
@@ -715,6 +936,9 @@ package body ${ada_lib_name}.Implementation is
       AST_Envs.Destroy (Context.Root_Scope);
       Destroy (Context.Symbols);
       Destroy (Context.Parser);
+      % if ctx.has_property_profiling:
+         Destroy (Context.Property_Profile);
+      % endif
       Dec_Ref (Context.Unit_Provider);
       Context_Pool.Release (Context);
    end Destroy;
@@ -1103,7 +1327,7 @@ package body ${ada_lib_name}.Implementation is
       Analysis_Unit_Sets.Destroy (Unit.Referenced_Units);
 
       % if ctx.has_memoization:
-         Destroy (Unit.Memoization_Map);
+         Destroy_Memoization (Unit);
       % endif
 
       Destroy_Rebindings (Unit.Rebindings'Access);
@@ -1173,6 +1397,10 @@ package body ${ada_lib_name}.Implementation is
       ${memoization.body()}
    % endif
 
+   % if ctx.has_property_profiling:
+      ${profiling.body()}
+   % endif
+
    -------------------
    -- Solve_Wrapper --
    -------------------
@@ -4128,11 +4356,32 @@ package body ${ada_lib_name}.Implementation is
       if Cache_Version < Unit.Context.Cache_Version then
          Unit.Cache_Version := Unit.Context.Cache_Version;
          % if ctx.has_memoization:
-            Destroy (Unit.Memoization_Map);
+            Destroy_Memoization (Unit);
          % endif
       end if;
    end Reset_Caches;
 
+   --------------------------------
+   -- Get_Memoization_Statistics --
+   --------------------------------
+
+   function Get_Memoization_Statistics
+     (Context : Internal_Context) return Memoization_Statistics
+   is
+      Result : Memoization_Statistics := Context.Memoization_Stats;
+   begin
+      % if ctx.has_memoization:
+         for Unit of Context.Units loop
+            --  Do not count entries from stale caches: they are going to be
+            --  destroyed on the next lookup.
+            if Unit.Cache_Version >= Context.Cache_Version then
+               Add_Memoization_Statistics (Unit, Result);
+            end if;
+         end loop;
+      % endif
+      return Result;
+   end Get_Memoization_Statistics;
+
    --------------------
    -- Reference_Unit --
    --------------------
@@ -4166,6 +4415,15 @@ package body ${ada_lib_name}.Implementation is
    procedure Do_Parsing
      (Unit   : Internal_Unit;
       Input  : Internal_Lexer_Input;
+      Result : out Reparsed_Unit) is
+   begin
+      Do_Parsing (Unit, Input, Unit.Context.Parser, Result);
+   end Do_Parsing;
+
+   procedure Do_Parsing
+     (Unit   : Internal_Unit;
+      Input  : Internal_Lexer_Input;
+      Parser : in out Parser_Type;
       Result : out Reparsed_Unit)
    is
       Context  : constant Internal_Context := Unit.Context;
@@ -4248,7 +4506,7 @@ package body ${ada_lib_name}.Implementation is
       begin
          Init_Parser
            (Actual_Input, Context.With_Trivia, Unit,
-            Unit_TDH, Unit.Context.Parser);
+            Unit_TDH, Parser);
       exception
          when Exc : Name_Error =>
             --  This happens when we cannot open the source file for lexing:
@@ -4282,11 +4540,11 @@ package body ${ada_lib_name}.Implementation is
       --  get.
 
       Result.AST_Mem_Pool := Create;
-      Unit.Context.Parser.Mem_Pool := Result.AST_Mem_Pool;
+      Parser.Mem_Pool := Result.AST_Mem_Pool;
 
       Result.AST_Root := ${T.root_node.name}
-        (Parse (Unit.Context.Parser, Rule => Unit.Rule));
-      Result.Diagnostics.Append (Unit.Context.Parser.Diagnostics);
+        (Parse (Parser, Rule => Unit.Rule));
+      Result.Diagnostics.Append (Parser.Diagnostics);
       Rotate_TDH;
    end Do_Parsing;
 
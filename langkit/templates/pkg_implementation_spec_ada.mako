@@ -5,13 +5,20 @@
 <%namespace name="exts"          file="extensions.mako" />
 <%namespace name="struct_types"  file="struct_types_ada.mako" />
 <%namespace name="memoization"   file="memoization_ada.mako" />
+<%namespace name="profiling"     file="properties_profiling_ada.mako" />
 
 <% root_node_array = T.root_node.array %>
 
 with Ada.Containers;              use Ada.Containers;
+% if ctx.bounded_memoized_properties:
+   with Ada.Containers.Doubly_Linked_Lists;
+% endif
 with Ada.Containers.Hashed_Maps;
 with Ada.Containers.Hashed_Sets;
 with Ada.Containers.Ordered_Maps;
+% if ctx.has_property_profiling:
+   with Ada.Real_Time;
+% endif
 with Ada.Strings.Unbounded;       use Ada.Strings.Unbounded;
 with Ada.Strings.Unbounded.Hash;
 with Ada.Unchecked_Conversion;
@@ -1137,6 +1144,14 @@ private package ${ada_lib_name}.Implementation is
    ${memoization.decl()}
    % endif
 
+   % if ctx.has_property_profiling:
+   -------------------------
+   -- Properties profiler --
+   -------------------------
+
+   ${profiling.decl()}
+   % endif
+
    -----------------------------
    -- Miscellanous operations --
    -----------------------------
@@ -1299,6 +1314,15 @@ private package ${ada_lib_name}.Implementation is
       --  Version number used to invalidate referenced envs caches. It is
       --  incremented only when a unit is reparsed in the context.
 
+      Memoization_Stats : Memoization_Statistics;
+      --  Cumulative memoization counters for this context. Entries and Bytes
+      --  are not maintained here: see Get_Memoization_Statistics.
+
+      % if ctx.has_property_profiling:
+         Property_Profile : Property_Profile_Type;
+         --  Profiling data for the properties that run in this context
+      % endif
+
       Rewriting_Handle : Rewriting_Handle_Pointer :=
          No_Rewriting_Handle_Pointer;
       --  Rewriting handle for this context's current rewriting session.
@@ -1431,6 +1455,12 @@ private package ${ada_lib_name}.Implementation is
       % if ctx.has_memoization:
          Memoization_Map : Memoization_Maps.Map;
          --  Mapping of arguments tuple to property result for memoization
+
+         % if ctx.bounded_memoized_properties:
+            Memoization_Lists : Mmz_Key_Lists_Array;
+            --  Recency lists for bounded memoization tables. See
+            --  Mmz_Key_Lists_Array.
+         % endif
       % endif
 
       Cache_Version : Natural := 0;
@@ -1504,6 +1534,21 @@ private package ${ada_lib_name}.Implementation is
       with Pre => not Reparse or else not Has_Rewriting_Handle (Context);
    --  Implementation for Analysis.Get_From_File
 
+   type Unbounded_String_Array is
+     array (Positive range <>) of Unbounded_String;
+   type Internal_Unit_Array is array (Positive range <>) of Internal_Unit;
+
+   function Get_From_Files
+     (Context   : Internal_Context;
+      Filenames : Unbounded_String_Array;
+      Charset   : String;
+      Reparse   : Boolean;
+      Rule      : Grammar_Rule;
+      Jobs      : Positive) return Internal_Unit_Array
+      with Pre => not Reparse or else not Has_Rewriting_Handle (Context);
+   --  Like Get_From_File, for each file in Filenames, returning the units in
+   --  the same order. Use up to Jobs tasks to lex and parse the units.
+
    function Get_From_Buffer
      (Context  : Internal_Context;
       Filename : String;
@@ -1649,6 +1694,10 @@ private package ${ada_lib_name}.Implementation is
    --  Destroy Unit's memoization cache. This resets Unit's version number to
    --  Unit.Context.Cache_Version.
 
+   function Get_Memoization_Statistics
+     (Context : Internal_Context) return Memoization_Statistics;
+   --  Implementation for Analysis.Get_Memoization_Statistics
+
    procedure Reference_Unit (From, Referenced : Internal_Unit);
    --  Set the Referenced unit as being referenced from the From unit. This is
    --  useful for visibility purposes, and is mainly meant to be used in the
@@ -1668,6 +1717,17 @@ private package ${ada_lib_name}.Implementation is
    --  Parse text for Unit using Input and store the result in Result. This
    --  leaves Unit unchanged.
 
+   procedure Do_Parsing
+     (Unit   : Internal_Unit;
+      Input  : Internal_Lexer_Input;
+      Parser : in out Parser_Type;
+      Result : out Reparsed_Unit);
+   --  Likewise, but use Parser instead of the context-wide parser. Since
+   --  this does not modify Unit's context, several tasks can call it at the
+   --  same time for different units, as long as each task has its own
+   --  parser and concurrent accesses to the context's symbol table are
+   --  enabled (see Langkit_Support.Symbols.Enter_Concurrent_Access).
+
    procedure Update_After_Reparse
      (Unit : Internal_Unit; Reparsed : in out Reparsed_Unit);
    --  Update Unit's AST from Reparsed and update stale lexical environment
@@ -310,6 +310,16 @@ package body ${ada_lib_name}.Rewriting is
       return Impl.Unparse (Unwrap_Unit_RH (Handle));
    end Unparse;
 
+   ---------------------
+   -- Unparse_To_File --
+   ---------------------
+
+   procedure Unparse_To_File
+     (Handle : Unit_Rewriting_Handle; Filename : String) is
+   begin
+      Impl.Unparse_To_File (Unwrap_Unit_RH (Handle), Filename);
+   end Unparse_To_File;
+
    -------------
    -- Replace --
    -------------
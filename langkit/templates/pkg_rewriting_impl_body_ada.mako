@@ -426,6 +426,22 @@ package body ${ada_lib_name}.Rewriting_Implementation is
          As_Unit             => True);
    end Unparse;
 
+   ---------------------
+   -- Unparse_To_File --
+   ---------------------
+
+   procedure Unparse_To_File
+     (Handle : Unit_Rewriting_Handle; Filename : String) is
+   begin
+      ${pre_check_urw_handle('Handle')}
+      Unparsing_Implementation.Unparse_To_File
+        (Node                => Create_Abstract_Node (Handle.Root),
+         Unit                => Handle.Unit,
+         Preserve_Formatting => True,
+         As_Unit             => True,
+         Filename            => Filename);
+   end Unparse_To_File;
+
    ------------
    -- Handle --
    ------------
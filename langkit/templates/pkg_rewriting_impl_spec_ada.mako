@@ -213,6 +213,10 @@ private package ${ada_lib_name}.Rewriting_Implementation is
    function Unparse (Handle : Unit_Rewriting_Handle) return Unbounded_Text_Type;
    --  Implementation for Rewriting.Unparse
 
+   procedure Unparse_To_File
+     (Handle : Unit_Rewriting_Handle; Filename : String);
+   --  Implementation for Rewriting.Unparse_To_File
+
    ---------------------------------------
    -- Implementation for node rewriting --
    ---------------------------------------
@@ -93,6 +93,10 @@ package ${ada_lib_name}.Rewriting is
    function Unparse (Handle : Unit_Rewriting_Handle) return Unbounded_Text_Type;
    ${ada_doc('langkit.rewriting.unit_unparse', 3)}
 
+   procedure Unparse_To_File
+     (Handle : Unit_Rewriting_Handle; Filename : String);
+   ${ada_doc('langkit.rewriting.unit_unparse_to_file', 3)}
+
    --------------------
    -- Node rewriting --
    --------------------
@@ -23,4 +23,39 @@ package body ${ada_lib_name}.Unparsing is
          As_Unit             => False);
    end Unparse;
 
+   -------------
+   -- Unparse --
+   -------------
+
+   procedure Unparse
+     (Node  : ${root_entity.api_name}'Class;
+      Write : access procedure (Bytes : String))
+   is
+      N : constant ${T.root_node.name} := Unwrap_Node (Node);
+   begin
+      Unparse
+        (Create_Abstract_Node (N),
+         N.Unit,
+         Preserve_Formatting => False,
+         As_Unit             => False,
+         Callback            => Write);
+   end Unparse;
+
+   ---------------------
+   -- Unparse_To_File --
+   ---------------------
+
+   procedure Unparse_To_File
+     (Node : ${root_entity.api_name}'Class; Filename : String)
+   is
+      N : constant ${T.root_node.name} := Unwrap_Node (Node);
+   begin
+      Unparse_To_File
+        (Create_Abstract_Node (N),
+         N.Unit,
+         Preserve_Formatting => False,
+         As_Unit             => False,
+         Filename            => Filename);
+   end Unparse_To_File;
+
 end ${ada_lib_name}.Unparsing;
@@ -5,11 +5,11 @@
 <% concrete_astnodes = [astnode for astnode in ctx.astnode_types
                         if not astnode.abstract] %>
 
+with Ada.Streams.Stream_IO;
 pragma Warnings (Off, "internal");
 with Ada.Strings.Wide_Wide_Unbounded.Aux;
 pragma Warnings (On, "internal");
 
-with GNATCOLL.Iconv;
 
 with Langkit_Support.Token_Data_Handlers;
 use Langkit_Support.Token_Data_Handlers;
@@ -45,7 +45,7 @@ package body ${ada_lib_name}.Unparsing_Implementation is
      (Present => True, First => No_Token, Last => No_Token);
 
    function Create_Token_Sequence
-     (Unparser    : Token_Sequence_Access;
+     (Unparser    : Token_Sequence;
       First_Token : in out Token_Reference)
       return Present_Token_Sequence_Template
       with Pre => First_Token /= No_Token;
@@ -103,6 +103,11 @@ package body ${ada_lib_name}.Unparsing_Implementation is
    --  Update Sloc as if it represented a cursor that move right-wards after
    --  inserting Char to a buffer.
 
+   procedure Flush (Buffer : in out Unparsing_Buffer)
+      with Pre => Buffer.Sink /= null;
+   --  Encode the content of Buffer, send it to Buffer.Sink and then clear
+   --  Buffer.Content.
+
    procedure Unparse_Node
      (Node                : Abstract_Node;
       Preserve_Formatting : Boolean;
@@ -131,7 +136,7 @@ package body ${ada_lib_name}.Unparsing_Implementation is
    --  Using the Unparser unparsing table, unparse a token
 
    procedure Unparse_Token_Sequence
-     (Unparser : Token_Sequence_Access;
+     (Unparser : Token_Sequence;
       Result   : in out Unparsing_Buffer);
    --  Using the Unparser unparsing table, unparse a sequence of tokens
 
@@ -317,17 +322,17 @@ package body ${ada_lib_name}.Unparsing_Implementation is
    ---------------------------
 
    function Create_Token_Sequence
-     (Unparser    : Token_Sequence_Access;
+     (Unparser    : Token_Sequence;
       First_Token : in out Token_Reference)
       return Present_Token_Sequence_Template
    is
       Result : Present_Token_Sequence_Template;
    begin
-      if Unparser'Length = 0 then
+      if Length (Unparser) = 0 then
          return (Present => True, First => No_Token, Last => No_Token);
       else
          Result.First := First_Token;
-         Result.Last := Relative_Token (First_Token, Unparser'Length - 1);
+         Result.Last := Relative_Token (First_Token, Length (Unparser) - 1);
          First_Token := Relative_Token (Result.Last, 1);
          return Result;
       end if;
@@ -361,7 +366,7 @@ package body ${ada_lib_name}.Unparsing_Implementation is
          declare
             U     : Field_Unparser_List renames Unparser.Field_Unparsers.all;
             F     : Field_Unparser renames U.Field_Unparsers (I);
-            T     : Token_Sequence_Access renames U.Inter_Tokens (I);
+            T     : Token_Sequence renames U.Inter_Tokens (I);
             FT    : Field_Template renames Result.Fields (I);
 
             Rewritten_Child : constant ${T.root_node.name} :=
@@ -445,6 +450,7 @@ package body ${ada_lib_name}.Unparsing_Implementation is
    begin
       Update_Sloc (Buffer.Last_Sloc, Char);
       Append (Buffer.Content, Char);
+      Buffer.Is_Empty := False;
    end Append;
 
    ------------
@@ -461,8 +467,73 @@ package body ${ada_lib_name}.Unparsing_Implementation is
       end loop;
       Append (Buffer.Content, Text);
       Buffer.Last_Token := Kind;
+      Buffer.Is_Empty := False;
+
+      if Buffer.Sink /= null
+         and then Length (Buffer.Content) >= Flush_Threshold
+      then
+         Flush (Buffer);
+      end if;
    end Append;
 
+   -----------
+   -- Flush --
+   -----------
+
+   procedure Flush (Buffer : in out Unparsing_Buffer) is
+      use Ada.Strings.Wide_Wide_Unbounded.Aux;
+      use GNATCOLL.Iconv;
+
+      Buffer_Access : Big_Wide_Wide_String_Access;
+      Length        : Natural;
+      --  Buffer internals, to avoid costly buffer copies
+   begin
+      Get_Wide_Wide_String (Buffer.Content, Buffer_Access, Length);
+
+      --  GNATCOLL.Iconv raises a Constraint_Error for empty strings: handle
+      --  them here.
+      if Length = 0 then
+         return;
+      end if;
+
+      declare
+         To_Convert_String : constant String (1 .. 4 * Length)
+            with Import     => True,
+                 Convention => Ada,
+                 Address    => Buffer_Access.all'Address;
+
+         Output_Buffer : String_Access :=
+            new String (1 .. 4 * To_Convert_String'Length);
+         --  Encodings should not take more than 4 bytes per code point, so
+         --  this should be enough to hold the conversion.
+
+         Input_Index  : Positive := To_Convert_String'First;
+         Output_Index : Positive := Output_Buffer'First;
+         Status       : Iconv_Result;
+      begin
+         --  Keep using the same Iconv state across chunks, so that stateful
+         --  encodings (byte order marks, ...) are handled as if the text was
+         --  converted at once.
+         Iconv
+           (Buffer.Encoder, To_Convert_String, Input_Index,
+            Output_Buffer.all, Output_Index, Status);
+         case Status is
+            when Success => null;
+            when others => raise Program_Error with "cannot encode result";
+         end case;
+
+         Buffer.Sink.Write
+           (Output_Buffer (Output_Buffer'First .. Output_Index - 1));
+         Free (Output_Buffer);
+      exception
+         when others =>
+            Free (Output_Buffer);
+            raise;
+      end;
+
+      Set_Unbounded_Wide_Wide_String (Buffer.Content, "");
+   end Flush;
+
    -------------------------
    -- Apply_Spacing_Rules --
    -------------------------
@@ -471,7 +542,7 @@ package body ${ada_lib_name}.Unparsing_Implementation is
      (Buffer     : in out Unparsing_Buffer;
       Next_Token : Token_Kind) is
    begin
-      if Length (Buffer.Content) = 0 then
+      if Buffer.Is_Empty then
          null;
 
       elsif Token_Newline_Table (Buffer.Last_Token) then
@@ -494,7 +565,7 @@ package body ${ada_lib_name}.Unparsing_Implementation is
       Unit                : Internal_Unit;
       Preserve_Formatting : Boolean;
       As_Unit             : Boolean;
-      Result              : out Unparsing_Buffer) is
+      Result              : in out Unparsing_Buffer) is
    begin
       --  Unparse Node, and the leading trivia if we are unparsing the unit as
       --  a whole.
@@ -630,6 +701,122 @@ package body ${ada_lib_name}.Unparsing_Implementation is
       % endif
    end Unparse;
 
+   -------------
+   -- Unparse --
+   -------------
+
+   procedure Unparse
+     (Node                : Abstract_Node;
+      Unit                : Internal_Unit;
+      Preserve_Formatting : Boolean;
+      As_Unit             : Boolean;
+      Sink                : Unparsing_Sink_Access)
+   is
+      use GNATCOLL.Iconv;
+
+      Buffer : Unparsing_Buffer;
+   begin
+      % if ctx.generate_unparser:
+         if Is_Null (Node) then
+            raise Program_Error with "cannot unparse null node";
+         elsif As_Unit and then Unit = null then
+            raise Program_Error
+              with "cannot unparse node as unit without a unit";
+         end if;
+
+         Buffer.Sink := Sink;
+         Buffer.Encoder := Iconv_Open
+           (To_Code   => Get_Charset (Unit),
+            From_Code => Text_Charset);
+         begin
+            Unparse (Node, Unit, Preserve_Formatting, As_Unit, Buffer);
+            Flush (Buffer);
+         exception
+            when others =>
+               Iconv_Close (Buffer.Encoder);
+               raise;
+         end;
+         Iconv_Close (Buffer.Encoder);
+      % else:
+         pragma Unreferenced (Buffer);
+         raise Program_Error with "Unparser not generated";
+      % endif
+   end Unparse;
+
+   -------------
+   -- Unparse --
+   -------------
+
+   procedure Unparse
+     (Node                : Abstract_Node;
+      Unit                : Internal_Unit;
+      Preserve_Formatting : Boolean;
+      As_Unit             : Boolean;
+      Callback            : access procedure (Bytes : String))
+   is
+      type Callback_Sink is new Unparsing_Sink with null record;
+
+      overriding procedure Write (Self : in out Callback_Sink; Bytes : String);
+
+      -----------
+      -- Write --
+      -----------
+
+      overriding procedure Write (Self : in out Callback_Sink; Bytes : String)
+      is
+         pragma Unreferenced (Self);
+      begin
+         Callback (Bytes);
+      end Write;
+
+      Sink : aliased Callback_Sink;
+   begin
+      Unparse
+        (Node, Unit, Preserve_Formatting, As_Unit,
+         Sink => Sink'Unchecked_Access);
+   end Unparse;
+
+   ---------------------
+   -- Unparse_To_File --
+   ---------------------
+
+   procedure Unparse_To_File
+     (Node                : Abstract_Node;
+      Unit                : Internal_Unit;
+      Preserve_Formatting : Boolean;
+      As_Unit             : Boolean;
+      Filename            : String)
+   is
+      use Ada.Streams.Stream_IO;
+
+      File : File_Type;
+
+      procedure Write (Bytes : String);
+      --  Append Bytes to File
+
+      -----------
+      -- Write --
+      -----------
+
+      procedure Write (Bytes : String) is
+      begin
+         String'Write (Stream (File), Bytes);
+      end Write;
+
+   begin
+      Create (File, Out_File, Filename);
+      begin
+         Unparse
+           (Node, Unit, Preserve_Formatting, As_Unit,
+            Callback => Write'Access);
+      exception
+         when others =>
+            Close (File);
+            raise;
+      end;
+      Close (File);
+   end Unparse_To_File;
+
    ------------------
    -- Unparse_Node --
    ------------------
@@ -810,10 +997,10 @@ package body ${ada_lib_name}.Unparsing_Implementation is
    ----------------------------
 
    procedure Unparse_Token_Sequence
-     (Unparser : Token_Sequence_Access;
+     (Unparser : Token_Sequence;
       Result   : in out Unparsing_Buffer) is
    begin
-      for U of Unparser.all loop
+      for U of Token_Unparsers (Unparser.First .. Unparser.Last) loop
          Unparse_Token (U, Result);
       end loop;
    end Unparse_Token_Sequence;
@@ -915,43 +1102,49 @@ package body ${ada_lib_name}.Unparsing_Implementation is
                if tok.match_text else 'null')});
       % endfor
 
+      <% flat_tokens = ctx.unparsers.token_sequence_unparsers.flat_tokens %>
+      Token_Unparsers_Array : aliased constant Token_Unparser_Array := (
+         % if flat_tokens:
+            ${', '.join(
+               '{} => {}'.format(i, tok.var_name)
+               for i, tok in enumerate(flat_tokens, 1))}
+         % else:
+            1 .. 0 => <>
+         % endif
+      );
+
       % for tok_seq in ctx.unparsers.token_sequence_unparsers:
          % if tok_seq:
-            ${tok_seq.var_name} : aliased constant Token_Sequence := \
-              (${', '.join(
-                  '{} => {}'.format(i, tok.var_name)
-                  for i, tok in enumerate(tok_seq.tokens, 1))});
+            ${tok_seq.var_name} : constant Token_Sequence := \
+              (First => ${tok_seq.first}, Last => ${tok_seq.last});
          % endif
       % endfor
 
-      ## Emit constants for lists of field unparsers
-
-      % for node in ctx.astnode_types:
-         % if is_regular_node_unparser(node.unparser) \
-              and node.unparser.field_unparsers:
-
-            <%
-               unparser_list = node.unparser.zip_fields
-               field_unparsers = [
-                  ('{} => Empty_Field_Unparser'.format(i)
-                   if not f.pre_tokens and not f.post_tokens else
-                   "{} => ({}'Access, {}'Access, {})".format(
-                        i, f.pre_tokens.var_name, f.post_tokens.var_name,
-                        f.empty_list_is_absent))
-                  for i, (f, _) in enumerate(unparser_list, 1)
-               ]
-               inter_tokens = [
-                  "{} => {}'Access".format(i, tok_seq.var_name)
-                  for i, (_, tok_seq) in enumerate(unparser_list, 1)
-               ]
-            %>
-
-            ${node.unparser.fields_unparser_var_name} \
-               : aliased constant Field_Unparser_List \
-               := (N => ${len(unparser_list)},
-                   Field_Unparsers => (${', '.join(field_unparsers)}),
-                   Inter_Tokens => (${', '.join(inter_tokens)}));
-         % endif
+      ## Emit constants for lists of field unparsers. Nodes that have the same
+      ## list share the same constant.
+
+      % for unparser in ctx.unparsers.field_unparser_lists:
+         <%
+            unparser_list = unparser.zip_fields
+            field_unparsers = [
+               ('{} => Empty_Field_Unparser'.format(i)
+                if not f.pre_tokens and not f.post_tokens else
+                "{} => ({}, {}, {})".format(
+                     i, f.pre_tokens.var_name, f.post_tokens.var_name,
+                     f.empty_list_is_absent))
+               for i, (f, _) in enumerate(unparser_list, 1)
+            ]
+            inter_tokens = [
+               "{} => {}".format(i, tok_seq.var_name)
+               for i, (_, tok_seq) in enumerate(unparser_list, 1)
+            ]
+         %>
+
+         ${unparser.fields_unparser_var_name} \
+            : aliased constant Field_Unparser_List \
+            := (N => ${len(unparser_list)},
+                Field_Unparsers => (${', '.join(field_unparsers)}),
+                Inter_Tokens => (${', '.join(inter_tokens)}));
       % endfor
 
       ## Finally, emit the unparsing table for nodes themselves
@@ -966,12 +1159,10 @@ package body ${ada_lib_name}.Unparsing_Implementation is
                   if is_regular_node_unparser(unparser):
                      fields += [
                         ('Kind', 'Regular'),
-                        ('Pre_Tokens', "{}'Access".format(
-                           unparser.pre_tokens.var_name)),
+                        ('Pre_Tokens', unparser.pre_tokens.var_name),
                         ('Field_Unparsers', "{}'Access".format(
                            unparser.fields_unparser_var_name)),
-                        ('Post_Tokens', "{}'Access".format(
-                           unparser.post_tokens.var_name)),
+                        ('Post_Tokens', unparser.post_tokens.var_name),
                      ]
 
                   elif is_list_node_unparser(unparser):
@@ -1007,6 +1198,8 @@ package body ${ada_lib_name}.Unparsing_Implementation is
    % endif
 
 begin
+   Token_Unparsers := ${("Token_Unparsers_Array'Access"
+                         if ctx.generate_unparser else 'null')};
    Node_Unparsers := ${("Node_Unparsers_Array'Access"
                         if ctx.generate_unparser else 'null')};
 end ${ada_lib_name}.Unparsing_Implementation;
@@ -3,6 +3,8 @@
 with Ada.Strings.Unbounded;           use Ada.Strings.Unbounded;
 with Ada.Strings.Wide_Wide_Unbounded; use Ada.Strings.Wide_Wide_Unbounded;
 
+with GNATCOLL.Iconv;
+
 with ${ada_lib_name}.Common;         use ${ada_lib_name}.Common;
 with ${ada_lib_name}.Implementation; use ${ada_lib_name}.Implementation;
 with ${ada_lib_name}.Rewriting_Implementation;
@@ -60,16 +62,38 @@ private package ${ada_lib_name}.Unparsing_Implementation is
    --  return the original node (i.e. of which Node is a rewritten version), or
    --  null if there is no original node.
 
+   type Unparsing_Sink is limited interface;
+   type Unparsing_Sink_Access is access all Unparsing_Sink'Class;
+
+   procedure Write (Self : in out Unparsing_Sink; Bytes : String) is abstract;
+   --  Process Bytes, which is the next chunk of encoded unparsed text
+
+   Flush_Threshold : constant := 16 * 1024;
+   --  When unparsing to a sink, number of characters to accumulate before
+   --  sending them to the sink.
+
    type Unparsing_Buffer is limited record
       Content : Unbounded_Wide_Wide_String;
-      --  Append-only text buffer for the unparsed tree
+      --  Append-only text buffer for the unparsed tree. If Sink is not null,
+      --  this contains only the text that is not sent to Sink yet.
 
       Last_Sloc : Source_Location := (1, 1);
       --  Source location of the next character to append to Content
 
       Last_Token : Token_Kind;
-      --  If Content is not emply, kind of the last token/trivia that was
+      --  If Is_Empty is false, kind of the last token/trivia that was
       --  unparsed. Undefined otherwise.
+
+      Is_Empty : Boolean := True;
+      --  Whether no text has been unparsed so far
+
+      Sink : Unparsing_Sink_Access;
+      --  If not null, destination for the unparsed text: Append sends the
+      --  content of this buffer (encoded with Encoder) to Sink when it grows
+      --  larger than Flush_Threshold.
+
+      Encoder : GNATCOLL.Iconv.Iconv_T;
+      --  If Sink is not null, state to encode text before sending it to Sink
    end record;
 
    procedure Append
@@ -94,7 +118,7 @@ private package ${ada_lib_name}.Unparsing_Implementation is
       Unit                : Internal_Unit;
       Preserve_Formatting : Boolean;
       As_Unit             : Boolean;
-      Result              : out Unparsing_Buffer);
+      Result              : in out Unparsing_Buffer);
    --  Turn the Node tree into a buffer that can be re-parsed to yield the same
    --  tree (source locations excepted).
    --
@@ -128,6 +152,33 @@ private package ${ada_lib_name}.Unparsing_Implementation is
       As_Unit             : Boolean) return Unbounded_Text_Type;
    --  Likewise, but return an unbounded text value
 
+   procedure Unparse
+     (Node                : Abstract_Node;
+      Unit                : Internal_Unit;
+      Preserve_Formatting : Boolean;
+      As_Unit             : Boolean;
+      Sink                : Unparsing_Sink_Access);
+   --  Likewise, but send the result to Sink, in chunks, as unparsing goes.
+   --  Text is encoded the same way as in the function that returns a string.
+   --  This avoids holding the whole unparsed text in memory.
+
+   procedure Unparse
+     (Node                : Abstract_Node;
+      Unit                : Internal_Unit;
+      Preserve_Formatting : Boolean;
+      As_Unit             : Boolean;
+      Callback            : access procedure (Bytes : String));
+   --  Likewise, but call Callback on each chunk of unparsed text
+
+   procedure Unparse_To_File
+     (Node                : Abstract_Node;
+      Unit                : Internal_Unit;
+      Preserve_Formatting : Boolean;
+      As_Unit             : Boolean;
+      Filename            : String);
+   --  Likewise, but write the unparsed text to the Filename file. If this file
+   --  already exists, it is overwritten.
+
    ----------------------
    -- Unparsing tables --
    ----------------------
@@ -145,17 +196,28 @@ private package ${ada_lib_name}.Unparsing_Implementation is
       --  for that token.
    end record;
 
-   type Token_Sequence is array (Positive range <>) of Token_Unparser;
-   type Token_Sequence_Access is access constant Token_Sequence;
-   type Token_Sequence_Access_Array is
-      array (Positive range <>) of Token_Sequence_Access;
+   type Token_Unparser_Array is array (Positive range <>) of Token_Unparser;
+   type Token_Unparser_Array_Access is access constant Token_Unparser_Array;
+
+   type Token_Sequence is record
+      First : Positive;
+      Last  : Natural;
+   end record;
+   --  Sequence of token unparsers, as the Token_Unparsers (First .. Last)
+   --  slice. Sequences are hash-consed and can overlap in this table.
 
-   Empty_Token_Sequence : aliased constant Token_Sequence := (1 .. 0 => <>);
+   type Token_Sequence_Array is array (Positive range <>) of Token_Sequence;
+
+   Empty_Token_Sequence : constant Token_Sequence := (First => 1, Last => 0);
+
+   function Length (Sequence : Token_Sequence) return Natural
+   is (Sequence.Last - Sequence.First + 1);
+   --  Return the number of token unparsers in Sequence
 
    --  At the node field level
 
    type Field_Unparser is record
-      Pre_Tokens, Post_Tokens : Token_Sequence_Access;
+      Pre_Tokens, Post_Tokens : Token_Sequence;
       --  Lists of tokens to emit before, and after unparsing some node field
 
       Empty_List_Is_Absent : Boolean;
@@ -166,19 +228,20 @@ private package ${ada_lib_name}.Unparsing_Implementation is
    type Field_Unparser_Array is array (Positive range <>) of Field_Unparser;
 
    Empty_Field_Unparser : aliased constant Field_Unparser :=
-     (Empty_Token_Sequence'Access, Empty_Token_Sequence'Access, False);
+     (Empty_Token_Sequence, Empty_Token_Sequence, False);
 
    type Field_Unparser_List (N : Natural) is record
       Field_Unparsers : Field_Unparser_Array (1 .. N);
       --  For each field in the node, describe how to unparse it when it's
       --  present. Nothing must be emitted when it's absent.
 
-      Inter_Tokens    : Token_Sequence_Access_Array (1 .. N);
+      Inter_Tokens    : Token_Sequence_Array (1 .. N);
       --  Inter_Tokens (I) specifies the list of tokens to emit after unparsing
       --  field I-1 and field I. When it exists, Inter_Tokens (1) is always
-      --  Empty_Token_Sequence'Access.
+      --  Empty_Token_Sequence.
    end record;
-   --  Unparsing table for the fields corresponding to a specific regular node
+   --  Unparsing table for the fields corresponding to a specific regular
+   --  node. Nodes that have the same table share the same object.
 
    type Field_Unparser_List_Access is access constant Field_Unparser_List;
 
@@ -192,13 +255,13 @@ private package ${ada_lib_name}.Unparsing_Implementation is
    type Node_Unparser (Kind : Node_Unparser_Kind := Regular) is record
       case Kind is
          when Regular =>
-            Pre_Tokens : Token_Sequence_Access;
+            Pre_Tokens : Token_Sequence;
             --  List of tokens to emit first when unparsing this node
 
             Field_Unparsers : Field_Unparser_List_Access;
             --  Description of how to unparse fields
 
-            Post_Tokens : Token_Sequence_Access;
+            Post_Tokens : Token_Sequence;
             --  List of tokens to emit after fields are unparsed
 
          when List =>
@@ -222,6 +285,10 @@ private package ${ada_lib_name}.Unparsing_Implementation is
    type Node_Unparser_Map is array (${T.node_kind}) of Node_Unparser;
    type Node_Unparser_Map_Access is access constant Node_Unparser_Map;
 
+   Token_Unparsers : Token_Unparser_Array_Access;
+   --  Flat table for all token unparsers: token sequences designate slices
+   --  of it.
+
    Node_Unparsers : Node_Unparser_Map_Access;
    --  Unparsing table, describing how to unparse all parse nodes in
    --  ${ctx.lang_name}.
@@ -12,4 +12,18 @@ package ${ada_lib_name}.Unparsing is
    --
    --  Note that this requires that Node's unit has no parsing error.
 
+   procedure Unparse
+     (Node  : ${root_entity.api_name}'Class;
+      Write : access procedure (Bytes : String))
+      with Pre => not Node.Unit.Has_Diagnostics;
+   --  Likewise, but instead of returning the whole unparsed text at once,
+   --  call Write on consecutive chunks of it as unparsing goes. This avoids
+   --  holding the whole result in memory.
+
+   procedure Unparse_To_File
+     (Node : ${root_entity.api_name}'Class; Filename : String)
+      with Pre => not Node.Unit.Has_Diagnostics;
+   --  Likewise, but write the result to the Filename file. If this file
+   --  already exists, it is overwritten.
+
 end ${ada_lib_name}.Unparsing;
@@ -6,6 +6,7 @@
 ## Regular property function
 
 <% has_logging = ctx.properties_logging and property.activate_tracing %>
+<% profiled = ctx.has_property_profiling %>
 
 
 % if property.abstract_runtime_check:
@@ -138,6 +139,10 @@ begin
    ## Because they can be used this way in equation solving, properties must
    ## not crash when called on a null node.
    if Self /= null then
+      % if profiled:
+         Enter_Profiled_Property
+           (Self.Unit.Context, ${property.profiling_enum});
+      % endif
       Enter_Call (Self.Unit.Context, Call_Depth'Access);
    end if;
 
@@ -218,6 +223,12 @@ begin
                   Properties_Traces.Decrease_Indent;
                % endif
                ${gdb_memoization_return()}
+               % if profiled:
+                  Exit_Profiled_Property
+                    (Self.Unit.Context,
+                     ${property.profiling_enum},
+                     Memoization_Hit => True);
+               % endif
                Exit_Call (Self.Unit.Context, Call_Depth);
                return Property_Result;
             end if;
@@ -304,6 +315,10 @@ begin
    % endif
 
    if Self /= null then
+      % if profiled:
+         Exit_Profiled_Property
+           (Self.Unit.Context, ${property.profiling_enum});
+      % endif
       Exit_Call (Self.Unit.Context, Call_Depth);
    end if;
    return Property_Result;
@@ -349,6 +364,10 @@ exception
       % endif
 
       if Self /= null then
+         % if profiled:
+            Exit_Profiled_Property
+              (Self.Unit.Context, ${property.profiling_enum});
+         % endif
          Exit_Call (Self.Unit.Context, Call_Depth);
       end if;
       raise;
@@ -356,6 +375,10 @@ exception
 
    when others =>
       if Self /= null then
+         % if profiled:
+            Exit_Profiled_Property
+              (Self.Unit.Context, ${property.profiling_enum});
+         % endif
          Exit_Call (Self.Unit.Context, Call_Depth);
       end if;
       raise;
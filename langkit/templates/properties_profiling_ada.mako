@@ -0,0 +1,455 @@
+## vim: filetype=makoada
+
+<%def name="decl()">
+<% props = ctx.profiled_properties %>
+
+type Profiled_Property is
+  (${',\n   '.join(p.profiling_enum for p in props)});
+--  Enumeration of all the properties that the properties profiler
+--  instruments.
+
+subtype Profile_Counter is Long_Long_Integer
+   range 0 .. Long_Long_Integer'Last;
+
+type Property_Profile_Counters is record
+   Calls : Profile_Counter := 0;
+   --  Number of calls to the property
+
+   Memoization_Hits : Profile_Counter := 0;
+   --  Number of calls whose result was found in memoization tables
+
+   Inclusive_Time : Duration := 0.0;
+   --  Time spent in the property, including the time spent in the properties
+   --  it called. Recursive calls are counted only once.
+
+   Exclusive_Time : Duration := 0.0;
+   --  Time spent in the property, excluding the time spent in the properties
+   --  it called.
+
+   Active_Calls : Natural := 0;
+   --  Number of calls to this property currently running. Used to avoid
+   --  counting the inclusive time of recursive calls multiple times.
+end record;
+
+type Property_Profile_Counters_Array is
+   array (Profiled_Property) of Property_Profile_Counters;
+
+type Property_Call_Node is record
+   Property : Profiled_Property;
+   --  Property called
+
+   Parent : Natural;
+   --  Index of the node for the caller in the call tree, or 0 if this
+   --  property was called from outside properties.
+
+   Exclusive_Time : Duration := 0.0;
+   --  Time spent in the property for this call path, excluding the time
+   --  spent in the properties it called.
+end record;
+--  Node in the tree of property call paths. Each node designates a unique
+--  call path: its property and the chain of its parents.
+
+package Property_Call_Node_Vectors is new Langkit_Support.Vectors
+  (Property_Call_Node);
+
+type Property_Call_Key is record
+   Parent   : Natural;
+   Property : Profiled_Property;
+end record;
+
+function Hash (Key : Property_Call_Key) return Hash_Type;
+
+package Property_Call_Maps is new Ada.Containers.Hashed_Maps
+  (Key_Type        => Property_Call_Key,
+   Element_Type    => Positive,
+   Hash            => Hash,
+   Equivalent_Keys => "=");
+
+type Property_Profile_Frame is record
+   Property : Profiled_Property;
+   --  Property for this running call
+
+   Node : Positive;
+   --  Index of the call tree node for this call
+
+   Start : Ada.Real_Time.Time;
+   --  Time at which the call started
+
+   Children_Time : Duration;
+   --  Time spent so far in the properties this call made
+end record;
+
+package Property_Profile_Frame_Vectors is new Langkit_Support.Vectors
+  (Property_Profile_Frame);
+
+type Property_Profile_Type is record
+   Counters : Property_Profile_Counters_Array;
+   --  Aggregated counters for each property
+
+   Call_Nodes : Property_Call_Node_Vectors.Vector;
+   --  Tree of call paths (see Property_Call_Node)
+
+   Call_Node_Map : Property_Call_Maps.Map;
+   --  Index of Call_Nodes: associate each (parent, property) couple with the
+   --  corresponding node.
+
+   Frames : Property_Profile_Frame_Vectors.Vector;
+   --  Stack of running property calls
+end record;
+--  Profiling data for the properties that run in an analysis context
+
+procedure Enter_Profiled_Property
+  (Context : Internal_Context; Property : Profiled_Property);
+--  Record the start of a call to Property in Context's profile
+
+procedure Exit_Profiled_Property
+  (Context         : Internal_Context;
+   Property        : Profiled_Property;
+   Memoization_Hit : Boolean := False);
+--  Record the end of a call to Property in Context's profile.
+--  Memoization_Hit must be whether the call returned a memoized result.
+
+procedure Reset_Property_Profile (Context : Internal_Context);
+--  Clear all data in Context's properties profile
+
+procedure Destroy (Profile : in out Property_Profile_Type);
+--  Free all resources allocated for Profile
+
+function Property_Profile_Image
+  (Context : Internal_Context;
+   Format  : Property_Profile_Format) return String;
+--  Implementation for Analysis.Property_Profile
+</%def>
+
+<%def name="body()">
+<% props = ctx.profiled_properties %>
+
+% for p in props:
+Name_For_${p.profiling_enum} : aliased constant String :=
+   ${string_repr(p.qualname)};
+% if p.profiling_location:
+Location_For_${p.profiling_enum} : aliased constant String :=
+   ${string_repr(p.profiling_location)};
+% endif
+% endfor
+
+type Profiled_Property_Info is record
+   Name, Location : access constant String;
+   --  Qualified name and DSL source location for the property. Location is
+   --  null if unknown.
+
+   Memoized : Boolean;
+   --  Whether the property is memoized
+end record;
+
+Profiled_Properties : constant array (Profiled_Property)
+                      of Profiled_Property_Info := (
+   % for p in props:
+      ${p.profiling_enum} =>
+        (Name     => Name_For_${p.profiling_enum}'Access,
+         Location => ${("Location_For_{}'Access".format(p.profiling_enum)
+                        if p.profiling_location else 'null')},
+         Memoized => ${p.memoized and not p.is_dispatcher})${
+            ',' if not loop.last else ''}
+   % endfor
+);
+
+function JSON_String (S : String) return String;
+--  Return a JSON string literal for S
+
+----------
+-- Hash --
+----------
+
+function Hash (Key : Property_Call_Key) return Hash_Type is
+begin
+   return Combine (Hash_Type (Key.Parent),
+                   Hash_Type (Profiled_Property'Pos (Key.Property)));
+end Hash;
+
+-----------------------------
+-- Enter_Profiled_Property --
+-----------------------------
+
+procedure Enter_Profiled_Property
+  (Context : Internal_Context; Property : Profiled_Property)
+is
+   Profile  : Property_Profile_Type renames Context.Property_Profile;
+   Counters : Property_Profile_Counters renames Profile.Counters (Property);
+   Parent   : constant Natural :=
+     (if Profile.Frames.Is_Empty
+      then 0
+      else Profile.Frames.Get (Profile.Frames.Last_Index).Node);
+   Key      : constant Property_Call_Key := (Parent, Property);
+   Cur      : constant Property_Call_Maps.Cursor :=
+     Profile.Call_Node_Map.Find (Key);
+   Node     : Positive;
+begin
+   --  Look for the call tree node for this call path, create it if needed
+
+   if Property_Call_Maps.Has_Element (Cur) then
+      Node := Property_Call_Maps.Element (Cur);
+   else
+      Profile.Call_Nodes.Append
+        ((Property => Property, Parent => Parent, Exclusive_Time => 0.0));
+      Node := Profile.Call_Nodes.Last_Index;
+      Profile.Call_Node_Map.Insert (Key, Node);
+   end if;
+
+   Counters.Calls := Counters.Calls + 1;
+   Counters.Active_Calls := Counters.Active_Calls + 1;
+
+   --  Read the clock last so that the time spent in bookkeeping is not
+   --  accounted to this property.
+
+   Profile.Frames.Append
+     ((Property      => Property,
+       Node          => Node,
+       Start         => Ada.Real_Time.Clock,
+       Children_Time => 0.0));
+end Enter_Profiled_Property;
+
+----------------------------
+-- Exit_Profiled_Property --
+----------------------------
+
+procedure Exit_Profiled_Property
+  (Context         : Internal_Context;
+   Property        : Profiled_Property;
+   Memoization_Hit : Boolean := False)
+is
+   use type Ada.Real_Time.Time;
+
+   Stop    : constant Ada.Real_Time.Time := Ada.Real_Time.Clock;
+   Profile : Property_Profile_Type renames Context.Property_Profile;
+begin
+   --  Be defensive against unbalanced calls: they can happen only if an
+   --  unexpected exception interrupted the instrumentation code.
+
+   if Profile.Frames.Is_Empty
+      or else Profile.Frames.Get (Profile.Frames.Last_Index).Property
+              /= Property
+   then
+      return;
+   end if;
+
+   declare
+      Frame    : constant Property_Profile_Frame := Profile.Frames.Pop;
+      Counters : Property_Profile_Counters renames
+        Profile.Counters (Property);
+      Node     : Property_Call_Node renames
+        Profile.Call_Nodes.Get_Access (Frame.Node).all;
+
+      Inclusive : constant Duration :=
+        Ada.Real_Time.To_Duration (Stop - Frame.Start);
+      Exclusive : constant Duration := Inclusive - Frame.Children_Time;
+   begin
+      Counters.Active_Calls := Counters.Active_Calls - 1;
+      if Counters.Active_Calls = 0 then
+         Counters.Inclusive_Time := Counters.Inclusive_Time + Inclusive;
+      end if;
+      Counters.Exclusive_Time := Counters.Exclusive_Time + Exclusive;
+      if Memoization_Hit then
+         Counters.Memoization_Hits := Counters.Memoization_Hits + 1;
+      end if;
+
+      Node.Exclusive_Time := Node.Exclusive_Time + Exclusive;
+
+      --  Account the time spent in this call to the caller, if any
+
+      if not Profile.Frames.Is_Empty then
+         declare
+            Caller : Property_Profile_Frame renames
+              Profile.Frames.Get_Access (Profile.Frames.Last_Index).all;
+         begin
+            Caller.Children_Time := Caller.Children_Time + Inclusive;
+         end;
+      end if;
+   end;
+end Exit_Profiled_Property;
+
+----------------------------
+-- Reset_Property_Profile --
+----------------------------
+
+procedure Reset_Property_Profile (Context : Internal_Context) is
+   Profile : Property_Profile_Type renames Context.Property_Profile;
+begin
+   Profile.Counters := (others => <>);
+   Profile.Call_Nodes.Clear;
+   Profile.Call_Node_Map.Clear;
+   Profile.Frames.Clear;
+end Reset_Property_Profile;
+
+-------------
+-- Destroy --
+-------------
+
+procedure Destroy (Profile : in out Property_Profile_Type) is
+begin
+   Profile.Call_Nodes.Destroy;
+   Profile.Call_Node_Map.Clear;
+   Profile.Frames.Destroy;
+end Destroy;
+
+-----------------
+-- JSON_String --
+-----------------
+
+function JSON_String (S : String) return String is
+   Result : Unbounded_String;
+begin
+   Append (Result, '"');
+   for C of S loop
+      case C is
+         when '"' | '\' =>
+            Append (Result, '\');
+            Append (Result, C);
+         when ASCII.NUL .. Character'Val (16#1F#) =>
+            Append (Result, ' ');
+         when others =>
+            Append (Result, C);
+      end case;
+   end loop;
+   Append (Result, '"');
+   return To_String (Result);
+end JSON_String;
+
+----------------------------
+-- Property_Profile_Image --
+----------------------------
+
+function Property_Profile_Image
+  (Context : Internal_Context;
+   Format  : Property_Profile_Format) return String
+is
+   Profile : Property_Profile_Type renames Context.Property_Profile;
+   Result  : Unbounded_String;
+
+   function Image (D : Duration) return String;
+   --  Return a JSON number for D, in seconds
+
+   function Image (C : Profile_Counter) return String;
+   --  Return a JSON number for C
+
+   function Frame_Name (Property : Profiled_Property) return String;
+   --  Return the name of the flame graph frame for Property
+
+   procedure Append_Call_Path (Node : Positive);
+   --  Append to Result the semicolon-separated list of frames for the call
+   --  path that Node designates.
+
+   -----------
+   -- Image --
+   -----------
+
+   function Image (D : Duration) return String is
+      Result : constant String := Duration'Image (D);
+   begin
+      return Result (Result'First + 1 .. Result'Last);
+   end Image;
+
+   function Image (C : Profile_Counter) return String is
+      Result : constant String := Profile_Counter'Image (C);
+   begin
+      return Result (Result'First + 1 .. Result'Last);
+   end Image;
+
+   ----------------
+   -- Frame_Name --
+   ----------------
+
+   function Frame_Name (Property : Profiled_Property) return String is
+      Info : Profiled_Property_Info renames Profiled_Properties (Property);
+   begin
+      return (if Info.Location = null
+              then Info.Name.all
+              else Info.Name.all & " (" & Info.Location.all & ")");
+   end Frame_Name;
+
+   ----------------------
+   -- Append_Call_Path --
+   ----------------------
+
+   procedure Append_Call_Path (Node : Positive) is
+      N : Property_Call_Node renames Profile.Call_Nodes.Get_Access (Node).all;
+   begin
+      if N.Parent /= 0 then
+         Append_Call_Path (N.Parent);
+         Append (Result, ';');
+      end if;
+      Append (Result, Frame_Name (N.Property));
+   end Append_Call_Path;
+
+begin
+   case Format is
+      when JSON =>
+         declare
+            First : Boolean := True;
+         begin
+            Append (Result, "{""properties"": [");
+            for P in Profiled_Property loop
+               declare
+                  Info     : Profiled_Property_Info renames
+                    Profiled_Properties (P);
+                  Counters : Property_Profile_Counters renames
+                    Profile.Counters (P);
+               begin
+                  if Counters.Calls > 0 then
+                     if not First then
+                        Append (Result, ", ");
+                     end if;
+                     First := False;
+
+                     Append
+                       (Result, "{""name"": " & JSON_String (Info.Name.all));
+                     Append
+                       (Result,
+                        ", ""location"": "
+                        & (if Info.Location = null
+                           then "null"
+                           else JSON_String (Info.Location.all)));
+                     Append
+                       (Result, ", ""calls"": " & Image (Counters.Calls));
+                     Append
+                       (Result,
+                        ", ""memoized"": "
+                        & (if Info.Memoized then "true" else "false"));
+                     Append
+                       (Result,
+                        ", ""memoization_hits"": "
+                        & Image (Counters.Memoization_Hits));
+                     Append
+                       (Result,
+                        ", ""inclusive_time"": "
+                        & Image (Counters.Inclusive_Time));
+                     Append
+                       (Result,
+                        ", ""exclusive_time"": "
+                        & Image (Counters.Exclusive_Time) & "}");
+                  end if;
+               end;
+            end loop;
+            Append (Result, "]}");
+         end;
+
+      when Folded_Stacks =>
+
+         --  Emit one line per call path, with the exclusive time spent in it
+         --  as the sample count, in microseconds.
+
+         for Node in 1 .. Profile.Call_Nodes.Last_Index loop
+            declare
+               Time : constant Profile_Counter := Profile_Counter
+                 (Long_Float (Profile.Call_Nodes.Get (Node).Exclusive_Time)
+                  * 1.0E6);
+            begin
+               Append_Call_Path (Node);
+               Append (Result, ' ' & Image (Time) & ASCII.LF);
+            end;
+         end loop;
+   end case;
+
+   return To_String (Result);
+end Property_Profile_Image;
+</%def>
@@ -0,0 +1,386 @@
+## vim: filetype=makopython
+
+"""
+Asyncio front-end for the ${module_name} module.
+
+Calls to the native library can take a long time (parsing, property
+evaluation, ...) and would block the event loop if made directly from a
+coroutine. The wrappers in this module run them in an executor instead, so
+that coroutines only have to await their results:
+
+.. code-block:: python
+
+    import asyncio
+
+    from ${module_name}.aio import AsyncAnalysisContext
+
+
+    async def main():
+        ctx = AsyncAnalysisContext()
+        unit = await ctx.get_from_file('foo.txt')
+        root = await unit.root
+        print(await root.text)
+        async for token in unit.iter_tokens():
+            print(await token.kind)
+
+    asyncio.run(main())
+
+Native calls release the GIL, so calls for different analysis contexts run in
+parallel. However, an analysis context (with all its units, nodes and tokens)
+cannot be used by several threads at the same time: calls that involve the
+same context are serialized, even when they come from different event loops.
+
+Note that unlike the ${module_name} module itself, this module requires
+Python 3.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import functools
+import itertools
+import threading
+import types
+
+import ${module_name}
+
+
+_default_executor = None
+"""
+Executor for asynchronous contexts that are not given one explicitly. Created
+on demand by ``_get_default_executor``.
+
+:type: concurrent.futures.ThreadPoolExecutor|None
+"""
+
+_batch_size = 256
+"""
+Number of items that asynchronous iterators fetch from the executor at once.
+"""
+
+
+def _get_default_executor():
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = concurrent.futures.ThreadPoolExecutor(
+            thread_name_prefix='${module_name}.aio'
+        )
+    return _default_executor
+
+
+class _AsyncWrapper(object):
+    """
+    Base class for asynchronous wrappers around objects from the
+    ${module_name} module.
+
+    Properties of the wrapped object are exposed as awaitables, and its methods
+    as functions that return awaitables. All of them are evaluated in the
+    executor of the owning asynchronous context. Other attributes are exposed
+    unchanged.
+    """
+
+    _wrapped = None
+    """
+    Wrapped object. Declared here so that looking it up never goes through
+    ``__getattr__``, even during the construction of a wrapper.
+    """
+
+    def __init__(self, async_context, wrapped):
+        self._async_context = async_context
+        self._wrapped = wrapped
+
+    def __getattr__(self, name):
+        # Look for the attribute in the class first, so that we can tell
+        # properties (which we must not evaluate here) from other attributes.
+        attr = getattr(type(self._wrapped), name)
+        if isinstance(attr, property):
+            return self._async_context._call(getattr, self._wrapped, name)
+        elif callable(attr):
+            method = getattr(self._wrapped, name)
+
+            @functools.wraps(method)
+            def wrapper(*args, **kwargs):
+                return self._async_context._call(method, *args, **kwargs)
+            return wrapper
+        else:
+            return getattr(self._wrapped, name)
+
+    def __eq__(self, other):
+        return (isinstance(other, _AsyncWrapper)
+                and self._wrapped == other._wrapped)
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self._wrapped)
+
+
+class _AsyncIterator(object):
+    """
+    Asynchronous iterator over the items that a synchronous iterator yields.
+    The synchronous iterator is created and consumed in the executor of an
+    asynchronous context, fetching items in batches to limit the number of
+    round-trips to the executor.
+    """
+
+    def __init__(self, async_context, create_iterator):
+        """
+        :param AsyncAnalysisContext async_context: Context in which to run the
+            synchronous iterator.
+        :param () -> iterator create_iterator: Callback to create the
+            synchronous iterator.
+        """
+        self._async_context = async_context
+        self._create_iterator = create_iterator
+        self._iterator = None
+        self._items = collections.deque()
+        self._exhausted = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._items and not self._exhausted:
+            self._items.extend(
+                await self._async_context.run(self._fetch_batch)
+            )
+        if not self._items:
+            raise StopAsyncIteration()
+        return self._items.popleft()
+
+    def _fetch_batch(self):
+        if self._iterator is None:
+            self._iterator = iter(self._create_iterator())
+        result = [self._async_context._wrap(item)
+                  for item in itertools.islice(self._iterator, _batch_size)]
+        self._exhausted = len(result) < _batch_size
+        return result
+
+
+class AsyncAnalysisContext(_AsyncWrapper):
+    """
+    Asynchronous wrapper for an analysis context.
+
+    Note that all calls that involve the wrapped context (and its units,
+    nodes and tokens) must go through this wrapper, as this is what
+    guarantees that these calls are serialized.
+    """
+
+    def __init__(self, *args, executor=None, **kwargs):
+        """
+        Create a new analysis context and wrap it. Arguments are forwarded to
+        the ``AnalysisContext`` constructor.
+
+        :param concurrent.futures.Executor|None executor: Executor in which to
+            run native calls. If None, use an executor shared by all
+            asynchronous contexts, whose number of worker threads is bounded
+            by the default for ``concurrent.futures.ThreadPoolExecutor``.
+        """
+        super(AsyncAnalysisContext, self).__init__(
+            self, ${module_name}.AnalysisContext(*args, **kwargs)
+        )
+        self._executor = executor
+        self._lock = threading.Lock()
+        """
+        Lock to serialize calls that involve the wrapped context. It is
+        acquired in the executor, so that calls coming from different event
+        loops (or threads) are serialized as well.
+        """
+        self._loop_lock = None
+        """
+        Lock to submit at most one call at a time to the executor from a given
+        event loop, and the event loop it belongs to. This avoids having
+        several worker threads wait for ``_lock`` at the same time while they
+        could run calls for other contexts. Created on demand, as the lock is
+        bound to the loop that is running when it is created.
+
+        :type: (asyncio.AbstractEventLoop, asyncio.Lock)|None
+        """
+
+    @property
+    def context(self):
+        """
+        Wrapped analysis context.
+
+        :rtype: ${module_name}.AnalysisContext
+        """
+        return self._wrapped
+
+    async def get_from_file(self, *args, **kwargs):
+        """
+        Asynchronous version of ``AnalysisContext.get_from_file``. Return an
+        ``AsyncAnalysisUnit``.
+        """
+        return await self._call(self._wrapped.get_from_file, *args, **kwargs)
+
+    async def get_from_buffer(self, *args, **kwargs):
+        """
+        Asynchronous version of ``AnalysisContext.get_from_buffer``. Return an
+        ``AsyncAnalysisUnit``.
+        """
+        return await self._call(self._wrapped.get_from_buffer, *args,
+                                **kwargs)
+
+    async def get_from_files(self, *args, **kwargs):
+        """
+        Asynchronous version of ``AnalysisContext.get_from_files``. Return a
+        list of ``AsyncAnalysisUnit``.
+        """
+        return await self._call(self._wrapped.get_from_files, *args, **kwargs)
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Call ``func`` with the given arguments in the executor and return its
+        result, making sure that no other call for this context runs at the
+        same time. This is the way to run synchronous code that works on the
+        wrapped context, its units and its nodes.
+
+        Note that the call cannot be interrupted once started: if the awaiting
+        task is cancelled, the context stays busy until the call completes.
+        """
+        loop = asyncio.get_event_loop()
+        if self._loop_lock is None or self._loop_lock[0] is not loop:
+            self._loop_lock = (loop, asyncio.Lock())
+        lock = self._loop_lock[1]
+
+        def locked_call():
+            with self._lock:
+                return func(*args, **kwargs)
+
+        await lock.acquire()
+        try:
+            future = (self._executor or _get_default_executor()).submit(
+                locked_call
+            )
+        except BaseException:
+            lock.release()
+            raise
+
+        # Release the lock only once the call is actually over, even if the
+        # awaiting task is cancelled before that.
+        future.add_done_callback(
+            lambda _: loop.call_soon_threadsafe(lock.release)
+        )
+        return await asyncio.wrap_future(future)
+
+    async def _call(self, func, *args, **kwargs):
+        """
+        Like ``run``, but also unwrap asynchronous wrappers in arguments and
+        wrap the result.
+        """
+        args = self._unwrap(args)
+        kwargs = {k: self._unwrap(v) for k, v in kwargs.items()}
+        return await self.run(lambda: self._wrap(func(*args, **kwargs)))
+
+    def _wrap(self, value):
+        """
+        Wrap in asynchronous wrappers the units, nodes and tokens in
+        ``value``.
+        Generators are consumed and turned into lists, as they cannot be
+        consumed outside of the executor.
+        """
+        if isinstance(value, ${module_name}.${pyapi.root_astnode_name}):
+            return AsyncNode(self, value)
+        elif isinstance(value, ${module_name}.AnalysisUnit):
+            return AsyncAnalysisUnit(self, value)
+        elif isinstance(value, ${module_name}.Token):
+            return AsyncToken(self, value)
+        elif value is self._wrapped:
+            return self
+        elif isinstance(value, (list, types.GeneratorType)):
+            return [self._wrap(v) for v in value]
+        elif type(value) is tuple:
+            return tuple(self._wrap(v) for v in value)
+        else:
+            return value
+
+    @classmethod
+    def _unwrap(cls, value):
+        """
+        Return the objects that asynchronous wrappers in ``value`` wrap.
+        """
+        if isinstance(value, _AsyncWrapper):
+            return value._wrapped
+        elif type(value) in (list, tuple):
+            return type(value)(cls._unwrap(v) for v in value)
+        else:
+            return value
+
+
+class AsyncAnalysisUnit(_AsyncWrapper):
+    """
+    Asynchronous wrapper for an analysis unit.
+    """
+
+    @property
+    def unit(self):
+        """
+        Wrapped analysis unit.
+
+        :rtype: ${module_name}.AnalysisUnit
+        """
+        return self._wrapped
+
+    def iter_tokens(self):
+        """
+        Asynchronous iterator over the tokens in this unit.
+        """
+        return _AsyncIterator(self._async_context, self._wrapped.iter_tokens)
+
+
+class AsyncNode(_AsyncWrapper):
+    """
+    Asynchronous wrapper for a ${pyapi.root_astnode_name} node.
+
+    Asynchronous iteration on this wrapper yields wrappers for the children of
+    the wrapped node.
+    """
+
+    @property
+    def node(self):
+        """
+        Wrapped node.
+
+        :rtype: ${module_name}.${pyapi.root_astnode_name}
+        """
+        return self._wrapped
+
+    def __aiter__(self):
+        return _AsyncIterator(self._async_context,
+                              lambda: iter(self._wrapped))
+
+    def __repr__(self):
+        # Do not use the wrapped node's representation, as computing it
+        # requires native calls.
+        return '<AsyncNode {}>'.format(self._wrapped.kind_name)
+
+    def finditer(self, *args, **kwargs):
+        """
+        Asynchronous version of ``${pyapi.root_astnode_name}.finditer``.
+        """
+        args = AsyncAnalysisContext._unwrap(args)
+        return _AsyncIterator(
+            self._async_context,
+            lambda: self._wrapped.finditer(*args, **kwargs)
+        )
+
+
+class AsyncToken(_AsyncWrapper):
+    """
+    Asynchronous wrapper for a token.
+    """
+
+    @property
+    def token(self):
+        """
+        Wrapped token.
+
+        :rtype: ${module_name}.Token
+        """
+        return self._wrapped
+
+    def __repr__(self):
+        # Do not use the wrapped token's representation, as computing it
+        # requires native calls.
+        return '<AsyncToken at {}>'.format(self._wrapped.sloc_range)
@@ -0,0 +1,69 @@
+## vim: filetype=makopython
+
+## This template emits declarations that closely follow the ones in the module
+## that this stub describes: please refer to aio_py.mako for more details.
+
+import concurrent.futures
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, List, Optional as Opt, TypeVar
+)
+
+import ${module_name}
+
+
+<%
+    root_astnode_name = pyapi.root_astnode_name
+%>
+
+
+_T = TypeVar('_T')
+
+
+class _AsyncWrapper(object):
+    def __getattr__(self, name: str) -> Any: ...
+
+
+class AsyncAnalysisContext(_AsyncWrapper):
+    def __init__(self,
+                 *args: Any,
+                 executor: Opt[concurrent.futures.Executor] = None,
+                 **kwargs: Any) -> None: ...
+
+    @property
+    def context(self) -> ${module_name}.AnalysisContext: ...
+
+    async def get_from_file(self,
+                            *args: Any,
+                            **kwargs: Any) -> AsyncAnalysisUnit: ...
+    async def get_from_buffer(self,
+                              *args: Any,
+                              **kwargs: Any) -> AsyncAnalysisUnit: ...
+    async def get_from_files(self,
+                             *args: Any,
+                             **kwargs: Any) -> List[AsyncAnalysisUnit]: ...
+    async def run(self,
+                  func: Callable[..., _T],
+                  *args: Any,
+                  **kwargs: Any) -> _T: ...
+
+
+class AsyncAnalysisUnit(_AsyncWrapper):
+    @property
+    def unit(self) -> ${module_name}.AnalysisUnit: ...
+
+    def iter_tokens(self) -> AsyncIterator[AsyncToken]: ...
+
+
+class AsyncNode(_AsyncWrapper):
+    @property
+    def node(self) -> ${module_name}.${root_astnode_name}: ...
+
+    def __aiter__(self) -> AsyncIterator[Opt[AsyncNode]]: ...
+    def finditer(self,
+                 *args: Any,
+                 **kwargs: Any) -> AsyncIterator[AsyncNode]: ...
+
+
+class AsyncToken(_AsyncWrapper):
+    @property
+    def token(self) -> ${module_name}.Token: ...
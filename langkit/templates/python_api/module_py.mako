@@ -25,11 +25,12 @@ from __future__ import absolute_import, division, print_function
 %>
 
 
-import argparse
+import array
 import collections
 import ctypes
 import json
 import os
+import struct
 import sys
 import weakref
 
@@ -81,8 +82,12 @@ if _old_env_path is not None:
 
 def _import_func(name, argtypes, restype, exc_wrap=True):
     """
-    Import "name" from the C library, set its arguments/return types and return
-    the binding.
+    Return a binding for "name" from the C library, with the given
+    arguments/return types.
+
+    To keep the import of this module fast, the symbol is looked up and its
+    prototype is configured only when the binding is called for the first
+    time.
 
     :param str name: Name of the symbol for the function to import.
     :param list[ctypes._CData] argtypes: Types for function argruments.
@@ -91,9 +96,15 @@ def _import_func(name, argtypes, restype, exc_wrap=True):
     :param bool exc_wrap: If True, wrap the returned function to check for
       exceptions.
     """
-    func = getattr(_c_lib, name)
-    func.argtypes = argtypes
-    func.restype = restype
+    # Holder for the ctypes function, once resolved
+    func_cell = [None]
+
+    def resolve():
+        func = getattr(_c_lib, name)
+        func.argtypes = argtypes
+        func.restype = restype
+        func_cell[0] = func
+        return func
 
     def check_argcount(args, kwargs):
         argcount = len(args) + len(kwargs)
@@ -108,6 +119,7 @@ def _import_func(name, argtypes, restype, exc_wrap=True):
     if exc_wrap:
         def wrapper(*args, **kwargs):
             check_argcount(args, kwargs)
+            func = func_cell[0] or resolve()
             result = func(*args, **kwargs)
             exc = _get_last_exception()
             if exc:
@@ -116,6 +128,7 @@ def _import_func(name, argtypes, restype, exc_wrap=True):
     else:
         def wrapper(*args, **kwargs):
             check_argcount(args, kwargs)
+            func = func_cell[0] or resolve()
             return func(*args, **kwargs)
 
     return wrapper
@@ -260,6 +273,17 @@ class _text(ctypes.Structure):
         _destroy_text(ctypes.byref(self))
 
 
+class _text_view(ctypes.Structure):
+    """
+    Same layout as ``_text``, but without ownership: this is used to inspect
+    where the characters of a text live without going through ``_text``'s
+    finalizer.
+    """
+    _fields_ = [("chars", ctypes.c_void_p),
+                ("length", ctypes.c_size_t),
+                ("is_allocated", ctypes.c_int)]
+
+
 class _symbol_type(ctypes.Structure):
     _fields_ = [('data', ctypes.c_void_p),
                 ('bounds', ctypes.c_void_p)]
@@ -427,7 +451,8 @@ class AnalysisContext(object):
     ${py_doc('langkit.analysis_context_type', 4)}
 
     __slots__ = ('_c_value', '_unit_provider', '_serial_number', '_unit_cache',
-                 '__weakref__')
+                 '_node_cache_policy', '_node_cache_size',
+                 '_node_cache_statistics', '__weakref__')
 
     _context_cache = weakref.WeakValueDictionary()
     """
@@ -446,6 +471,9 @@ class AnalysisContext(object):
                  unit_provider=None,
                  with_trivia=True,
                  tab_stop=${ctx.default_tab_stop},
+                 node_cache_policy='strong',
+                 node_cache_size=None,
+                 node_cache_statistics=False,
                  _c_value=None):
         ${py_doc('langkit.create_context', 8)}
 
@@ -453,6 +481,11 @@ class AnalysisContext(object):
         # construction, so that the destructor can run later on.
         self._c_value = None
 
+        _NodeCache.check_policy(node_cache_policy, node_cache_size)
+        self._node_cache_policy = node_cache_policy
+        self._node_cache_size = node_cache_size
+        self._node_cache_statistics = node_cache_statistics
+
         if _c_value is None:
             charset = _py2to3.text_to_bytes(charset)
             if not isinstance(tab_stop, int) or tab_stop < 1:
@@ -501,6 +534,27 @@ class AnalysisContext(object):
                                                GrammarRule._unwrap(rule))
         return AnalysisUnit._wrap(c_value)
 
+    def get_from_files(self, filenames, charset=None, reparse=False,
+                       rule=default_grammar_rule, jobs=1):
+        ${py_doc('langkit.get_units_from_files', 8)}
+        if jobs is None:
+            # Importing multiprocessing is costly: do it only when needed
+            import multiprocessing
+            jobs = multiprocessing.cpu_count()
+        elif jobs < 1:
+            raise ValueError('Invalid number of jobs: {}'.format(jobs))
+
+        filenames = [_py2to3.text_to_bytes(f) for f in filenames]
+        charset = _py2to3.text_to_bytes(charset or '')
+        count = len(filenames)
+        c_filenames = (ctypes.c_char_p * count)(*filenames)
+        c_units = (AnalysisUnit._c_type * count)()
+        _get_analysis_units_from_files(self._c_value, c_filenames, count,
+                                       charset, reparse,
+                                       GrammarRule._unwrap(rule), jobs,
+                                       c_units)
+        return AnalysisUnitList(AnalysisUnit._wrap(u) for u in c_units)
+
     def get_from_buffer(self, filename, buffer, charset=None, reparse=False,
                         rule=default_grammar_rule):
         ${py_doc('langkit.get_unit_from_buffer', 8)}
@@ -534,6 +588,33 @@ class AnalysisContext(object):
         ${py_doc('langkit.context_discard_errors_in_populate_lexical_env', 8)}
         _discard_errors_in_populate_lexical_env(self._c_value, bool(discard))
 
+    @property
+    def memoization_statistics(self):
+        ${py_doc('langkit.context_memoization_statistics', 8)}
+        result = MemoizationStatistics._c_type()
+        _context_memoization_statistics(self._c_value, ctypes.byref(result))
+        return result._wrap()
+
+    % if ctx.has_property_profiling:
+    _property_profile_formats = {'json': 0, 'folded-stacks': 1}
+
+    def property_profile(self, format='json'):
+        ${py_doc('langkit.context_property_profile', 8)}
+        try:
+            c_format = self._property_profile_formats[format]
+        except KeyError:
+            raise ValueError('Invalid property profile format: {}'
+                             .format(repr(format)))
+        result = _text()
+        _context_property_profile(self._c_value, c_format,
+                                  ctypes.byref(result))
+        return result._wrap()
+
+    def reset_property_profile(self):
+        ${py_doc('langkit.context_reset_property_profile', 8)}
+        _context_reset_property_profile(self._c_value)
+    % endif
+
     class _c_struct(ctypes.Structure):
         _fields_ = [('serial_number', ctypes.c_uint64)]
     _c_type = _hashable_c_pointer(_c_struct)
@@ -559,7 +640,16 @@ class AnalysisUnit(object):
     ${py_doc('langkit.analysis_unit_type', 4)}
 
     __slots__ = ('_c_value', '_context_link', '_cache_version_number',
-                 '_node_cache')
+                 '_node_cache', '_source', '__weakref__')
+
+    _source_units = weakref.WeakValueDictionary()
+    """
+    Analysis unit wrappers whose source buffer was decoded, indexed by the
+    address of their token data handler. Tokens only know about the latter, so
+    this is how they get access to the decoded source buffer.
+
+    :type: dict[int, AnalysisUnit]
+    """
 
     class TokenIterator(object):
         ${py_doc('langkit.python.AnalysisUnit.TokenIterator', 8)}
@@ -604,12 +694,27 @@ class AnalysisUnit(object):
         :type: int
         """
 
-        self._node_cache = {}
+        self._node_cache = None
         """
-        Cache for all node wrappers in this unit. Indexed by couples:
-        (c_value, metadata, rebindings).
+        Cache for all node wrappers in this unit, following the node cache
+        policy of the owning context.
 
-        :type: dict[T, ${root_astnode_name}]
+        :type: _NodeCache
+        """
+
+        self._source = None
+        """
+        Decoded source buffer for this unit, computed on demand (see the
+        `_source_buffer` method). None if not computed yet, or a (version,
+        text, address, node_spans) tuple, where `version` is the unit version
+        for which it was computed, `address` is the address of the first
+        character in the native source buffer (None if the buffer is empty)
+        and `node_spans` maps bare nodes to the bounds of their text in
+        `text` (None if their text is not a slice of it). `node_spans` is
+        filled as node texts are requested, so that only the first request
+        for a given node, whatever its wrapper, goes to the native library.
+
+        :type: (int, unicode, int|None, dict[int, (int, int)|None])|None
         """
 
         self._check_node_cache()
@@ -666,6 +771,11 @@ class AnalysisUnit(object):
         ${py_doc('langkit.unit_text', 8)}
         return Token.text_range(self.first_token, self.last_token)
 
+    @property
+    def source_text(self):
+        ${py_doc('langkit.python.AnalysisUnit.source_text', 8)}
+        return self._source_buffer()[1]
+
     @property
     def token_count(self):
         ${py_doc('langkit.unit_token_count', 8)}
@@ -689,10 +799,78 @@ class AnalysisUnit(object):
         unit = AnalysisUnit._unwrap(self)
         _unit_dump_lexical_env(unit)
 
+    def _source_buffer(self):
+        """
+        Return the `_source` tuple for the current version of this unit,
+        decoding the source buffer if this is the first call since this unit
+        was last parsed.
+        """
+        version = self._unit_version
+        source = self._source
+        if source is None or source[0] != version:
+            c_buffer = _text_view()
+            _unit_source_buffer(self._c_value, ctypes.byref(c_buffer))
+            text = (
+                ctypes.string_at(c_buffer.chars, 4 * c_buffer.length)
+                .decode(_text.encoding)
+                if c_buffer.length else u''
+            )
+            source = (version, text, c_buffer.chars, {})
+            self._source = source
+
+            first = self.first_token
+            if first is not None:
+                tdh = first._token_data._pointer_value
+                AnalysisUnit._source_units[tdh] = self
+        return source
+
+    def _source_span(self, first, last):
+        """
+        Return the bounds of the slice of the source buffer that goes from the
+        beginning of the ``first`` text to the end of the ``last`` one (both
+        are ``_text_view`` instances). Return None if these texts are not
+        slices of the current source buffer.
+
+        :rtype: (int, int)|None
+        """
+        _, text, address, _ = self._source_buffer()
+        if address is None or not first.chars or not last.chars:
+            return None
+        start = (first.chars - address) // 4
+        end = (last.chars - address) // 4 + last.length
+        if not (0 <= start <= len(text) and 0 <= end <= len(text)):
+            return None
+        return (start, end)
+
+    def _source_slice(self, first, last):
+        """
+        Like ``_source_span``, but return the slice itself.
+
+        :rtype: unicode|None
+        """
+        span = self._source_span(first, last)
+        if span is None:
+            return None
+        return self._source_buffer()[1][span[0]:span[1]]
+
     def iter_tokens(self):
         ${py_doc('langkit.python.AnalysisUnit.iter_tokens', 8)}
         return self.TokenIterator(self.first_token)
 
+    def token_columns(self):
+        ${py_doc('langkit.python.AnalysisUnit.token_columns', 8)}
+        count = self.token_count + self.trivia_count
+        while True:
+            result = TokenColumns(count)
+            total = _unit_token_columns(self._c_value,
+                                        ctypes.byref(result._c_columns()),
+                                        count)
+            if total <= count:
+                break
+            count = total
+        result._truncate(total)
+        return result
+
     @property
     def filename(self):
         ${py_doc('langkit.unit_filename', 8)}
@@ -757,9 +935,27 @@ class AnalysisUnit(object):
         If this unit has been reparsed, invalidate its node cache.
         """
         if self._cache_version_number != self._unit_version:
-            self._node_cache = {}
+            context = self._context_link
+            self._node_cache = _NodeCache(context._node_cache_policy,
+                                          context._node_cache_size,
+                                          context._node_cache_statistics)
             self._cache_version_number = self._unit_version
 
+    @property
+    def node_cache_statistics(self):
+        ${py_doc('langkit.python.AnalysisUnit.node_cache_statistics', 8)}
+        self._check_node_cache()
+        return self._node_cache.statistics()
+
+
+class AnalysisUnitList(list):
+    ${py_doc('langkit.python.AnalysisUnitList', 4)}
+
+    @property
+    def diagnostics(self):
+        ${py_doc('langkit.python.AnalysisUnitList.diagnostics', 8)}
+        return [(unit, d) for unit in self for d in unit.diagnostics]
+
 
 class Sloc(object):
     ${py_doc('langkit.sloc_type', 4)}
@@ -878,6 +1074,255 @@ class Diagnostic(object):
             return Diagnostic(self.sloc_range._wrap(), self.message._wrap())
 
 
+class MemoizationStatistics(object):
+    ${py_doc('langkit.memoization_statistics_type', 4)}
+
+    def __init__(self, hits, misses, evictions, rejections, entries, bytes):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.rejections = rejections
+        self.entries = entries
+        self.bytes = bytes
+
+    def __repr__(self):
+        return ('<MemoizationStatistics hits={} misses={} evictions={}'
+                ' rejections={} entries={} bytes={}>'.format(
+                    self.hits, self.misses, self.evictions, self.rejections,
+                    self.entries, self.bytes
+                ))
+
+    class _c_type(ctypes.Structure):
+        _fields_ = [('hits', ctypes.c_uint64),
+                    ('misses', ctypes.c_uint64),
+                    ('evictions', ctypes.c_uint64),
+                    ('rejections', ctypes.c_uint64),
+                    ('entries', ctypes.c_uint64),
+                    ('bytes', ctypes.c_uint64)]
+
+        def _wrap(self):
+            return MemoizationStatistics(self.hits, self.misses,
+                                         self.evictions, self.rejections,
+                                         self.entries, self.bytes)
+
+
+class NodeCacheStatistics(object):
+    ${py_doc('langkit.python.NodeCacheStatistics', 4)}
+
+    def __init__(self, hits, misses, evictions, size):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.size = size
+
+    def __repr__(self):
+        return ('<NodeCacheStatistics hits={} misses={} evictions={}'
+                ' size={}>'.format(self.hits, self.misses, self.evictions,
+                                   self.size))
+
+
+class _NodeCache(object):
+    """
+    Cache for the node wrappers of an analysis unit, indexed by couples:
+    (c_value, metadata, rebindings).
+
+    Whatever the policy, the cache returns the same wrapper for a given key as
+    long as this wrapper is alive. The policy determines which wrappers the
+    cache keeps alive:
+
+    * "strong": all of them;
+    * "lru": the ``max_size`` most recently used ones;
+    * "weak": none of them.
+
+    Looking up wrappers is on the hot path of the binding, so unless the
+    policy or the collection of statistics requires more work, ``get`` and
+    ``add`` are directly the methods of the underlying dictionary.
+    """
+
+    __slots__ = ('policy', 'max_size', '_wrappers', '_live_wrappers', 'hits',
+                 'misses', 'evictions', 'get', 'add')
+
+    policies = ('strong', 'lru', 'weak')
+
+    def __init__(self, policy, max_size, count_lookups=False):
+        """
+        :param str policy: Cache policy. See check_policy.
+        :param int|None max_size: Maximum number of wrappers that the "lru"
+            policy keeps alive.
+        :param bool count_lookups: Whether to count hits and misses.
+        """
+        self.policy = policy
+        self.max_size = max_size
+
+        self._wrappers = ({} if policy == 'strong' else
+                          weakref.WeakValueDictionary())
+        """
+        Mapping from keys to wrappers. Values are weak references unless the
+        policy is "strong".
+        """
+
+        self._live_wrappers = (collections.OrderedDict()
+                               if policy == 'lru' else None)
+        """
+        For the "lru" policy, wrappers to keep alive, from the least recently
+        used to the most recently used one.
+        """
+
+        self.hits = 0 if count_lookups else None
+        self.misses = 0 if count_lookups else None
+        self.evictions = 0
+
+        self.get = (self._get
+                    if count_lookups or policy == 'lru' else
+                    self._wrappers.get)
+        """
+        Return the wrapper for a key, or None if there is no live wrapper for
+        it.
+
+        :type: (T) -> ${root_astnode_name}|None
+        """
+
+        self.add = (self._add if policy == 'lru' else
+                    self._wrappers.__setitem__)
+        """
+        Register a wrapper for a key.
+
+        :type: (T, ${root_astnode_name}) -> None
+        """
+
+    @classmethod
+    def check_policy(cls, policy, max_size):
+        """
+        Raise a ValueError if ``policy`` and ``max_size`` are not a valid
+        combination.
+        """
+        if policy not in cls.policies:
+            raise ValueError('Invalid node cache policy: {}'.format(policy))
+        elif policy == 'lru':
+            if not isinstance(max_size, int) or max_size < 1:
+                raise ValueError('Invalid node cache size (positive integer'
+                                 ' expected)')
+        elif max_size is not None:
+            raise ValueError('Node cache size is valid only for the "lru"'
+                             ' policy')
+
+    @property
+    def keeps_children(self):
+        """
+        Whether node wrappers can keep references to their children wrappers.
+        This is true only for the "strong" policy, as otherwise wrappers would
+        keep alive wrappers that the policy does not.
+        """
+        return self.policy == 'strong'
+
+    def _get(self, key):
+        """
+        Implementation of ``get`` for the "lru" policy and when counting
+        lookups.
+        """
+        result = self._wrappers.get(key)
+        if result is None:
+            if self.misses is not None:
+                self.misses += 1
+        else:
+            if self.hits is not None:
+                self.hits += 1
+            if self._live_wrappers is not None:
+                self._keep_alive(key, result)
+        return result
+
+    def _add(self, key, wrapper):
+        """
+        Implementation of ``add`` for the "lru" policy.
+        """
+        self._wrappers[key] = wrapper
+        self._keep_alive(key, wrapper)
+
+    def _keep_alive(self, key, wrapper):
+        """
+        Make ``wrapper`` the most recently used wrapper for the "lru" policy,
+        evicting the least recently used one if the cache is full.
+        """
+        live_wrappers = self._live_wrappers
+        live_wrappers.pop(key, None)
+        live_wrappers[key] = wrapper
+        if len(live_wrappers) > self.max_size:
+            live_wrappers.popitem(last=False)
+            self.evictions += 1
+
+    def statistics(self):
+        """
+        :rtype: NodeCacheStatistics
+        """
+        return NodeCacheStatistics(self.hits, self.misses, self.evictions,
+                                   len(self._wrappers))
+
+
+class TokenColumns(object):
+    ${py_doc('langkit.python.TokenColumns', 4)}
+
+    _columns = (('kinds', 'i'),
+                ('start_offsets', 'I'),
+                ('end_offsets', 'I'),
+                ('start_lines', 'I'),
+                ('start_columns', 'H'),
+                ('end_lines', 'I'),
+                ('end_columns', 'H'),
+                ('is_trivia', 'B'))
+    """
+    Name and ``array`` type code for all columns. Type codes match the
+    element types in the C API structure.
+    """
+
+    __slots__ = tuple(name for name, _ in _columns)
+
+    def __init__(self, count):
+        """
+        This constructor is an implementation detail, and is not meant to be
+        used directly. Please use AnalysisUnit.token_columns instead.
+        """
+        for name, typecode in self._columns:
+            setattr(self, name, array.array(typecode, [0]) * count)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def __repr__(self):
+        return '<TokenColumns ({} tokens)>'.format(len(self))
+
+    @staticmethod
+    def kind_name(kind):
+        ${py_doc('langkit.python.TokenColumns.kind_name', 8)}
+        name = _token_kind_name(kind)
+        assert name
+        return _unwrap_str(name)
+
+    def as_numpy(self):
+        ${py_doc('langkit.python.TokenColumns.as_numpy', 8)}
+        import numpy
+
+        return {name: numpy.frombuffer(getattr(self, name), dtype=typecode)
+                for name, typecode in self._columns}
+
+    def _c_columns(self):
+        """
+        Return a C API structure that designates the arrays in this instance.
+        """
+        return self._c_type(*[getattr(self, name).buffer_info()[0]
+                               for name, _ in self._columns])
+
+    def _truncate(self, count):
+        """
+        Discard elements past the first ``count`` ones in all columns.
+        """
+        for name, _ in self._columns:
+            del getattr(self, name)[count:]
+
+    _c_type = type('_c_type', (ctypes.Structure, ), {
+        '_fields_': [(name, ctypes.c_void_p) for name, _ in _columns]
+    })
+
+
 class Token(ctypes.Structure):
     ${py_doc('langkit.token_reference_type', 4)}
 
@@ -967,6 +1412,12 @@ class Token(ctypes.Structure):
     @property
     def text(self):
         ${py_doc('langkit.token_text', 8)}
+        unit = AnalysisUnit._source_units.get(self._token_data._pointer_value)
+        if unit is not None:
+            view = self._text_view
+            result = unit._source_slice(view, view)
+            if result is not None:
+                return result
         return self._text._wrap()
 
     @classmethod
@@ -975,6 +1426,13 @@ class Token(ctypes.Structure):
         cls._check_token(first)
         cls._check_token(last)
         first._check_same_unit(last)
+        unit = AnalysisUnit._source_units.get(
+            first._token_data._pointer_value
+        )
+        if unit is not None:
+            result = unit._source_slice(first._text_view, last._text_view)
+            if result is not None:
+                return result
         result = _text()
         assert _token_range_text(ctypes.byref(first), ctypes.byref(last),
                                  ctypes.byref(result))
@@ -1024,6 +1482,13 @@ class Token(ctypes.Structure):
         ${py_doc('langkit.python.Token.to_data', 8)}
         return {"kind": "Token", "token_kind": self.kind, "text": self.text}
 
+    @property
+    def _text_view(self):
+        """
+        Return a copy of this token's text, as a ``_text_view`` instance.
+        """
+        return _text_view.from_buffer_copy(self, Token._text.offset)
+
     @property
     def _identity_tuple(self):
         """
@@ -1058,7 +1523,7 @@ class ${root_astnode_name}(object):
     is_list_type = False
     __slots__ = ('_unprotected_c_value', '_node_c_value', '_metadata',
                  '_rebindings', '_unprotected_getitem_cache', '_unit',
-                 '_unit_version')
+                 '_unit_version', '__weakref__')
 
     ${astnode_types.subclass_decls(T.root_node)}
 
@@ -1078,18 +1543,22 @@ class ${root_astnode_name}(object):
         self._rebindings = rebindings
         self._metadata = metadata
 
-        self._unprotected_getitem_cache = {}
-        """
-        Cache for the __getitem__ override.
-
-        :type: dict[int, ${root_astnode_name}]
-        """
-
         # Information to check before accessing node data that it is still
         # valid.
         self._unit = self._fetch_unit(c_value)
         self._unit_version = self._unit._unit_version
 
+        self._unprotected_getitem_cache = (
+            {} if self._unit._node_cache.keeps_children else None
+        )
+        """
+        Cache for the __getitem__ override. None if the node cache policy
+        does not allow wrappers to keep their children alive.
+
+        :type: dict[int, ${root_astnode_name}]|None
+        """
+
+
     def _check_stale_reference(self):
         # We have a reference to the owning unit, so there is no need to
         # check that the unit and the context are still valid. Just check that
@@ -1149,6 +1618,26 @@ class ${root_astnode_name}(object):
     @property
     def text(self):
         ${py_doc('langkit.node_text', 8)}
+        self._check_stale_reference()
+        _, text, _, node_spans = self._unit._source_buffer()
+        try:
+            span = node_spans[self._node_c_value]
+        except KeyError:
+            # Ghost nodes cover no token, so their text is empty: their token
+            # bounds designate the token that comes right after them.
+            # Synthetic nodes have no token at all: let the native library
+            # handle them.
+            if self.is_synthetic:
+                span = None
+            elif self.is_ghost:
+                span = (0, 0)
+            else:
+                span = self._unit._source_span(self.token_start._text_view,
+                                               self.token_end._text_view)
+            node_spans[self._node_c_value] = span
+        if span is not None:
+            return text[span[0]:span[1]]
+
         node = self._unwrap(self)
         result = _text()
         _node_text(ctypes.byref(node), ctypes.byref(result))
@@ -1162,6 +1651,34 @@ class ${root_astnode_name}(object):
         _node_image(ctypes.byref(c_node), ctypes.byref(c_result))
         return c_result._wrap()
 
+    % if ctx.generate_unparser:
+    def unparse_to(self, callback):
+        ${py_doc('langkit.node_unparse', 8)}
+        node = self._unwrap(self)
+        errors = []
+
+        def write(data, bytes_ptr, length):
+            # Exceptions cannot propagate through the C API: keep the first
+            # one to re-raise it once unparsing is done, and skip the
+            # remaining chunks.
+            if errors:
+                return
+            try:
+                callback(ctypes.string_at(bytes_ptr, length))
+            except BaseException as exc:
+                errors.append(exc)
+
+        _node_unparse(ctypes.byref(node), _unparse_callback(write), None)
+        if errors:
+            raise errors[0]
+
+    def unparse_to_file(self, filename):
+        ${py_doc('langkit.node_unparse_to_file', 8)}
+        node = self._unwrap(self)
+        filename = _py2to3.text_to_bytes(filename)
+        _node_unparse_to_file(ctypes.byref(node), filename)
+
+    % endif
     def lookup(self, sloc):
         ${py_doc('langkit.lookup_in_node', 8)}
         node = self._unwrap(self)
@@ -1178,8 +1695,7 @@ class ${root_astnode_name}(object):
 
     def __iter__(self):
         ${py_doc('langkit.python.root_node.__iter__', 8)}
-        for i in range(len(self)):
-            yield self[i]
+        return iter(self._children)
 
     def __len__(self):
         ${py_doc('langkit.python.root_node.__len__', 8)}
@@ -1196,8 +1712,9 @@ class ${root_astnode_name}(object):
         if key < 0:
             key += len(self)
 
-        if key in self._getitem_cache:
-            return self._getitem_cache[key]
+        cache = self._getitem_cache
+        if cache is not None and key in cache:
+            return cache[key]
 
         node = self._unwrap(self)
         result = ${c_entity}()
@@ -1206,17 +1723,43 @@ class ${root_astnode_name}(object):
             raise IndexError('child index out of range')
         else:
             result = ${root_astnode_name}._wrap(result)
-            self._getitem_cache[key] = result
+            if cache is not None:
+                cache[key] = result
             return result
 
+    @property
+    def _children(self):
+        """
+        Return the list of all children for this node, fetching the ones that
+        are not in the __getitem__ cache with a single C API call.
+
+        This property is for internal use only.
+
+        :rtype: list[${root_astnode_name}|None]
+        """
+        cache = self._getitem_cache
+        if cache is None:
+            cache = {}
+        node = self._unwrap(self)
+        count = _node_children_count(ctypes.byref(node))
+        if len(cache) < count:
+            c_children = (${c_entity} * count)()
+            count = _node_children_array(ctypes.byref(node), c_children, count)
+            for i in range(count):
+                if i not in cache:
+                    cache[i] = ${root_astnode_name}._wrap(c_children[i])
+        return [cache[i] for i in range(count)]
+
     def iter_fields(self):
         ${py_doc('langkit.python.root_node.iter_fields', 8)}
+        children = self._children
         if self.is_list_type:
-            for i, value in enumerate(self):
+            for i, value in enumerate(children):
                 yield ('item_{}'.format(i), value)
         else:
-            for field_name in self._field_names:
-                yield (field_name, getattr(self, '{}'.format(field_name)))
+            # Children are stored in the same order as parse fields
+            for field_name, value in zip(self._field_names, children):
+                yield (field_name, value)
 
     def dump_str(self):
         ${py_doc('langkit.python.root_node.dump_str', 8)}
@@ -1264,14 +1807,14 @@ class ${root_astnode_name}(object):
 
     def finditer(self, ast_type_or_pred, **kwargs):
         ${py_doc('langkit.python.root_node.finditer', 8)}
-        # Create a "pred" function to use as the node filter during the
-        # traversal.
+        # When looking for node types, let the native traversal find the
+        # matching nodes so that only these get wrapped. Otherwise, create a
+        # "pred" function to use as the node filter during the traversal.
+        sought_types = None
         if isinstance(ast_type_or_pred, type):
-            sought_type = ast_type_or_pred
-            pred = lambda node: isinstance(node, sought_type)
+            sought_types = (ast_type_or_pred, )
         elif isinstance(ast_type_or_pred, collections.Sequence):
-            sought_types = ast_type_or_pred
-            pred = lambda node: isinstance(node, tuple(sought_types))
+            sought_types = tuple(ast_type_or_pred)
         else:
             pred = ast_type_or_pred
 
@@ -1287,20 +1830,71 @@ class ${root_astnode_name}(object):
             else:
                 return left == right
 
+        def match_kwargs(node):
+            return all([match(getattr(node, key, None), val)
+                        for key, val in kwargs.items()])
+
         def helper(node):
-            for child in node:
+            # Traverse the tree in prefix order with an explicit stack of
+            # children lists to avoid nested generators.
+            stack = [iter(node._children)]
+            while stack:
+                try:
+                    child = next(stack[-1])
+                except StopIteration:
+                    stack.pop()
+                    continue
                 if child is not None:
-                    if pred(child):
-                        if not kwargs:
-                            yield child
-                        elif all([match(getattr(child, key, None), val)
-                                  for key, val in kwargs.items()]):
-                            yield child
-                    for c in helper(child):
-                        if c is not None:
-                            yield c
-
-        return helper(self)
+                    if pred(child) and (not kwargs or match_kwargs(child)):
+                        yield child
+                    stack.append(iter(child._children))
+
+        if sought_types is None:
+            return helper(self)
+
+        matches = self._find_kinds(sought_types)
+        if kwargs:
+            return (n for n in matches if match_kwargs(n))
+        else:
+            return matches
+
+    def _find_kinds(self, types):
+        """
+        Yield the nodes in the subtree for this node (this node excluded) that
+        are instances of the given types, in prefix order.
+
+        The traversal is done in native code, so that only matching nodes are
+        wrapped. It is resumed on demand in chunks of growing size: looking
+        only for the first match stops the traversal at that match, while
+        looking for all matches takes few native calls. This method is for
+        internal use only.
+
+        :param tuple[type] types: Types for the nodes to look for.
+        :rtype: collections.Iterator[${root_astnode_name}]
+        """
+        kinds = [kind for kind, cls in _kind_to_astnode_cls.items()
+                 if issubclass(cls, types)]
+        c_kinds = (ctypes.c_int * len(kinds))(*kinds)
+
+        last = None
+        count = 1
+        while True:
+            # Unwrap nodes for each chunk, so that we get a StaleReferenceError
+            # if the unit was reparsed since the previous one.
+            node = self._unwrap(self)
+            start = None if last is None else ctypes.byref(self._unwrap(last))
+
+            c_results = (${c_entity} * count)()
+            found = _node_find(ctypes.byref(node), c_kinds, len(kinds),
+                               start, c_results, count)
+            for i in range(found):
+                last = ${root_astnode_name}._wrap(c_results[i])
+                yield last
+            if found < count:
+                return
+
+            # Resume the search after the last match, with a bigger chunk
+            count = min(2 * count, 256)
 
     @property
     def parent_chain(self):
@@ -1336,7 +1930,7 @@ class ${root_astnode_name}(object):
     def to_data(self):
         ${py_doc('langkit.python.root_node.to_data', 8)}
         if self.is_list_type:
-            return [i.to_data() for i in self if i is not None]
+            return [i.to_data() for i in self._children if i is not None]
         else:
             return {n: v.to_data()
                     for n, v in self.iter_fields()
@@ -1348,6 +1942,105 @@ class ${root_astnode_name}(object):
         """
         return json.dumps(self.to_data())
 
+    def write_json(self, file, kind=False, sloc=False, text=False):
+        ${py_doc('langkit.python.root_node.write_json', 8)}
+        chunks = []
+
+        # Go through the tree with an explicit stack, so that deep trees do
+        # not hit the recursion limit. The stack contains JSON chunks to write
+        # and nodes to serialize, in reverse order.
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            if not isinstance(item, ${root_astnode_name}):
+                chunks.append(item)
+                if len(chunks) >= 4096:
+                    file.write(''.join(chunks))
+                    chunks = []
+                continue
+
+            extra = []
+            if kind:
+                extra.append('"@kind": {}'.format(json.dumps(item.kind_name)))
+            if sloc:
+                extra.append('"@sloc": {}'.format(
+                    json.dumps(str(item.sloc_range))
+                ))
+            if text and item.is_token_node:
+                extra.append('"@text": {}'.format(json.dumps(item.text)))
+
+            if item.is_list_type:
+                children = [c for c in item._children if c is not None]
+                if extra:
+                    parts = ['{' + ', '.join(extra) + ', "@items": [']
+                else:
+                    parts = ['[']
+                for i, child in enumerate(children):
+                    if i:
+                        parts.append(', ')
+                    parts.append(child)
+                parts.append(']}' if extra else ']')
+
+            else:
+                parts = ['{' + ', '.join(extra)]
+                sep = ', ' if extra else ''
+                for name, child in item.iter_fields():
+                    if child is not None:
+                        parts.append('{}{}: '.format(sep, json.dumps(name)))
+                        parts.append(child)
+                        sep = ', '
+                parts.append('}')
+
+            stack.extend(reversed(parts))
+
+        file.write(''.join(chunks))
+
+    def write_binary(self, file, sloc=False, text=False):
+        ${py_doc('langkit.python.root_node.write_binary', 8)}
+        chunks = []
+        flags = (1 if sloc else 0) | (2 if text else 0)
+
+        # Header: magic number, format version, flags and the table of node
+        # kinds.
+        chunks.append(b'LKBT')
+        chunks.append(struct.pack('<BBH', 1, flags, len(_kind_to_astnode_cls)))
+        for kind_code, cls in sorted(_kind_to_astnode_cls.items()):
+            name = cls._kind_name.encode('utf-8')
+            chunks.append(struct.pack('<HH', kind_code, len(name)))
+            chunks.append(name)
+
+        # Then node records, in prefix order, with an explicit stack to
+        # support deep trees.
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                chunks.append(struct.pack('<H', 0))
+                continue
+
+            children = node._children
+            chunks.append(struct.pack('<HI', _astnode_cls_to_kind[type(node)],
+                                      len(children)))
+            if sloc:
+                sr = node.sloc_range
+                chunks.append(struct.pack('<IIII',
+                                          sr.start.line, sr.start.column,
+                                          sr.end.line, sr.end.column))
+            if text:
+                if node.is_token_node:
+                    data = node.text.encode('utf-8')
+                    chunks.append(struct.pack('<I', len(data)))
+                    chunks.append(data)
+                else:
+                    chunks.append(struct.pack('<I', 0xffffffff))
+
+            stack.extend(reversed(children))
+            if len(chunks) >= 4096:
+                file.write(b''.join(chunks))
+                chunks = []
+
+        file.write(b''.join(chunks))
+
     def is_a(self, *types):
         """
         Shortcut for isinstance(self, types).
@@ -1385,16 +2078,15 @@ class ${root_astnode_name}(object):
         cache_key = (node_c_value, metadata, rebindings)
         unit = cls._fetch_unit(c_value)
         unit._check_node_cache()
-        try:
-            return unit._node_cache[cache_key]
-        except KeyError:
-            pass
+        result = unit._node_cache.get(cache_key)
+        if result is not None:
+            return result
 
         # Pick the right subclass to materialize this node in Python
         kind = _node_kind(ctypes.byref(c_value))
         result = _kind_to_astnode_cls[kind](c_value, node_c_value, metadata,
                                             rebindings)
-        unit._node_cache[cache_key] = result
+        unit._node_cache.add(cache_key, result)
         return result
 
     @classmethod
@@ -1569,6 +2261,21 @@ _discard_errors_in_populate_lexical_env = _import_func(
    '${capi.get_name("context_discard_errors_in_populate_lexical_env")}',
    [AnalysisContext._c_type, ctypes.c_int], None
 )
+_context_memoization_statistics = _import_func(
+   '${capi.get_name("context_memoization_statistics")}',
+   [AnalysisContext._c_type, ctypes.POINTER(MemoizationStatistics._c_type)],
+   None
+)
+% if ctx.has_property_profiling:
+_context_property_profile = _import_func(
+   '${capi.get_name("context_property_profile")}',
+   [AnalysisContext._c_type, ctypes.c_int, ctypes.POINTER(_text)], None
+)
+_context_reset_property_profile = _import_func(
+   '${capi.get_name("context_reset_property_profile")}',
+   [AnalysisContext._c_type], None
+)
+% endif
 _get_analysis_unit_from_file = _import_func(
     '${capi.get_name("get_analysis_unit_from_file")}',
     [AnalysisContext._c_type,  # context
@@ -1578,6 +2285,18 @@ _get_analysis_unit_from_file = _import_func(
      ctypes.c_int],            # grammar rule
     AnalysisUnit._c_type
 )
+_get_analysis_units_from_files = _import_func(
+    '${capi.get_name("get_analysis_units_from_files")}',
+    [AnalysisContext._c_type,          # context
+     ctypes.POINTER(ctypes.c_char_p),  # filenames
+     ctypes.c_int,                     # count
+     ctypes.c_char_p,                  # charset
+     ctypes.c_int,                     # reparse
+     ctypes.c_int,                     # grammar rule
+     ctypes.c_int,                     # jobs
+     ctypes.POINTER(AnalysisUnit._c_type)],  # units_p
+    None
+)
 _get_analysis_unit_from_buffer = _import_func(
     '${capi.get_name("get_analysis_unit_from_buffer")}',
     [AnalysisContext._c_type,  # context
@@ -1619,6 +2338,17 @@ _unit_trivia_count = _import_func(
     "${capi.get_name('unit_trivia_count')}",
     [AnalysisUnit._c_type], ctypes.c_int
 )
+_unit_token_columns = _import_func(
+    "${capi.get_name('unit_token_columns')}",
+    [AnalysisUnit._c_type, ctypes.POINTER(TokenColumns._c_type),
+     ctypes.c_int],
+    ctypes.c_int
+)
+_unit_source_buffer = _import_func(
+    "${capi.get_name('unit_source_buffer')}",
+    [AnalysisUnit._c_type, ctypes.POINTER(_text_view)],
+    None
+)
 _unit_lookup_token = _import_func(
     "${capi.get_name('unit_lookup_token')}",
     [AnalysisUnit._c_type,
@@ -1695,6 +2425,19 @@ _node_sloc_range = _import_func(
     '${capi.get_name("node_sloc_range")}',
     [ctypes.POINTER(${c_entity}), ctypes.POINTER(SlocRange._c_type)], None
 )
+% if ctx.generate_unparser:
+_unparse_callback = ctypes.CFUNCTYPE(
+    None, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t
+)
+_node_unparse = _import_func(
+    '${capi.get_name("node_unparse")}',
+    [ctypes.POINTER(${c_entity}), _unparse_callback, ctypes.c_void_p], None
+)
+_node_unparse_to_file = _import_func(
+    '${capi.get_name("node_unparse_to_file")}',
+    [ctypes.POINTER(${c_entity}), ctypes.c_char_p], None
+)
+% endif
 _lookup_in_node = _import_func(
     '${capi.get_name("lookup_in_node")}',
     [ctypes.POINTER(${c_entity}),
@@ -1710,6 +2453,17 @@ _node_child = _import_func(
     [ctypes.POINTER(${c_entity}), ctypes.c_uint, ctypes.POINTER(${c_entity})],
     ctypes.c_int
 )
+_node_children_array = _import_func(
+    '${capi.get_name("node_children_array")}',
+    [ctypes.POINTER(${c_entity}), ctypes.POINTER(${c_entity}), ctypes.c_uint],
+    ctypes.c_uint
+)
+_node_find = _import_func(
+    '${capi.get_name("node_find")}',
+    [ctypes.POINTER(${c_entity}), ctypes.POINTER(ctypes.c_int), ctypes.c_uint,
+     ctypes.POINTER(${c_entity}), ctypes.POINTER(${c_entity}), ctypes.c_uint],
+    ctypes.c_uint
+)
 
 % for astnode in ctx.astnode_types:
     % for field in astnode.fields_with_accessors():
@@ -1789,6 +2543,9 @@ _kind_to_astnode_cls = {
     % endfor
 }
 
+_astnode_cls_to_kind = {cls: kind
+                        for kind, cls in _kind_to_astnode_cls.items()}
+
 
 def _field_address(struct, field_name):
     """
@@ -1820,6 +2577,179 @@ def _field_address(struct, field_name):
 
 ${exts.include_extension(ctx.ext("python"))}
 
+#
+# Analysis farm
+#
+
+class AnalysisFarm(object):
+    """
+    Helper to analyze a list of files with a pool of worker processes.
+
+    Analysis contexts cannot be shared across processes, so each worker
+    creates its own analysis context (and unit provider), analyzes the files
+    it is given and sends back a picklable result for each of them. Like for
+    `App`, subclasses can customize this by overriding specific methods:
+
+    - `create_unit_provider` to return the unit provider for the analysis
+      context of a worker.
+
+    - `create_context` to create the analysis context of a worker.
+
+    - `process_unit`, which computes the result for one analysis unit. By
+      default, return a dict with the diagnostics of the unit and the
+      ``to_data()`` output for its root node.
+
+    - `report_progress`, called each time a result is received.
+
+    Then, the `run` method yields ``(filename, result)`` couples in the order
+    of the given files. For instance, to print the number of nodes in each
+    file with 4 worker processes:
+
+    .. code-block:: python
+
+        from ${module_name} import AnalysisFarm
+
+
+        class CountNodes(AnalysisFarm):
+            def process_unit(self, unit):
+                return len(unit.root.findall(lambda _: True)) + 1
+
+        if __name__ == '__main__':
+            for filename, count in CountNodes(jobs=4).run(filenames):
+                print(filename, count)
+
+    Note that depending on the platform, this instance may be pickled to be
+    sent to worker processes: its class must then be defined at the top level
+    of an importable module.
+    """
+
+    def __init__(self, jobs=None, max_units_per_worker=None,
+                 max_pending=None):
+        """
+        :param int|None jobs: Number of worker processes. If None, use as many
+            processes as there are CPUs.
+        :param int|None max_units_per_worker: If not None, replace a worker
+            process with a fresh one after it has analyzed this number of
+            files. As analysis contexts keep all their units, this caps the
+            memory used by workers.
+        :param int|None max_pending: Maximum number of files whose analysis is
+            requested but whose result was not yielded yet. This provides
+            back-pressure when the consumer of results is slower than workers.
+            If None, use twice the number of worker processes.
+        """
+        self.jobs = jobs
+        self.max_units_per_worker = max_units_per_worker
+        self.max_pending = max_pending
+        self.context = None
+        """
+        Analysis context for the current worker process.
+        """
+
+    def create_unit_provider(self):
+        """
+        Hook for subclasses to return a custom unit provider. Default
+        implementation returns None.
+        """
+        return None
+
+    def create_context(self):
+        """
+        Hook for subclasses to create the analysis context of a worker
+        process. Default implementation creates a context with the unit
+        provider that ``create_unit_provider`` returns.
+        """
+        return AnalysisContext(unit_provider=self.create_unit_provider())
+
+    def process_unit(self, unit):
+        """
+        Compute the result to send back for ``unit``. The result must be
+        picklable. Default implementation returns a dict with the diagnostics
+        of the unit (``"diagnostics"``) and the result of ``to_data()`` on its
+        root node (``"data"``, None if there is no root node).
+        """
+        return {'diagnostics': unit.diagnostics,
+                'data': None if unit.root is None else unit.root.to_data()}
+
+    def report_progress(self, done, total):
+        """
+        Hook for subclasses to report progress: called each time the result
+        for a file is yielded, with the number of results yielded so far and
+        the total number of files. Default implementation does nothing.
+        """
+        pass
+
+    def run(self, filenames):
+        """
+        Analyze all files in ``filenames`` with a pool of worker processes
+        and yield ``(filename, result)`` couples, in the same order as
+        ``filenames``. If ``process_unit`` raises an exception for some file,
+        stop all workers and re-raise it here.
+        """
+        # Importing multiprocessing is costly: do it only when needed
+        import multiprocessing
+
+        filenames = list(filenames)
+        jobs = self.jobs or multiprocessing.cpu_count()
+        max_pending = self.max_pending or 2 * jobs
+
+        pool = multiprocessing.Pool(
+            jobs, initializer=_farm_initialize_worker, initargs=(self, ),
+            maxtasksperchild=self.max_units_per_worker
+        )
+        try:
+            pending = collections.deque()
+            next_filenames = iter(filenames)
+            done = 0
+
+            while True:
+                # Keep at most max_pending requests in flight
+                for filename in next_filenames:
+                    pending.append((filename, pool.apply_async(
+                        _farm_process_file, (filename, )
+                    )))
+                    if len(pending) >= max_pending:
+                        break
+                if not pending:
+                    break
+
+                filename, result = pending.popleft()
+                result = result.get()
+                done += 1
+                self.report_progress(done, len(filenames))
+                yield (filename, result)
+
+            pool.close()
+        except BaseException:
+            # Also stop workers if the consumer stops iterating early
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+
+_farm = None
+"""
+AnalysisFarm instance for the current worker process.
+"""
+
+
+def _farm_initialize_worker(farm):
+    """
+    Initialize an AnalysisFarm worker process.
+    """
+    global _farm
+    _farm = farm
+    _farm.context = farm.create_context()
+
+
+def _farm_process_file(filename):
+    """
+    Analyze ``filename`` in an AnalysisFarm worker process and return the
+    corresponding result.
+    """
+    return _farm.process_unit(_farm.context.get_from_file(filename))
+
+
 #
 # App base class
 #
@@ -1872,6 +2802,9 @@ class App(object):
         return ""
 
     def __init__(self, args=None):
+        # Importing argparse is costly: do it only when needed
+        import argparse
+
         self.parser = argparse.ArgumentParser(description=self.description)
         self.parser.add_argument('files', nargs='+', help='Files')
         self.add_arguments()
@@ -8,10 +8,11 @@
 <%namespace name="struct_types"  file="struct_types_py.mako" />
 
 import argparse
+import array
 import sys
 from typing import (
-    Any, AnyStr, Callable, ClassVar, Dict, IO, Iterator, List, Optional as Opt,
-    Tuple, Type, TypeVar, Union
+    Any, AnyStr, Callable, ClassVar, Dict, IO, Iterable, Iterator, List,
+    Optional as Opt, Tuple, Type, TypeVar, Union
 )
 
 
@@ -49,6 +50,9 @@ class AnalysisContext(object):
                  unit_provider: Opt[UnitProvider] = None,
                  with_trivia: bool = True,
                  tab_stop: int = ${ctx.default_tab_stop},
+                 node_cache_policy: str = 'strong',
+                 node_cache_size: Opt[int] = None,
+                 node_cache_statistics: bool = False,
                  *,
                  _c_value: Any = None) -> None:
         ${py_doc('langkit.create_context', 8, or_pass=True)}
@@ -63,6 +67,14 @@ class AnalysisContext(object):
                       rule: str = default_grammar_rule) -> AnalysisUnit:
         ${py_doc('langkit.get_unit_from_file', 8, or_pass=True)}
 
+    def get_from_files(self,
+                       filenames: Iterable[AnyStr],
+                       charset: Opt[str] = None,
+                       reparse: bool = False,
+                       rule: str = default_grammar_rule,
+                       jobs: Opt[int] = 1) -> AnalysisUnitList:
+        ${py_doc('langkit.get_units_from_files', 8, or_pass=True)}
+
     def get_from_buffer(self,
                         filename: AnyStr,
                         buffer: AnyStr,
@@ -85,6 +97,18 @@ class AnalysisContext(object):
         ${py_doc('langkit.context_discard_errors_in_populate_lexical_env', 8,
                  or_pass=True)}
 
+    @property
+    def memoization_statistics(self) -> MemoizationStatistics:
+        ${py_doc('langkit.context_memoization_statistics', 8, or_pass=True)}
+
+    % if ctx.has_property_profiling:
+    def property_profile(self, format: str = 'json') -> str:
+        ${py_doc('langkit.context_property_profile', 8, or_pass=True)}
+
+    def reset_property_profile(self) -> None:
+        ${py_doc('langkit.context_reset_property_profile', 8, or_pass=True)}
+    % endif
+
 class AnalysisUnit(object):
     ${py_doc('langkit.analysis_unit_type', 4)}
 
@@ -129,6 +153,10 @@ class AnalysisUnit(object):
     def text(self) -> str:
         ${py_doc('langkit.unit_text', 8, or_pass=True)}
 
+    @property
+    def source_text(self) -> str:
+        ${py_doc('langkit.python.AnalysisUnit.source_text', 8, or_pass=True)}
+
     @property
     def token_count(self) -> int:
         ${py_doc('langkit.unit_token_count', 8, or_pass=True)}
@@ -143,6 +171,15 @@ class AnalysisUnit(object):
     def iter_tokens(self) -> AnalysisUnit.TokenIterator:
         ${py_doc('langkit.python.AnalysisUnit.iter_tokens', 8, or_pass=True)}
 
+    @property
+    def node_cache_statistics(self) -> NodeCacheStatistics:
+        ${py_doc('langkit.python.AnalysisUnit.node_cache_statistics', 8,
+                 or_pass=True)}
+
+    def token_columns(self) -> TokenColumns:
+        ${py_doc('langkit.python.AnalysisUnit.token_columns', 8,
+                 or_pass=True)}
+
     @property
     def filename(self) -> str:
         ${py_doc('langkit.unit_filename', 8, or_pass=True)}
@@ -154,6 +191,15 @@ class AnalysisUnit(object):
     def __repr__(self) -> str: ...
 
 
+class AnalysisUnitList(List[AnalysisUnit]):
+    ${py_doc('langkit.python.AnalysisUnitList', 4)}
+
+    @property
+    def diagnostics(self) -> List[Tuple[AnalysisUnit, Diagnostic]]:
+        ${py_doc('langkit.python.AnalysisUnitList.diagnostics', 8,
+                 or_pass=True)}
+
+
 class Sloc(object):
     ${py_doc('langkit.sloc_type', 4)}
 
@@ -201,6 +247,58 @@ class Diagnostic(object):
     def __repr__(self) -> str: ...
 
 
+class MemoizationStatistics(object):
+    ${py_doc('langkit.memoization_statistics_type', 4)}
+
+    hits: int
+    misses: int
+    evictions: int
+    rejections: int
+    entries: int
+    bytes: int
+
+    def __init__(self, hits: int, misses: int, evictions: int,
+                 rejections: int, entries: int, bytes: int) -> None: ...
+    def __repr__(self) -> str: ...
+
+
+class NodeCacheStatistics(object):
+    ${py_doc('langkit.python.NodeCacheStatistics', 4)}
+
+    hits: Opt[int]
+    misses: Opt[int]
+    evictions: int
+    size: int
+
+    def __init__(self, hits: Opt[int], misses: Opt[int], evictions: int,
+                 size: int) -> None: ...
+    def __repr__(self) -> str: ...
+
+
+class TokenColumns(object):
+    ${py_doc('langkit.python.TokenColumns', 4)}
+
+    kinds: array.array
+    start_offsets: array.array
+    end_offsets: array.array
+    start_lines: array.array
+    start_columns: array.array
+    end_lines: array.array
+    end_columns: array.array
+    is_trivia: array.array
+
+    def __init__(self, count: int) -> None: ...
+    def __len__(self) -> int: ...
+    def __repr__(self) -> str: ...
+
+    @staticmethod
+    def kind_name(kind: int) -> str:
+        ${py_doc('langkit.python.TokenColumns.kind_name', 8, or_pass=True)}
+
+    def as_numpy(self) -> Dict[str, Any]:
+        ${py_doc('langkit.python.TokenColumns.as_numpy', 8, or_pass=True)}
+
+
 class Token(object):
     ${py_doc('langkit.token_reference_type', 4)}
 
@@ -310,6 +408,14 @@ class ${root_astnode_name}(object):
     def image(self) -> str:
         ${py_doc('langkit.node_image', 8, or_pass=True)}
 
+    % if ctx.generate_unparser:
+    def unparse_to(self, callback: Callable[[bytes], None]) -> None:
+        ${py_doc('langkit.node_unparse', 8, or_pass=True)}
+
+    def unparse_to_file(self, filename: str) -> None:
+        ${py_doc('langkit.node_unparse_to_file', 8, or_pass=True)}
+
+    % endif
     def lookup(self, sloc: Sloc) -> Opt[${root_astnode_name}]:
         ${py_doc('langkit.lookup_in_node', 8, or_pass=True)}
 
@@ -379,6 +485,19 @@ class ${root_astnode_name}(object):
     def to_json(self) -> str:
         ${py_doc('langkit.python.root_node.to_json', 8, or_pass=True)}
 
+    def write_json(self,
+                   file: IO[str],
+                   kind: bool = False,
+                   sloc: bool = False,
+                   text: bool = False) -> None:
+        ${py_doc('langkit.python.root_node.write_json', 8, or_pass=True)}
+
+    def write_binary(self,
+                     file: IO[bytes],
+                     sloc: bool = False,
+                     text: bool = False) -> None:
+        ${py_doc('langkit.python.root_node.write_binary', 8, or_pass=True)}
+
     def is_a(self, *types: Type[${root_astnode_name}]) -> bool:
         ${py_doc('langkit.python.root_node.is_a', 8, or_pass=True)}
 
@@ -407,6 +526,23 @@ ${struct_types.mypy_decl(struct_type)}
 ${exts.include_extension(ctx.ext('mypy_python'))}
 
 
+class AnalysisFarm(object):
+    jobs: Opt[int]
+    max_units_per_worker: Opt[int]
+    max_pending: Opt[int]
+    context: Opt[AnalysisContext]
+
+    def __init__(self,
+                 jobs: Opt[int] = None,
+                 max_units_per_worker: Opt[int] = None,
+                 max_pending: Opt[int] = None) -> None: ...
+    def create_unit_provider(self) -> Opt[UnitProvider]: ...
+    def create_context(self) -> AnalysisContext: ...
+    def process_unit(self, unit: AnalysisUnit) -> Any: ...
+    def report_progress(self, done: int, total: int) -> None: ...
+    def run(self, filenames: Iterable[str]) -> Iterator[Tuple[str, Any]]: ...
+
+
 class App(object):
     parser: argparse.ArgumentParser
     args: argparse.Namespace
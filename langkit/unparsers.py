@@ -223,6 +223,15 @@ class TokenSequenceUnparser(Unparser):
         self._serial_number = None
         self._var_name = None
 
+        self.first = None
+        self.last = None
+        """
+        Bounds (1-based, inclusive) of this sequence in the flat table of token
+        unparsers. Computed by ``TokenSequenceUnparserPool.finalize``.
+
+        :type: int|None
+        """
+
     def _dump(self, stream):
         if self.tokens:
             stream.write(' '.join(t.dumps() for t in self.tokens))
@@ -760,15 +769,43 @@ class RegularNodeUnparser(NodeUnparser):
         :type: TokenSequenceUnparser
         """
 
+        self._fields_unparser_list_id = None
+        """
+        Identifier for the unparsing table of fields. As the same table can be
+        shared by several nodes, this is computed by
+        ``Unparsers.finalize``.
+
+        :type: int|None
+        """
+
     @property
     def fields_unparser_var_name(self):
         """
         Return the name of the variable in code generation to store the
         unparsing table for fields.
         """
-        return (self.node.name + names.Name('Fields_Unparser_List')
-                if self.field_unparsers else
-                names.Name('Empty_Field_Unparser_List'))
+        if not self.field_unparsers:
+            return names.Name('Empty_Field_Unparser_List')
+
+        assert self._fields_unparser_list_id is not None
+        return names.Name('Field_Unparser_List_{}'
+                          .format(self._fields_unparser_list_id))
+
+    @property
+    def fields_unparser_key(self):
+        """
+        Key to identify the unparsing table for fields: two regular node
+        unparsers with the same key can share the same table.
+
+        :rtype: tuple
+        """
+        return tuple(
+            (None if not f.pre_tokens and not f.post_tokens else
+             (tuple(f.pre_tokens.tokens), tuple(f.post_tokens.tokens),
+              f.empty_list_is_absent),
+             tuple(tok_seq.tokens))
+            for f, tok_seq in self.zip_fields
+        )
 
     @property
     def zip_fields(self):
@@ -913,6 +950,14 @@ class TokenSequenceUnparserPool:
 
         self.sorted = None
 
+        self.flat_tokens = None
+        """
+        Flat table of token unparsers, in which all sequences are slices.
+        Computed by the ``finalize`` method.
+
+        :type: list[TokenUnparser]
+        """
+
     def __len__(self):
         return len(self.pool)
 
@@ -939,6 +984,36 @@ class TokenSequenceUnparserPool:
         for i, tok_seq in enumerate(self.sorted):
             tok_seq._serial_number = i
 
+        # Lay out all token sequences in a single flat table. Start with the
+        # longest sequences so that shorter ones have a chance to be found as
+        # a slice of an already laid out one, in which case we just reuse it.
+        self.flat_tokens = []
+        for tok_seq in sorted(self.sorted,
+                              key=lambda tok_seq: -len(tok_seq.tokens)):
+            start = self._find_slice(tok_seq.tokens)
+            if start is None:
+                start = len(self.flat_tokens)
+                self.flat_tokens.extend(tok_seq.tokens)
+            tok_seq.first = start + 1
+            tok_seq.last = start + len(tok_seq.tokens)
+
+    def _find_slice(self, tokens):
+        """
+        Look for ``tokens`` in the flat table of token unparsers. Return the
+        0-based index of its first occurrence, or None if it is absent.
+
+        :param list[TokenUnparser] tokens: Sequence to look for.
+        :rtype: int|None
+        """
+        if not tokens:
+            return 0
+
+        n = len(tokens)
+        for i in range(len(self.flat_tokens) - n + 1):
+            if self.flat_tokens[i:i + n] == tokens:
+                return i
+        return None
+
 
 class Unparsers:
     """
@@ -978,6 +1053,15 @@ class Unparsers:
         :type: TokenSequenceUnparserPool
         """
 
+        self.field_unparser_lists = []
+        """
+        List of unparsing tables for fields to emit. Regular node unparsers
+        that have identical tables share the same entry. Computed at the end
+        of finalization.
+
+        :type: list[RegularNodeUnparser]
+        """
+
     @property
     def sorted_token_unparsers(self):
         """
@@ -1132,3 +1216,25 @@ class Unparsers:
             node.unparser.collect(self)
 
         self.token_sequence_unparsers.finalize()
+
+        # Now that token sequences are unique, hash-cons the unparsing tables
+        # for fields, so that nodes with the same layout share the same table.
+        # Regular node unparsers for which we emit a table are stored in
+        # field_unparser_lists.
+        fields_tables = {}
+        for node in self.context.astnode_types:
+            unparser = node.unparser
+            if (
+                not isinstance(unparser, RegularNodeUnparser)
+                or not unparser.field_unparsers
+            ):
+                continue
+
+            key = unparser.fields_unparser_key
+            try:
+                unparser._fields_unparser_list_id = fields_tables[key]
+            except KeyError:
+                unparser._fields_unparser_list_id = fields_tables[key] = len(
+                    self.field_unparser_lists
+                )
+                self.field_unparser_lists.append(unparser)
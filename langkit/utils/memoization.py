@@ -1,33 +1,134 @@
+from __future__ import annotations
 
-def memoized(func, pre_cache_miss=None):
+from contextlib import contextmanager
+import weakref
+
+
+class CacheStatistics:
+    """
+    Hit/miss/eviction counters for a memoized function. All the caches that
+    implement memoization for this function (one per instance for
+    `self_memoized`) share these counters.
+    """
+
+    registry: weakref.WeakSet[CacheStatistics] = weakref.WeakSet()
+    """
+    CacheStatistics instances for all live memoized functions. Memoized
+    functions hold a strong reference to their statistics, so the ones for
+    functions that no longer exist (for instance memoized local functions)
+    vanish from this set.
+    """
+
+    def __init__(self, name, max_size=None):
+        """
+        :param str name: Name of the memoized function.
+        :param int|None max_size: If not None, maximum number of entries in
+            each cache.
+        """
+        self.name = name
+        self.max_size = max_size
+        self.caches = weakref.WeakSet()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        CacheStatistics.registry.add(self)
+
+    @property
+    def size(self):
+        """
+        Total number of entries in the caches for this function.
+
+        :rtype: int
+        """
+        return sum(len(cache) for cache in self.caches)
+
+    def reset(self):
+        """
+        Clear all caches for this function and reset counters.
+        """
+        for cache in list(self.caches):
+            cache.clear()
+        self.reset_counters()
+
+    def reset_counters(self):
+        """
+        Reset counters, leaving caches untouched.
+        """
+        self.hits = self.misses = self.evictions = 0
+
+    def __repr__(self):
+        return '<CacheStatistics {}>'.format(self.name)
+
+
+class MemoizationCache(dict):
+    """
+    Dict that holds memoized results, optionally capped in size. When adding
+    an entry to a full cache, the oldest entry is evicted first.
+    """
+
+    def __init__(self, stats):
+        """
+        :param CacheStatistics stats: Counters for this cache.
+        """
+        super().__init__()
+        self.stats = stats
+        stats.caches.add(self)
+
+    def store(self, key, value):
+        """
+        Store `value` as the memoized result for `key`.
+        """
+        max_size = self.stats.max_size
+        if max_size is not None and key not in self:
+            while self and len(self) >= max_size:
+                del self[next(iter(self))]
+                self.stats.evictions += 1
+        self[key] = value
+
+    # Caches are compared by identity in the weak sets that reference them
+    __hash__ = object.__hash__  # type: ignore
+    __eq__ = object.__eq__
+
+
+def memoized(func=None, pre_cache_miss=None, max_size=None):
     """
     Decorator to memoize a function.
     This function must be passed only hashable arguments.
 
+    Can be used either as ``@memoized`` or as ``@memoized(max_size=N)``.
+
     :param func: The function to decorate.
     :param pre_cache_miss: The function to call in case of a cache miss, before
         `func` is called. Can be used for example to prepare a value in the
         memoization cache to break infinite recursions.
+    :param int|None max_size: If not None, maximum number of results to keep.
+        Do not use it for functions whose results must be unique (for
+        instance type constructors), as evicted results are computed again.
     """
-    cache = {}
+    if func is None:
+        return lambda func: memoized(func, pre_cache_miss, max_size)
 
-    if not getattr(memoized, "caches", None):
-        memoized.caches = []
-
-    memoized.caches.append(cache)
+    # The wrapper keeps the cache alive, as statistics only hold weak
+    # references to caches.
+    stats = CacheStatistics(func.__qualname__, max_size)
+    cache = MemoizationCache(stats)
 
     def wrapper(*args, **kwargs):
         key = (args, tuple(kwargs.items()))
         try:
             result = cache[key]
         except KeyError:
+            stats.misses += 1
             if pre_cache_miss is not None:
-                cache[key] = pre_cache_miss(*args, **kwargs)
+                cache.store(key, pre_cache_miss(*args, **kwargs))
 
             result = func(*args, **kwargs)
-            cache[key] = result
+            cache.store(key, result)
+        else:
+            stats.hits += 1
         return result
 
+    wrapper.cache_statistics = stats
     return wrapper
 
 
@@ -52,32 +153,83 @@ def self_memoized(func):
     Like `memoized`, but specific to instance methods and offers a
     instance-specific reset switch.
 
+    Caches live as long as their instance, but they are also cleared by
+    `reset_memoized`.
+
     :param func: The instance method to decorate.
     """
 
     cache_name = '_cache_{}'.format(func.__name__)
+    stats = CacheStatistics(func.__qualname__)
 
     def wrapper(self, *args, **kwargs):
         # Install the self-specific cache, if needed
-        cache = getattr(self, cache_name, {})
-        setattr(self, cache_name, cache)
+        try:
+            cache = getattr(self, cache_name)
+        except AttributeError:
+            cache = MemoizationCache(stats)
+            setattr(self, cache_name, cache)
 
         key = (args, tuple(kwargs.items()))
         try:
             result = cache[key]
         except KeyError:
+            stats.misses += 1
             result = func(self, *args, **kwargs)
-            cache[key] = result
+            cache.store(key, result)
+        else:
+            stats.hits += 1
         return result
 
     def reset(self):
-        setattr(self, cache_name, {})
+        setattr(self, cache_name, MemoizationCache(stats))
 
     wrapper.reset = reset
+    wrapper.cache_statistics = stats
 
     return wrapper
 
 
 def reset_memoized():
-    for cache in getattr(memoized, "caches", []):
-        cache.clear()
+    """
+    Clear all memoization caches, including the ones for `self_memoized`
+    methods, and reset their statistics.
+    """
+    for stats in list(CacheStatistics.registry):
+        stats.reset()
+
+
+@contextmanager
+def memoization_scope():
+    """
+    Context manager to scope memoization to a compilation (see
+    ``CompileCtx.emit``). Entering it resets cache statistics, so that they
+    only cover this compilation. Leaving it clears all memoization caches, so
+    that processes that run several compilations in a row (testsuites,
+    long-lived generators) do not keep objects from previous compilations
+    alive.
+
+    Note that caches are kept when entering the scope: results computed
+    before the compilation starts (for instance types created while loading
+    the language specification) must stay unique.
+    """
+    for stats in list(CacheStatistics.registry):
+        stats.reset_counters()
+    try:
+        yield
+    finally:
+        reset_memoized()
+
+
+def memoization_statistics():
+    """
+    Return statistics for all memoized functions that were called at least
+    once since the last reset, sorted by name.
+
+    :rtype: list[CacheStatistics]
+    """
+    return sorted(
+        (stats for stats in CacheStatistics.registry
+         if stats.hits or stats.misses),
+        key=lambda stats: stats.name
+    )
@@ -31,6 +31,80 @@ package body Langkit_Support.Symbols is
    procedure Deallocate is new Ada.Unchecked_Deallocation
      (Symbol_Table_Record'Class, Symbol_Table);
 
+   function Unlocked_Find
+     (ST     : Symbol_Table;
+      T      : Text_Type;
+      Create : Boolean) return Thin_Symbol;
+   --  Implementation of Find, without synchronization
+
+   function Unlocked_Get_Symbol
+     (Self : Symbol_Table; TS : Thin_Symbol) return Symbol_Type;
+   --  Implementation of Get_Symbol, without synchronization
+
+   protected Lock is
+      procedure Enter (ST : Symbol_Table);
+      procedure Leave (ST : Symbol_Table);
+      --  Implementations for Enter_Concurrent_Access/Leave_Concurrent_Access
+
+      procedure Find
+        (ST     : Symbol_Table;
+         T      : Text_Type;
+         Create : Boolean;
+         Result : out Thin_Symbol);
+      procedure Get_Symbol
+        (Self : Symbol_Table; TS : Thin_Symbol; Result : out Symbol_Type);
+      --  Serialized versions of Find/Get_Symbol
+   end Lock;
+
+   ----------
+   -- Lock --
+   ----------
+
+   protected body Lock is
+
+      -----------
+      -- Enter --
+      -----------
+
+      procedure Enter (ST : Symbol_Table) is
+      begin
+         ST.Concurrent_Level := ST.Concurrent_Level + 1;
+      end Enter;
+
+      -----------
+      -- Leave --
+      -----------
+
+      procedure Leave (ST : Symbol_Table) is
+      begin
+         ST.Concurrent_Level := ST.Concurrent_Level - 1;
+      end Leave;
+
+      ----------
+      -- Find --
+      ----------
+
+      procedure Find
+        (ST     : Symbol_Table;
+         T      : Text_Type;
+         Create : Boolean;
+         Result : out Thin_Symbol) is
+      begin
+         Result := Unlocked_Find (ST, T, Create);
+      end Find;
+
+      ----------------
+      -- Get_Symbol --
+      ----------------
+
+      procedure Get_Symbol
+        (Self : Symbol_Table; TS : Thin_Symbol; Result : out Symbol_Type) is
+      begin
+         Result := Unlocked_Get_Symbol (Self, TS);
+      end Get_Symbol;
+
+   end Lock;
+
    -----------
    -- Image --
    -----------
@@ -72,6 +146,25 @@ package body Langkit_Support.Symbols is
       T      : Text_Type;
       Create : Boolean := True)
       return Thin_Symbol
+   is
+      Result : Thin_Symbol;
+   begin
+      if ST.Concurrent_Level > 0 then
+         Lock.Find (ST, T, Create, Result);
+      else
+         Result := Unlocked_Find (ST, T, Create);
+      end if;
+      return Result;
+   end Find;
+
+   -------------------
+   -- Unlocked_Find --
+   -------------------
+
+   function Unlocked_Find
+     (ST     : Symbol_Table;
+      T      : Text_Type;
+      Create : Boolean) return Thin_Symbol
    is
       use Maps;
 
@@ -94,7 +187,7 @@ package body Langkit_Support.Symbols is
 
       ST.Symbols_Map.Insert (T_Acc, Thin_Symbol (ST.Symbols.Last_Index));
       return Thin_Symbol (ST.Symbols.Last_Index);
-   end Find;
+   end Unlocked_Find;
 
    -------------
    -- Destroy --
@@ -133,6 +226,23 @@ package body Langkit_Support.Symbols is
    ----------------
 
    function Get_Symbol
+     (Self : Symbol_Table; TS : Thin_Symbol) return Symbol_Type
+   is
+      Result : Symbol_Type;
+   begin
+      if Self.Concurrent_Level > 0 then
+         Lock.Get_Symbol (Self, TS, Result);
+      else
+         Result := Unlocked_Get_Symbol (Self, TS);
+      end if;
+      return Result;
+   end Get_Symbol;
+
+   -------------------------
+   -- Unlocked_Get_Symbol --
+   -------------------------
+
+   function Unlocked_Get_Symbol
      (Self : Symbol_Table; TS : Thin_Symbol) return Symbol_Type is
    begin
       if TS = No_Thin_Symbol then
@@ -140,6 +250,24 @@ package body Langkit_Support.Symbols is
       else
          return Self.Symbols.Get (Positive (TS));
       end if;
-   end Get_Symbol;
+   end Unlocked_Get_Symbol;
+
+   -----------------------------
+   -- Enter_Concurrent_Access --
+   -----------------------------
+
+   procedure Enter_Concurrent_Access (ST : Symbol_Table) is
+   begin
+      Lock.Enter (ST);
+   end Enter_Concurrent_Access;
+
+   -----------------------------
+   -- Leave_Concurrent_Access --
+   -----------------------------
+
+   procedure Leave_Concurrent_Access (ST : Symbol_Table) is
+   begin
+      Lock.Leave (ST);
+   end Leave_Concurrent_Access;
 
 end Langkit_Support.Symbols;
@@ -110,7 +110,9 @@ def emit_and_print_errors(grammar=None, lexer=None, lkt_file=None,
                           warning_set=default_warning_set,
                           generate_unparser=False, symbol_canonicalizer=None,
                           unparse_script=None,
-                          explicit_passes_triggers={}):
+                          explicit_passes_triggers={},
+                          parsers_jobs=1,
+                          render_properties_jobs=1):
     """
     Compile and emit code the given set of arguments. Return the compile
     context if this was successful, None otherwise.
@@ -133,6 +135,11 @@ def emit_and_print_errors(grammar=None, lexer=None, lkt_file=None,
     :rtype: None|langkit.compile_context.CompileCtx
 
     :param None|str unparse_script: Script to unparse the language spec.
+
+    :param int parsers_jobs: Number of worker processes to render parsers code.
+
+    :param int render_properties_jobs: Number of worker processes to render
+        properties code.
     """
 
     try:
@@ -142,7 +149,9 @@ def emit_and_print_errors(grammar=None, lexer=None, lkt_file=None,
             'build', generate_unparser=generate_unparser,
             unparse_script=(UnparseScript(unparse_script)
                             if unparse_script else None),
-            explicit_passes_triggers=explicit_passes_triggers
+            explicit_passes_triggers=explicit_passes_triggers,
+            parsers_jobs=parsers_jobs,
+            render_properties_jobs=render_properties_jobs
         )
         ctx.emit()
         # ... and tell about how it went
@@ -174,7 +183,8 @@ def build_and_run(grammar=None, py_script=None, ada_main=None, lexer=None,
                   warning_set=default_warning_set, generate_unparser=False,
                   symbol_canonicalizer=None, mains=False,
                   show_property_logging=False, unparse_script=unparse_script,
-                  strict_sound_envs: bool = False):
+                  strict_sound_envs: bool = False,
+                  profile_properties: bool = False):
     """
     Compile and emit code for `ctx` and build the generated library. Then,
     execute the provided scripts/programs, if any.
@@ -218,6 +228,8 @@ def build_and_run(grammar=None, py_script=None, ada_main=None, lexer=None,
     :param None|str unparse_script: Script to unparse the language spec.
 
     :param strict_sound_envs: Pass --strict-sound-envs to generation.
+
+    :param profile_properties: Pass --profile-properties to generation.
     """
     assert not types_from_lkt or lkt_file is not None
 
@@ -266,6 +278,8 @@ def build_and_run(grammar=None, py_script=None, ada_main=None, lexer=None,
             argv.append('--generate-unparser')
         if strict_sound_envs:
             argv.append('--strict-sound-envs')
+        if profile_properties:
+            argv.append('--profile-properties')
 
         # For testsuite performance, do not generate mains unless told
         # otherwise.
@@ -0,0 +1,74 @@
+"""
+Check that rendering parsers code with several worker processes emits each
+parser exactly once, in a stable order, and that the code for each rule does
+not depend on the other rules.
+"""
+
+from langkit.dsl import ASTNode, Field, abstract
+from langkit.parsers import Grammar, List, Or
+
+from lexer_example import Token, foo_lexer
+from utils import emit_and_print_errors
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Decl(FooNode):
+    name = Field()
+    value = Field()
+
+
+@abstract
+class Expr(FooNode):
+    pass
+
+
+class Literal(Expr):
+    token_node = True
+
+
+class Name(Expr):
+    token_node = True
+
+
+class Plus(Expr):
+    left = Field()
+    right = Field()
+
+
+class ParenExpr(Expr):
+    expr = Field()
+
+
+g = Grammar('main_rule')
+g.add_rules(
+    main_rule=List(g.decl, empty_valid=True),
+    decl=Decl('def', g.name, '=', g.expr, ';'),
+    expr=Or(Plus(g.atom, '+', g.expr), g.atom),
+    atom=Or(Literal(Token.Number), g.name, ParenExpr('(', g.expr, ')')),
+    name=Name(Token.Identifier),
+)
+ctx = emit_and_print_errors(g, foo_lexer, parsers_jobs=3)
+
+names = [p.name.camel_with_underscores for p in ctx.generated_parsers]
+assert len(names) == len(set(names)), 'Some parsers were emitted twice'
+assert names == sorted(names, key=str.lower), 'Parsers are not sorted'
+assert {p.gen_fn_name.camel_with_underscores for p in ctx.fns} == set(names)
+
+for p in ctx.generated_parsers:
+    print(p.name.camel_with_underscores)
+
+# Local variables are numbered per parser function, so the names declared in
+# the body of the "name" rule do not depend on the other rules.
+name_fn = g.get_rule('name').gen_fn_name
+name_parser = [p for p in ctx.generated_parsers if p.name == name_fn][0]
+print('')
+print('Local variables for {}:'.format(name_fn.camel_with_underscores))
+for line in name_parser.body.splitlines():
+    line = line.strip()
+    if line.endswith(' :'):
+        print('  {}'.format(line[:-2]))
+
+print('Done')
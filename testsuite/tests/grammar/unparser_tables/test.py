@@ -0,0 +1,76 @@
+"""
+Check that unparsing tables are compact: token sequences are laid out in a
+single flat table in which they can overlap, and nodes with the same field
+unparsers share the same table.
+"""
+
+from langkit.dsl import ASTNode, Field
+from langkit.parsers import Grammar, List, Or
+
+from lexer_example import Token, foo_lexer
+from utils import emit_and_print_errors
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Plus(FooNode):
+    left = Field()
+    right = Field()
+
+
+class Minus(FooNode):
+    left = Field()
+    right = Field()
+
+
+class Call(FooNode):
+    name = Field()
+    arg = Field()
+
+
+class Name(FooNode):
+    token_node = True
+
+
+class Literal(FooNode):
+    token_node = True
+
+
+g = Grammar('main_rule')
+g.add_rules(
+    main_rule=List(g.stmt, empty_valid=True),
+    stmt=Or(
+        Plus(g.atom, '+', g.atom, ';'),
+        Minus(g.atom, '+', g.atom, '(', ')', ';'),
+        Call(g.name, '(', g.atom, ')', ';'),
+    ),
+    atom=Or(Literal(Token.Number), g.name),
+    name=Name(Token.Identifier),
+)
+ctx = emit_and_print_errors(g, foo_lexer, generate_unparser=True)
+
+unparsers = ctx.unparsers
+pool = unparsers.token_sequence_unparsers
+
+print('Flat token table:')
+print('  {}'.format(' '.join(t.dumps() for t in pool.flat_tokens)))
+
+print('Token sequences:')
+for tok_seq in pool:
+    if tok_seq:
+        print('  {}: {} .. {} ({})'.format(
+            tok_seq.var_name.camel_with_underscores, tok_seq.first,
+            tok_seq.last, tok_seq.dumps()
+        ))
+
+print('Field unparser lists:')
+for node in ctx.astnode_types:
+    if node.unparser is not None and hasattr(node.unparser, 'zip_fields'):
+        print('  {}: {}'.format(
+            node.dsl_name,
+            node.unparser.fields_unparser_var_name.camel_with_underscores
+        ))
+
+print('Done')
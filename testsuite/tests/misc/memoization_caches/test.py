@@ -0,0 +1,125 @@
+"""
+Test memoization caches from langkit.utils: size caps, statistics, resets and
+scoping to compilations.
+"""
+
+import gc
+
+from langkit.dsl import ASTNode
+from langkit.parsers import Grammar
+from langkit.utils import (CacheStatistics, memoization_scope,
+                           memoization_statistics, memoized, reset_memoized,
+                           self_memoized)
+
+from lexer_example import foo_lexer
+from utils import prepare_context
+
+
+calls = []
+
+
+@memoized
+def square(n):
+    calls.append(n)
+    return n * n
+
+
+@memoized(max_size=2)
+def double(n):
+    calls.append(n)
+    return n * 2
+
+
+class Node:
+    @self_memoized
+    def label(self, prefix):
+        calls.append(prefix)
+        return prefix + '!'
+
+
+def report(label):
+    print('== {} =='.format(label))
+    print('calls: {}'.format(calls))
+    for stats in memoization_statistics():
+        if stats.name in ('square', 'double', 'Node.label'):
+            print('  {}: {} hit(s), {} miss(es), {} eviction(s), {} entries'
+                  .format(stats.name, stats.hits, stats.misses,
+                          stats.evictions, stats.size))
+    print('')
+    del calls[:]
+
+
+square(2)
+square(2)
+square(3)
+report('Unbounded cache')
+
+double(1)
+double(2)
+double(1)
+double(3)
+double(1)
+double(2)
+report('Bounded cache')
+
+n1 = Node()
+n2 = Node()
+n1.label('a')
+n1.label('a')
+n2.label('a')
+report('Per-instance caches')
+
+del n2
+gc.collect()
+report('Per-instance cache after its instance is deleted')
+
+reset_memoized()
+report('After reset')
+
+n1.label('a')
+square(2)
+report('Caches are empty after reset')
+
+with memoization_scope():
+    square(4)
+    square(4)
+    report('In scope')
+report('After scope')
+
+
+def use_local_function():
+    @memoized
+    def local(n):
+        return n
+    local(1)
+    return sorted(stats.name for stats in memoization_statistics())
+
+
+print('Memoized local function: {}'.format(use_local_function()))
+print('After it is gone: {}'.format(
+    sorted(stats.name for stats in memoization_statistics())
+))
+print('')
+
+
+# Compilations run in a memoization scope, so that caches do not keep objects
+# from one compilation to the next.
+class FooNode(ASTNode):
+    pass
+
+
+class Example(FooNode):
+    token_node = True
+
+
+g = Grammar('main_rule')
+g.add_rules(main_rule=Example('example'))
+ctx = prepare_context(g, foo_lexer)
+ctx.create_all_passes('build')
+square(5)
+ctx.emit()
+print('Cache entries after emission: {}'.format(
+    sum(stats.size for stats in CacheStatistics.registry)
+))
+
+print('Done')
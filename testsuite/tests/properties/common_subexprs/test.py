@@ -0,0 +1,91 @@
+"""
+Test that the "eliminate common subexpressions" pass re-uses the results of
+repeated pure expressions, and only when it is safe to do so.
+"""
+
+from langkit.dsl import ASTNode, T
+from langkit.expressions import (
+    DynamicVariable, If, Self, Try, Var, ignore, langkit_property
+)
+from langkit.expressions.base import FieldAccessExpr, VariableExpr
+from langkit.expressions.structs import Cast, FieldAccess
+
+from utils import emit_and_print_errors
+
+
+dyn_node = DynamicVariable('dyn_node', T.FooNode)
+
+
+class FooNode(ASTNode):
+
+    @langkit_property()
+    def pure(n=T.Int):
+        return n + 1
+
+    @langkit_property(call_non_memoizable_because='For testing purposes')
+    def impure(n=T.Int):
+        return n + 1
+
+    @langkit_property(dynamic_vars=[dyn_node])
+    def with_dynvar(n=T.Int):
+        return If(dyn_node.is_null, n, n + 1)
+
+    @langkit_property(public=True)
+    def field_chains():
+        a = Var(Self.parent.parent)
+        b = Var(Self.parent.parent.parent)
+        return a == b
+
+    @langkit_property(public=True)
+    def casts():
+        a = Var(Self.parent.cast(T.Example))
+        b = Var(Self.parent.cast(T.Example))
+        return a == b
+
+    @langkit_property(public=True)
+    def calls():
+        return (
+            Self.pure(1) + Self.pure(1) + Self.pure(2)
+            + Self.impure(1) + Self.impure(1)
+        )
+
+    @langkit_property(public=True)
+    def calls_with_dynvar():
+        ignore(Var(dyn_node.bind(Self, Self.with_dynvar(1))))
+        return dyn_node.bind(Self, Self.with_dynvar(1))
+
+    @langkit_property(public=True)
+    def conditionals():
+        a = Var(Self.parent.parent)
+        b = Var(If(a.is_null,
+                   Self.parent.parent.parent,
+                   Self.parent.parent.parent))
+        ignore(Var(Try(Self.parent.parent.parent.parent)))
+        return b == Self.parent.parent.parent.parent.parent
+
+
+class Example(FooNode):
+    token_node = True
+
+
+ctx = emit_and_print_errors(
+    lkt_file='foo.lkt',
+    explicit_passes_triggers={'eliminate common subexpressions': True}
+)
+
+print('')
+for name in ('field_chains', 'casts', 'calls', 'calls_with_dynvar',
+             'conditionals'):
+    prop = FooNode._type.get_abstract_node_data_dict()[name]
+    print('== {} =='.format(prop.qualname))
+    for expr in prop.constructed_expr.preorder():
+        if isinstance(expr, (FieldAccessExpr, Cast.Expr)):
+            print('  {} -> {}'.format(expr, expr.result_var.name.lower))
+        elif isinstance(expr, FieldAccess.Expr):
+            print('  {} -> {}'.format(expr.node_data.qualname,
+                                      expr.result_var.name.lower))
+        elif (isinstance(expr, VariableExpr)
+                and expr.name.lower.startswith(('fld', 'cast'))):
+            print('  re-use {}'.format(expr.name.lower))
+    print('')
+print('Done')
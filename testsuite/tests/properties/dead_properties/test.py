@@ -0,0 +1,105 @@
+"""
+Test that the "eliminate dead properties" pass removes unreachable private
+properties, the composite types and the logic binders that only they use.
+"""
+
+from langkit.dsl import (ASTNode, Field, Int, LogicVar, Struct, T, UserField,
+                         abstract)
+from langkit.expressions import (AbstractProperty, Bind, ExternalProperty,
+                                 New, Property, Self, langkit_property)
+
+from utils import emit_and_print_errors
+
+
+class Pair(Struct):
+    left = UserField(type=Int)
+    right = UserField(type=Int)
+
+
+class FooNode(ASTNode):
+    # This property is private and only called by another unused property, so
+    # it is dead. Its return type is used nowhere else, so it is dead too.
+    @langkit_property()
+    def pair():
+        return New(Pair, left=1, right=2)
+
+    @langkit_property()
+    def pair_sum():
+        return Self.pair.left + Self.pair.right
+
+    # This one is unused but the user asked explicitly to not warn, so it may
+    # be used from extensions: keep it.
+    @langkit_property(warn_on_unused=False)
+    def maybe_used():
+        return Self.parent
+
+    # Private external properties are kept, as their implementation lives in
+    # extensions.
+    ext = ExternalProperty(type=Int, uses_entity_info=False, uses_envs=False)
+
+    # This property is only used as a conversion property in a dead property,
+    # so it is dead, and so is the logic binder that uses it.
+    @langkit_property(return_type=T.FooNode.entity)
+    def conv():
+        return Self.as_entity
+
+
+@abstract
+class Expression(FooNode):
+    # This property and its overriding one are unused, so they are dead, and
+    # so is the array type they return.
+    indexes = Property(Self.children.map(lambda c: c.child_index))
+
+    # Only Literal.result is called directly, but the whole hierarchy must be
+    # kept for dispatching.
+    result = AbstractProperty(type=Int)
+
+
+class Literal(Expression):
+    token_node = True
+
+    result = Property(12)
+
+    var = UserField(LogicVar, public=False)
+    bind_var = Property(Bind(Self.var, Self.as_entity,
+                             conv_prop=FooNode.conv))
+
+    evaluate = Property(Self.result, public=True)
+
+
+class Name(Expression):
+    token_node = True
+
+    result = Property(0)
+
+
+class Plus(Expression):
+    left = Field()
+    right = Field()
+
+    indexes = Property(Self.left.indexes.concat(Self.right.indexes))
+    result = Property(Self.left.result + Self.right.result)
+
+
+ctx = emit_and_print_errors(
+    lkt_file='foo.lkt',
+    explicit_passes_triggers={'eliminate dead properties': True}
+)
+
+print('Dead properties:')
+for p in ctx.dead_properties:
+    print('  {}'.format(p.qualname))
+print('Dead types:')
+for t in ctx.dead_composite_types:
+    print('  {}'.format(t.dsl_name))
+print('Logic binders:')
+for conv_prop, eq_prop in ctx.sorted_logic_binders:
+    print('  {} {}'.format(conv_prop and conv_prop.qualname,
+                           eq_prop and eq_prop.qualname))
+print('Kept properties:')
+for p in ctx.all_properties(
+    lambda p: p.indexing_name in ('maybe_used', 'ext', 'result'),
+    include_inherited=False
+):
+    print('  {}'.format(p.qualname))
+print('Done')
@@ -0,0 +1,64 @@
+"""
+Test the iterative traversals of resolved expression trees, including on
+trees that are too deep for recursive traversals.
+"""
+
+import sys
+
+from langkit.dsl import ASTNode
+from langkit.expressions import Property, Self
+from langkit.expressions.base import (IntegerLiteralExpr, ResolvedExpression,
+                                      SequenceExpr)
+
+from utils import emit_and_print_errors
+
+
+class FooNode(ASTNode):
+    prop = Property(Self.parent.is_null & Self.is_ghost, public=True)
+
+
+class Example(FooNode):
+    token_node = True
+
+
+ctx = emit_and_print_errors(lkt_file='foo.lkt')
+
+
+def names(exprs):
+    return ' '.join(getattr(e, 'pretty_class_name', type(e).__name__)
+                    for e in exprs)
+
+
+expr = FooNode._type.get_abstract_node_data_dict()['prop'].constructed_expr
+print('preorder:', names(expr.preorder()))
+print('postorder:', names(expr.postorder()))
+print('children:', names(expr.children))
+print('leaves:', [str(leaf)
+                  for e in expr.preorder()
+                  for leaf in e.subexprs_leaves
+                  if not isinstance(leaf, ResolvedExpression)])
+print('')
+
+# Build a tree that is deeper than the recursion limit
+depth = sys.getrecursionlimit() * 2
+deep = IntegerLiteralExpr(0)
+for i in range(depth):
+    deep = SequenceExpr(IntegerLiteralExpr(i + 1), deep)
+
+print('preorder count:', sum(1 for _ in deep.preorder()) == 2 * depth + 1)
+print('literals:',
+      sum(1 for _ in deep.postorder(IntegerLiteralExpr)) == depth + 1)
+
+
+def rewrite(expr):
+    # Replace literals with their value plus one
+    if isinstance(expr, IntegerLiteralExpr):
+        return IntegerLiteralExpr(expr.value + 1)
+    return expr
+
+
+rewritten = []
+result = deep.rewrite_tree(rewrite, lambda old, new: rewritten.append(old))
+print('rewritten:', len(rewritten) == depth + 1)
+print('first literal:', next(iter(result.postorder(IntegerLiteralExpr))).value)
+print('Done')
@@ -0,0 +1,65 @@
+"""
+Test that the "inline trivial properties" pass replaces calls to trivial
+properties with their bodies, and only for them.
+"""
+
+from langkit.dsl import ASTNode, T
+from langkit.expressions import (
+    Entity, No, Property, Self, langkit_property
+)
+
+from utils import emit_and_print_errors
+
+
+class FooNode(ASTNode):
+    # Inlinable properties
+    lit = Property(12)
+    null_node = Property(No(T.FooNode))
+    grand_parent = Property(Self.parent.parent)
+    fwd = Property(Self.grand_parent)
+
+    # Properties that cannot be inlined
+    too_long = Property(Self.parent.parent.parent.parent)
+    opted_out = Property(Self.parent, inline=False)
+    memo = Property(Self.parent, memoized=True)
+    dispatching = Property(Self.parent)
+    with_entity = Property(Entity.parent)
+
+    @langkit_property()
+    def with_arg(n=T.Int):
+        return n
+
+    @langkit_property(public=True)
+    def caller():
+        return (
+            Self.lit + Entity.lit + Self.with_arg(1)
+            + Self.fwd.lit + Self.null_node.lit
+        )
+
+    @langkit_property(public=True)
+    def not_inlined():
+        return (
+            Self.too_long.is_null & Self.opted_out.is_null
+            & Self.memo.is_null & Self.dispatching.is_null
+            & Entity.with_entity.is_null
+        )
+
+
+class Example(FooNode):
+    token_node = True
+
+    dispatching = Property(Self)
+
+
+ctx = emit_and_print_errors(
+    lkt_file='foo.lkt',
+    explicit_passes_triggers={'report inlined properties': True}
+)
+
+print('')
+for name in ('caller', 'not_inlined'):
+    prop = FooNode._type.get_abstract_node_data_dict()[name]
+    print('== {} =='.format(prop.qualname))
+    print(prop.constructed_expr.ir_dump)
+    print('')
+print('Done')
@@ -0,0 +1,30 @@
+"""
+Check that invalid memoization cache policies are rejected.
+"""
+
+from langkit.dsl import ASTNode, Bool
+from langkit.expressions import Property
+
+from utils import emit_and_print_errors
+
+
+def run(label, **kwargs):
+    print('== {} =='.format(label))
+
+    class FooNode(ASTNode):
+        pass
+
+    class Example(FooNode):
+        prop = Property(True, type=Bool, public=True, **kwargs)
+
+    emit_and_print_errors(lkt_file='foo.lkt')
+    print('')
+
+
+run('Not memoized', memoization_max_entries=10)
+run('Null bound', memoized=True, memoization_max_entries=0)
+run('Invalid eviction', memoized=True, memoization_max_entries=10,
+    memoization_eviction='fifo')
+run('Valid', memoized=True, memoization_max_entries=10,
+    memoization_eviction='reject')
+print('Done')
@@ -0,0 +1,48 @@
+import sys
+
+import libfoolang
+
+
+print('main.py: Running...')
+
+
+ctx = libfoolang.AnalysisContext()
+u = ctx.get_from_buffer('main.txt', b'example')
+if u.diagnostics:
+    for d in u.diagnostics:
+        print(d)
+    sys.exit(1)
+
+
+def print_stats(label):
+    stats = ctx.memoization_statistics
+    print('{}: hits={} misses={} evictions={} rejections={} entries={}'
+          .format(label, stats.hits, stats.misses, stats.evictions,
+                  stats.rejections, stats.entries))
+
+
+print_stats('Initial')
+
+# With the LRU policy, calling the property on a third argument must evict the
+# least recently used result.
+for n in (1, 2, 1, 3, 1, 2):
+    u.root.p_prop_lru(n)
+print_stats('LRU')
+
+# With the reject policy, results past the bound are not memoized (they are
+# rejections, not evictions): calling the property again on them is a miss.
+for n in (1, 2, 3, 3, 1):
+    u.root.p_prop_reject(n)
+print_stats('Reject')
+
+print('Estimated size is positive: {}'.format(
+    ctx.memoization_statistics.bytes > 0
+))
+
+# Reparsing the unit invalidates memoization tables, but counters are
+# cumulative.
+u.reparse(b'example')
+u.root.p_prop_lru(1)
+print_stats('After reparse')
+
+print('main.py: Done.')
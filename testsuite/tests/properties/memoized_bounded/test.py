@@ -0,0 +1,29 @@
+"""
+Check that bounded memoization tables evict or reject entries according to
+their policy, and that memoization statistics are correctly reported.
+"""
+
+from langkit.dsl import ASTNode, T
+from langkit.expressions import langkit_property
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Example(FooNode):
+
+    @langkit_property(public=True, memoized=True, memoization_max_entries=2)
+    def prop_lru(n=T.Int):
+        return n
+
+    @langkit_property(public=True, memoized=True, memoization_max_entries=2,
+                      memoization_eviction='reject')
+    def prop_reject(n=T.Int):
+        return n
+
+
+build_and_run(lkt_file='expected_concrete_syntax.lkt', py_script='main.py')
+print('Done')
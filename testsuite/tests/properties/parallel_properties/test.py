@@ -0,0 +1,82 @@
+"""
+Check that rendering properties code with several worker processes emits the
+code for each property exactly once, in the same order as when rendering
+sequentially.
+"""
+
+import os
+
+from langkit.dsl import ASTNode, Field, T, abstract
+from langkit.expressions import Self, langkit_property
+from langkit.parsers import Grammar, List, Or
+
+from lexer_example import Token, foo_lexer
+from utils import emit_and_print_errors
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Decl(FooNode):
+    name = Field()
+    value = Field()
+
+    @langkit_property(public=True)
+    def eval():
+        return Self.value.eval
+
+
+@abstract
+class Expr(FooNode):
+
+    @langkit_property(public=True)
+    def eval():
+        return 0
+
+    @langkit_property(public=True)
+    def depth():
+        return Self.parents.length
+
+
+class Literal(Expr):
+    token_node = True
+
+    @langkit_property()
+    def eval():
+        return 1
+
+
+class Name(Expr):
+    token_node = True
+
+
+class Plus(Expr):
+    left = Field(type=T.Expr)
+    right = Field(type=T.Expr)
+
+    @langkit_property()
+    def eval():
+        return Self.left.eval + Self.right.eval
+
+
+g = Grammar('main_rule')
+g.add_rules(
+    main_rule=List(g.decl, empty_valid=True),
+    decl=Decl('def', g.name, '=', g.expr, ';'),
+    expr=Or(Plus(g.atom, '+', g.expr), g.atom),
+    atom=Or(Literal(Token.Number), g.name),
+    name=Name(Token.Identifier),
+)
+ctx = emit_and_print_errors(g, foo_lexer, render_properties_jobs=3)
+
+# Check that the code for all properties made it to the generated library,
+# exactly once.
+with open(os.path.join('build', 'src', 'libfoolang-implementation.adb')) as f:
+    names = [line.split()[2] for line in f
+             if line.startswith('--# property-start ')]
+assert len(names) == len(set(names)), 'Some properties were emitted twice'
+for name in names:
+    print(name)
+
+print('Done')
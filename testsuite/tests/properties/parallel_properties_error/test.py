@@ -0,0 +1,81 @@
+"""
+Check that errors raised while rendering properties code in worker processes
+are reported with the location of the corresponding property, just as when
+rendering sequentially.
+"""
+
+from langkit.diagnostics import check_source_language
+from langkit.dsl import ASTNode, Field, T, abstract
+from langkit.expressions import PropertyDef, Self, langkit_property
+from langkit.parsers import Grammar, List, Or
+
+from lexer_example import Token, foo_lexer
+from utils import emit_and_print_errors
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Decl(FooNode):
+    name = Field()
+    value = Field()
+
+    @langkit_property(public=True)
+    def eval():
+        return Self.value.eval
+
+
+@abstract
+class Expr(FooNode):
+
+    @langkit_property(public=True)
+    def eval():
+        return 0
+
+
+class Literal(Expr):
+    token_node = True
+
+    @langkit_property()
+    def eval():
+        return 1
+
+
+class Name(Expr):
+    token_node = True
+
+
+class Plus(Expr):
+    left = Field(type=T.Expr)
+    right = Field(type=T.Expr)
+
+    @langkit_property()
+    def eval():
+        return Self.left.eval + Self.right.eval
+
+
+# Make the rendering of two properties fail. Worker processes are forked, so
+# they inherit this override. As when rendering sequentially, only the error
+# for the first property (Literal.eval) is expected.
+render_property = PropertyDef.render_property
+
+
+def failing_render_property(self, context):
+    check_source_language(self.qualname not in ('Literal.eval', 'Plus.eval'),
+                          'Cannot render this property', ok_for_codegen=True)
+    render_property(self, context)
+
+
+PropertyDef.render_property = failing_render_property
+
+g = Grammar('main_rule')
+g.add_rules(
+    main_rule=List(g.decl, empty_valid=True),
+    decl=Decl('def', g.name, '=', g.expr, ';'),
+    expr=Or(Plus(g.atom, '+', g.expr), g.atom),
+    atom=Or(Literal(Token.Number), g.name),
+    name=Name(Token.Identifier),
+)
+emit_and_print_errors(g, foo_lexer, render_properties_jobs=3)
+print('Done')
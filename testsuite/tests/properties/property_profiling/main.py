@@ -0,0 +1,61 @@
+import json
+import os.path
+import sys
+
+import libfoolang
+
+
+print('main.py: Running...')
+
+
+ctx = libfoolang.AnalysisContext()
+u = ctx.get_from_buffer('main.txt', b'example')
+if u.diagnostics:
+    for d in u.diagnostics:
+        print(d)
+    sys.exit(1)
+
+
+def print_json_profile():
+    profile = json.loads(ctx.property_profile())
+    for p in profile['properties']:
+        print('  {} ({}): calls={} memoized={} memoization_hits={}'
+              ' consistent_times={}'.format(
+                  p['name'],
+                  os.path.basename(p['location']).split(':')[0],
+                  p['calls'],
+                  p['memoized'],
+                  p['memoization_hits'],
+                  0 <= p['exclusive_time'] <= p['inclusive_time'],
+              ))
+
+
+def print_folded_profile():
+    for line in sorted(ctx.property_profile('folded-stacks').splitlines()):
+        path, count = line.rsplit(' ', 1)
+        frames = [f.split(' ')[0] for f in path.split(';')]
+        print('  {} {}'.format(';'.join(frames), int(count) >= 0))
+
+
+print('Empty profile:')
+print_json_profile()
+
+for _ in range(3):
+    u.root.p_memoized_prop
+u.root.p_helper(3)
+
+print('JSON profile:')
+print_json_profile()
+print('Folded stacks profile:')
+print_folded_profile()
+
+try:
+    ctx.property_profile('xml')
+except ValueError as exc:
+    print('ValueError: {}'.format(exc))
+
+ctx.reset_property_profile()
+print('After reset:')
+print_json_profile()
+
+print('main.py: Done.')
@@ -0,0 +1,29 @@
+"""
+Check that the properties profiler records call counts, memoization hits and
+call paths, and that profiles can be dumped from the Python API.
+"""
+
+from langkit.dsl import ASTNode, T
+from langkit.expressions import Self, langkit_property
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Example(FooNode):
+
+    @langkit_property(public=True, memoized=True)
+    def memoized_prop():
+        return Self.helper(1) + Self.helper(2)
+
+    @langkit_property(public=True)
+    def helper(n=T.Int):
+        return n
+
+
+build_and_run(lkt_file='expected_concrete_syntax.lkt', py_script='main.py',
+              profile_properties=True)
+print('Done')
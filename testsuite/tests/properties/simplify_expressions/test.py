@@ -0,0 +1,47 @@
+"""
+Test that the "simplify expressions" pass folds compile-time known
+sub-expressions and removes dead branches in properties.
+"""
+
+from langkit.dsl import ASTNode
+from langkit.expressions import (
+    Arithmetic, ArrayLiteral, CharacterLiteral, If, Literal, Not, Property,
+    Self, String
+)
+
+from utils import emit_and_print_errors
+
+
+class FooNode(ASTNode):
+    double_not = Property(Not(Not(Self.is_ghost)), public=True)
+    not_literal = Property(Not(True), public=True)
+    dead_branch = Property(If(Literal(1) < 2, Self.parent, Self),
+                           public=True)
+    and_true = Property(Self.is_ghost & True, public=True)
+    or_false = Property(Self.is_ghost | False, public=True)
+    arith = Property(Arithmetic(Literal(2), Literal(3), '*') + 4 - 1,
+                     public=True)
+    negative_arith = Property(Literal(2) - 3, public=True)
+    chars_eq = Property(CharacterLiteral('a') == CharacterLiteral('b'),
+                        public=True)
+    string_length = Property(String('hello').length, public=True)
+    array_length = Property(ArrayLiteral([Self.parent, Self]).length,
+                            public=True)
+    not_folded = Property(If(Self.is_ghost, 1, 2), public=True)
+
+
+class Example(FooNode):
+    token_node = True
+
+
+ctx = emit_and_print_errors(lkt_file='foo.lkt')
+
+for prop in FooNode._type.get_properties(
+    lambda p: p.is_public and p.prefix is not None,
+    include_inherited=False
+):
+    print('== {} =='.format(prop.qualname))
+    print(repr(prop.constructed_expr))
+    print(prop.constructed_expr.ir_dump)
+    print('')
+print('Done')
@@ -0,0 +1,89 @@
+import asyncio
+import threading
+
+import libfoolang
+from libfoolang.aio import AsyncAnalysisContext
+
+
+async def main():
+    ctx_1 = AsyncAnalysisContext()
+    ctx_2 = AsyncAnalysisContext()
+
+    # Parse units from both contexts concurrently
+    units = await asyncio.gather(
+        ctx_1.get_from_buffer('foo.txt', b'example a (example b)'),
+        ctx_2.get_from_buffer('bar.txt', b'example c'),
+        ctx_1.get_from_file('missing.txt'),
+    )
+    for unit in units:
+        print('{}: {} diagnostic(s)'.format(
+            unit.unit, len(await unit.diagnostics)
+        ))
+    print('Same context: {}'.format(await units[0].context is ctx_1))
+    print('')
+
+    unit = units[0]
+    root = await unit.root
+    print('Root: {}'.format(root))
+    print('Root text: {}'.format(repr(await root.text)))
+    print('Root children: {}'.format([child async for child in root]))
+
+    names = [name async for name in root.finditer(libfoolang.Name)]
+    print('Names: {}'.format([await name.text for name in names]))
+    parents = [await name.parent for name in names]
+    print('Parents: {}'.format([p.node for p in parents]))
+    print('Names are children of their parents: {}'.format(
+        [await parent.f_name == name for parent, name in zip(parents, names)]
+    ))
+    tokens = [token async for token in unit.iter_tokens()]
+    print('Tokens: {}'.format([await token.text for token in tokens]))
+    print('First token: {}'.format(tokens[0]))
+    print('Next token kind: {}'.format(await (await tokens[0].next).kind))
+    print('')
+
+    # Synchronous code can run in the executor as well
+    print('Node count: {}'.format(await ctx_1.run(
+        lambda: len(unit.unit.root.findall(lambda _: True))
+    )))
+
+    # Errors in native calls are propagated to the awaiting coroutine
+    await unit.reparse(b'example d')
+    try:
+        await root.text
+    except libfoolang.StaleReferenceError:
+        print('Got a StaleReferenceError')
+
+
+async def parse(ctx, filename, buffer):
+    unit = await ctx.get_from_buffer(filename, buffer)
+    root = await unit.root
+    return await root.text
+
+
+asyncio.run(main())
+
+# Contexts can be used from several event loops, including at the same time
+ctx = AsyncAnalysisContext()
+print('First loop: {}'.format(
+    repr(asyncio.run(parse(ctx, 'a.txt', b'example a')))
+))
+print('Second loop: {}'.format(
+    repr(asyncio.run(parse(ctx, 'b.txt', b'example b')))
+))
+
+results = {}
+
+
+def run_thread(i):
+    results[i] = asyncio.run(parse(ctx, '{}.txt'.format(i),
+                                   'example a{}'.format(i).encode('ascii')))
+
+
+threads = [threading.Thread(target=run_thread, args=(i, )) for i in range(4)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+print('Thread loops: {}'.format([results[i] for i in range(4)]))
+
+print('main.py: Done.')
@@ -0,0 +1,26 @@
+"""
+Check that the asyncio front-end of the Python binding runs analyses in an
+executor and wraps their results.
+"""
+
+from langkit.dsl import ASTNode, Field
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Example(FooNode):
+    name = Field()
+    examples = Field()
+
+
+class Name(FooNode):
+    token_node = True
+
+
+build_and_run(lkt_file='expected_concrete_syntax.lkt', py_script='main.py',
+              types_from_lkt=True)
+print('Done')
@@ -0,0 +1,67 @@
+import os
+
+import libfoolang
+
+
+filenames = []
+for i, source in enumerate([
+    'example',
+    'example a (example b)',
+    'example (',
+    'example c',
+]):
+    filename = 'src_{}.txt'.format(i)
+    with open(filename, 'w') as f:
+        f.write(source)
+    filenames.append(filename)
+filenames.append('missing.txt')
+
+
+class DefaultFarm(libfoolang.AnalysisFarm):
+    def report_progress(self, done, total):
+        print('  progress: {}/{}'.format(done, total))
+
+
+class PidFarm(libfoolang.AnalysisFarm):
+    def process_unit(self, unit):
+        assert self.context is not None
+        return os.getpid()
+
+
+class FailingFarm(libfoolang.AnalysisFarm):
+    def process_unit(self, unit):
+        if unit.filename.endswith('src_2.txt'):
+            raise ValueError('cannot process {}'.format(
+                os.path.basename(unit.filename)
+            ))
+        return None
+
+
+print('== Default results ==')
+for filename, result in DefaultFarm(jobs=2, max_pending=1).run(filenames):
+    diagnostics = result['diagnostics']
+    if not diagnostics:
+        print('{}: {}'.format(filename, result['data']))
+    elif diagnostics[0].sloc_range:
+        print('{}: parsing error'.format(filename))
+    else:
+        print('{}: {}'.format(filename, diagnostics[0]))
+print('')
+
+print('== Worker recycling ==')
+pids = [pid for _, pid in PidFarm(jobs=1, max_units_per_worker=1)
+        .run(filenames)]
+print('Distinct workers: {}'.format(len(set(pids)) == len(filenames)))
+pids = [pid for _, pid in PidFarm(jobs=1).run(filenames)]
+print('Single worker: {}'.format(len(set(pids)) == 1))
+print('')
+
+print('== Errors ==')
+try:
+    for filename, _ in FailingFarm(jobs=2).run(filenames):
+        print('{}: OK'.format(filename))
+except ValueError as exc:
+    print('ValueError: {}'.format(exc))
+print('')
+
+print('main.py: Done.')
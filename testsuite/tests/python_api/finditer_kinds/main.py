@@ -0,0 +1,49 @@
+import sys
+
+import libfoolang
+
+
+ctx = libfoolang.AnalysisContext()
+unit = ctx.get_from_buffer('foo.txt', b'def a(x, y) = x + (1 + y)\ndef b = 2')
+if unit.diagnostics:
+    for d in unit.diagnostics:
+        print(d)
+    sys.exit(1)
+
+for types in [libfoolang.Expr,
+              libfoolang.Name,
+              [libfoolang.Ref, libfoolang.Literal]]:
+    print('findall({}):'.format(types))
+    nodes = unit.root.findall(types)
+    sought = tuple(types) if isinstance(types, list) else types
+    assert nodes == unit.root.findall(lambda n: isinstance(n, sought))
+    for n in nodes:
+        print('   {} {}'.format(n.kind_name, repr(n.text)))
+
+print('find(Def): {}'.format(repr(unit.root.find(libfoolang.Def).text)))
+print('Literal.findall(FooNode): {}'.format(
+    unit.root.find(libfoolang.Literal).findall(libfoolang.FooNode)
+))
+
+# Look for nodes in a bigger tree, so that the native traversal is resumed
+# several times, including from deep nodes.
+big_buffer = '\n'.join('def f{}(x) = x + ((1 + x) + {})'.format(i, i)
+                       for i in range(200))
+big_unit = ctx.get_from_buffer('big.txt', big_buffer.encode('ascii'))
+assert not big_unit.diagnostics
+for types in [libfoolang.Literal, libfoolang.Ref]:
+    nodes = big_unit.root.findall(types)
+    assert nodes == big_unit.root.findall(lambda n: isinstance(n, types))
+    print('Big findall({}): {} nodes'.format(types, len(nodes)))
+
+# Nodes are looked for lazily: the search goes on only when more nodes are
+# requested, so reparsing the unit makes the pending search stale.
+it = big_unit.root.finditer(libfoolang.Literal)
+print('First literal: {}'.format(next(it)))
+big_unit.reparse(b'def a = 1')
+try:
+    next(it)
+except libfoolang.StaleReferenceError:
+    print('Got a StaleReferenceError')
+
+print('main.py: Done.')
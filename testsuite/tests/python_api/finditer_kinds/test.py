@@ -0,0 +1,50 @@
+"""
+Test that looking for node types with finditer/findall/find, which relies on
+the native traversal, yields the same nodes as looking for them with a
+predicate.
+"""
+
+from langkit.dsl import ASTNode, Field, abstract
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Name(FooNode):
+    token_node = True
+
+
+class Def(FooNode):
+    name = Field()
+    args = Field()
+    expr = Field()
+
+
+@abstract
+class Expr(FooNode):
+    pass
+
+
+class Literal(Expr):
+    token_node = True
+
+
+class Ref(Expr):
+    name = Field()
+
+
+class ParentExpr(Expr):
+    expr = Field()
+
+
+class Plus(Expr):
+    lhs = Field()
+    rhs = Field()
+
+
+build_and_run(lkt_file='expected_concrete_syntax.lkt', py_script='main.py',
+              types_from_lkt=True)
+print('Done')
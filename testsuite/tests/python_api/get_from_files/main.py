@@ -0,0 +1,83 @@
+import os.path
+
+import libfoolang
+
+
+# Create enough files so that several threads have work to do. Use a lot of
+# distinct identifiers so that threads add symbols to the symbol table at the
+# same time.
+filenames = []
+for i in range(20):
+    filename = 'src_{}.txt'.format(i)
+    with open(filename, 'w') as f:
+        f.write('example (\n')
+        for j in range(50):
+            f.write('    example id_{}_{}\n'.format(i, j))
+        f.write(')\n')
+    filenames.append(filename)
+with open('error.txt', 'w') as f:
+    f.write('example (\n')
+
+# Request some units twice, and some units that cannot be parsed
+filenames += ['src_0.txt', 'error.txt', 'missing.txt']
+
+
+def summary(unit):
+    return '{}: has diagnostics={}'.format(
+        os.path.basename(unit.filename), bool(unit.diagnostics)
+    )
+
+
+def first_line(unit):
+    return unit.root.text.splitlines()[0]
+
+
+print('== Parallel parsing ==')
+ctx = libfoolang.AnalysisContext()
+units = ctx.get_from_files(filenames, jobs=4)
+assert len(units) == len(filenames)
+assert units[0] is units[-3]
+for unit in units[18:]:
+    print(summary(unit))
+print('Units with diagnostics: {}'.format(sorted(
+    {os.path.basename(unit.filename) for unit, _ in units.diagnostics}
+)))
+print(units[-1].diagnostics[0])
+print('Root for missing.txt: {}'.format(units[-1].root))
+print('')
+
+print('== Consistency with sequential parsing ==')
+seq_ctx = libfoolang.AnalysisContext()
+for unit in units:
+    seq_unit = seq_ctx.get_from_file(unit.filename)
+    assert unit is ctx.get_from_file(unit.filename)
+    assert [str(d) for d in unit.diagnostics] == [
+        str(d) for d in seq_unit.diagnostics
+    ]
+    if unit.root is not None:
+        assert unit.text == seq_unit.text
+        assert unit.root.to_data() == seq_unit.root.to_data()
+        for name, seq_name in zip(unit.root.findall(libfoolang.Name),
+                                  seq_unit.root.findall(libfoolang.Name)):
+            assert name.text == seq_name.text
+print('OK')
+print('')
+
+print('== Reparsing ==')
+with open('src_1.txt', 'w') as f:
+    f.write('example changed\n')
+units = ctx.get_from_files(filenames[:2], jobs=2)
+print('Without reparse: {}'.format(first_line(units[1])))
+units = ctx.get_from_files(filenames[:2], reparse=True, jobs=2)
+print('With reparse: {}'.format(first_line(units[1])))
+print('No file: {}'.format(ctx.get_from_files([], jobs=None)))
+print('')
+
+print('== Invalid jobs ==')
+try:
+    ctx.get_from_files(filenames, jobs=0)
+except ValueError as exc:
+    print('ValueError: {}'.format(exc))
+print('')
+
+print('main.py: Done.')
@@ -0,0 +1,26 @@
+"""
+Test that AnalysisContext.get_from_files parses units in parallel with the
+same results as get_from_file.
+"""
+
+from langkit.dsl import ASTNode, Field
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Example(FooNode):
+    name = Field()
+    examples = Field()
+
+
+class Name(FooNode):
+    token_node = True
+
+
+build_and_run(lkt_file='expected_concrete_syntax.lkt', py_script='main.py',
+              types_from_lkt=True)
+print('Done')
@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+
+import libfoolang
+
+
+# Benchmark the import of the module in fresh interpreters. Timings depend on
+# the machine, so print them only on demand.
+script = ('import time; start = time.time(); import libfoolang;'
+          ' print(time.time() - start)')
+timings = [
+    float(subprocess.check_output([sys.executable, '-c', script]))
+    for _ in range(5)
+]
+if os.environ.get('LANGKIT_PRINT_IMPORT_TIME'):
+    print('Import time: {:.1f}ms (best of {})'.format(
+        min(timings) * 1000, len(timings)
+    ))
+
+
+def resolved_functions():
+    """
+    Return the names of the C functions that the binding has resolved so far.
+    """
+    # ctypes caches the functions that are looked up as attributes of the
+    # library object.
+    return sorted(name for name in vars(libfoolang._c_lib)
+                  if name.startswith('foo_'))
+
+
+print('Resolved at import: {}'.format(resolved_functions()))
+
+ctx = libfoolang.AnalysisContext()
+unit = ctx.get_from_buffer('foo.txt', b'example')
+print('Root: {}'.format(unit.root))
+resolved = resolved_functions()
+print('Resolved after parsing: {}'.format(
+    'foo_get_analysis_unit_from_buffer' in resolved
+))
+print('Some functions are still unresolved: {}'.format(
+    'foo_node_find' not in resolved
+))
+
+print('main.py: Done.')
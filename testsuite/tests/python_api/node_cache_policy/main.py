@@ -0,0 +1,54 @@
+import gc
+import sys
+
+import libfoolang
+
+
+for policy, size in [('strong', None), ('lru', 2), ('weak', None)]:
+    print('== {} =='.format(policy))
+    ctx = libfoolang.AnalysisContext(node_cache_policy=policy,
+                                     node_cache_size=size)
+    unit = ctx.get_from_buffer('foo.txt', b'example (example ()) example ()')
+    if unit.diagnostics:
+        for d in unit.diagnostics:
+            print(d)
+        sys.exit(1)
+
+    # Whatever the policy, live wrappers must be re-used
+    root = unit.root
+    nodes = root.findall(lambda n: True)
+    for n1, n2 in zip(nodes, root.findall(lambda n: True)):
+        assert n1 is n2
+    assert root[0] is nodes[0]
+    assert nodes[0].parent is root
+    print('Size with all wrappers alive:',
+          unit.node_cache_statistics.size)
+
+    # Check how many wrappers the cache keeps alive on its own
+    del nodes, n1, n2
+    gc.collect()
+    stats = unit.node_cache_statistics
+    print('Size with only the root alive:', stats.size)
+    assert (stats.evictions > 0) == (policy == 'lru')
+
+print('== Lookup statistics ==')
+for statistics in (False, True):
+    ctx = libfoolang.AnalysisContext(node_cache_statistics=statistics)
+    unit = ctx.get_from_buffer('foo.txt', b'example (example ()) example ()')
+    root = unit.root
+    root.findall(lambda n: True)
+    root.findall(lambda n: True)
+    stats = unit.node_cache_statistics
+    print('node_cache_statistics={}: hits counted: {}, misses counted: {}'
+          .format(statistics, stats.hits is not None and stats.hits > 0,
+                  stats.misses is not None and stats.misses > 0))
+
+print('== Invalid policies ==')
+for policy, size in [('foo', None), ('lru', None), ('weak', 10)]:
+    try:
+        libfoolang.AnalysisContext(node_cache_policy=policy,
+                                   node_cache_size=size)
+    except ValueError as exc:
+        print('ValueError: {}'.format(exc))
+
+print('main.py: Done.')
@@ -0,0 +1,32 @@
+import sys
+
+import libfoolang
+
+
+ctx = libfoolang.AnalysisContext()
+unit = ctx.get_from_buffer('foo.txt', b'example (example b ())')
+if unit.diagnostics:
+    for d in unit.diagnostics:
+        print(d)
+    sys.exit(1)
+
+for node in [unit.root] + unit.root.findall(lambda _: True):
+    print('{}:'.format('list' if node.is_list_type else type(node).__name__))
+
+    # Fetch a child through the single-child getter first, so that iteration
+    # has to merge it with the bulk fetch.
+    if len(node) > 1:
+        node[1]
+
+    children = list(node)
+    assert len(children) == len(node)
+    for i, child in enumerate(children):
+        assert child is node[i]
+
+    for name, value in node.iter_fields():
+        if not node.is_list_type:
+            assert value is getattr(node, name)
+        print('   {}: {}'.format(name, 'None' if value is None else 'node'))
+
+print(unit.root.to_data())
+print('main.py: Done.')
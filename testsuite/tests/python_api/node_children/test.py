@@ -0,0 +1,26 @@
+"""
+Test that the Python binding methods built on top of the bulk children fetch
+(iteration, iter_fields, to_data) are consistent with child getters.
+"""
+
+from langkit.dsl import ASTNode, Field
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class Example(FooNode):
+    name = Field()
+    examples = Field()
+
+
+class Name(FooNode):
+    token_node = True
+
+
+build_and_run(lkt_file='expected_concrete_syntax.lkt', py_script='main.py',
+              types_from_lkt=True)
+print('Done')
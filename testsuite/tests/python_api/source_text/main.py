@@ -0,0 +1,46 @@
+import libfoolang
+
+
+ctx = libfoolang.AnalysisContext()
+unit = ctx.get_from_buffer('foo.txt', b'example a (example b)\nexample c ()')
+
+# Fetch token texts from the native library first, so that we can check that
+# slices of the decoded source buffer yield the same results.
+tokens = list(unit.iter_tokens())
+native_texts = [t.text for t in tokens]
+native_range = libfoolang.Token.text_range(tokens[1], tokens[-2])
+
+print('Source text: {}'.format(repr(unit.source_text)))
+print('Same token texts: {}'.format(
+    [t.text for t in tokens] == native_texts
+))
+print('Same token range text: {}'.format(
+    libfoolang.Token.text_range(tokens[1], tokens[-2]) == native_range
+))
+print('Empty token range text: {}'.format(
+    repr(libfoolang.Token.text_range(tokens[2], tokens[1]))
+))
+print('')
+
+root = unit.root
+for node in root.findall(lambda n: True):
+    print('{} -> {}'.format(node, repr(node.text)))
+
+# Text bounds are cached in the unit, so that new wrappers for the same nodes
+# do not need to query the native library again.
+print('Cached node text bounds: {}'.format(len(unit._source[3])))
+print('')
+
+# Once the unit is reparsed, texts must come from the new source buffer and
+# old nodes must be detected as stale.
+old_node = root[0]
+unit.reparse(b'example d')
+print('Source text: {}'.format(repr(unit.source_text)))
+print('Root text: {}'.format(repr(unit.root.text)))
+print('First token text: {}'.format(repr(unit.first_token.text)))
+try:
+    old_node.text
+except libfoolang.StaleReferenceError:
+    print('Got a StaleReferenceError')
+
+print('main.py: Done.')
@@ -0,0 +1,41 @@
+import sys
+
+import libfoolang
+
+
+ctx = libfoolang.AnalysisContext()
+unit = ctx.get_from_buffer('foo.txt', b'(a\n b) ')
+if unit.diagnostics:
+    for d in unit.diagnostics:
+        print(d)
+    sys.exit(1)
+
+columns = unit.token_columns()
+tokens = list(unit.iter_tokens())
+print(columns)
+assert len(columns) == len(tokens)
+
+text = unit.text
+for i, tok in enumerate(tokens):
+    kind = columns.kind_name(columns.kinds[i])
+    start_sloc = (columns.start_lines[i], columns.start_columns[i])
+    end_sloc = (columns.end_lines[i], columns.end_columns[i])
+    is_trivia = bool(columns.is_trivia[i])
+
+    assert kind == tok.kind
+    assert start_sloc == (tok.sloc_range.start.line,
+                          tok.sloc_range.start.column)
+    assert end_sloc == (tok.sloc_range.end.line, tok.sloc_range.end.column)
+    assert is_trivia == tok.is_trivia
+    assert text[columns.start_offsets[i]:columns.end_offsets[i]] == tok.text
+
+    print('   {} {}:{}-{}:{}{}'.format(kind, start_sloc[0], start_sloc[1],
+                                       end_sloc[0], end_sloc[1],
+                                       ' (trivia)' if is_trivia else ''))
+
+# Columns are exposed without copies through the buffer protocol
+view = memoryview(columns.start_lines)
+assert view.format == columns.start_lines.typecode
+assert list(view) == list(columns.start_lines)
+
+print('main.py: Done.')
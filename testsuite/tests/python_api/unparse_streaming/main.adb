@@ -0,0 +1,71 @@
+with Ada.Strings;           use Ada.Strings;
+with Ada.Strings.Fixed;     use Ada.Strings.Fixed;
+with Ada.Strings.Unbounded; use Ada.Strings.Unbounded;
+with Ada.Text_IO;           use Ada.Text_IO;
+
+with Libfoolang.Analysis;  use Libfoolang.Analysis;
+with Libfoolang.Unparsing; use Libfoolang.Unparsing;
+
+--  Check that streaming unparsing yields the same text as regular unparsing
+--  when the unparsed text is big enough for the buffer to be flushed several
+--  times.
+
+procedure Main is
+   Item_Count : constant := 10_000;
+
+   Ctx    : constant Analysis_Context := Create_Context;
+   Buffer : Unbounded_String;
+   U      : Analysis_Unit;
+
+   Streamed    : Unbounded_String;
+   Chunk_Count : Natural := 0;
+
+   function Img (I : Positive) return String
+   is (Trim (Positive'Image (I), Left));
+
+   procedure Write (Bytes : String);
+
+   -----------
+   -- Write --
+   -----------
+
+   procedure Write (Bytes : String) is
+   begin
+      Chunk_Count := Chunk_Count + 1;
+      Append (Streamed, Bytes);
+   end Write;
+
+begin
+   Put_Line ("main.adb: Running...");
+
+   --  Alternate both kinds of items so that flushes happen at various
+   --  positions in the unparsed text.
+
+   for I in 1 .. Item_Count loop
+      if I mod 2 = 0 then
+         Append (Buffer, "def {" & Img (I) & "};" & ASCII.LF);
+      else
+         Append (Buffer, "def (ident" & Img (I) & ");" & ASCII.LF);
+      end if;
+   end loop;
+
+   U := Get_From_Buffer (Ctx, "main.txt", Buffer => To_String (Buffer));
+   if U.Has_Diagnostics then
+      for D of U.Diagnostics loop
+         Put_Line (U.Format_GNU_Diagnostic (D));
+      end loop;
+      return;
+   end if;
+
+   declare
+      Expected : constant String := Unparse (U.Root);
+   begin
+      Unparse (U.Root, Write'Access);
+      Put_Line ("Unparsed text size:" & Natural'Image (Expected'Length));
+      Put_Line ("Several chunks: " & Boolean'Image (Chunk_Count > 1));
+      Put_Line ("Same text: "
+                & Boolean'Image (To_String (Streamed) = Expected));
+   end;
+
+   Put_Line ("main.adb: Done.");
+end Main;
@@ -0,0 +1,58 @@
+import sys
+
+import libfoolang
+
+
+print('main.py: Running...')
+
+ctx = libfoolang.AnalysisContext()
+u = ctx.get_from_buffer('main.txt', b'def {1};\ndef (a);\n')
+if u.diagnostics:
+    for d in u.diagnostics:
+        print(d)
+    sys.exit(1)
+
+# Unparse to a callback
+chunks = []
+u.root.unparse_to(chunks.append)
+print('unparse_to: {}'.format(b''.join(chunks)))
+
+# Unparse only a sub-tree
+chunks = []
+u.root[1].unparse_to(chunks.append)
+print('unparse_to (second item): {}'.format(b''.join(chunks)))
+
+
+# Exceptions raised in the callback must be propagated to the caller
+def failing_callback(chunk):
+    raise ValueError('cannot process {}'.format(chunk))
+
+
+try:
+    u.root.unparse_to(failing_callback)
+except ValueError as exc:
+    print('ValueError: {}'.format(exc))
+
+# Unparse to a file
+u.root.unparse_to_file('unparsed.txt')
+with open('unparsed.txt', 'rb') as f:
+    print('unparse_to_file: {}'.format(f.read()))
+
+# Unparse a tree big enough for the unparsing buffer to be flushed several
+# times.
+items = [('def {{{}}};' if i % 2 == 0 else 'def (ident{});').format(i)
+         for i in range(1, 10001)]
+u = ctx.get_from_buffer('big.txt', '\n'.join(items).encode('ascii'))
+assert not u.diagnostics
+expected = ''.join(item.replace(' ', '') for item in items).encode('ascii')
+
+chunks = []
+u.root.unparse_to(chunks.append)
+print('Big unparse_to: {} bytes, several chunks: {}, same text: {}'.format(
+    len(expected), len(chunks) > 1, b''.join(chunks) == expected
+))
+u.root.unparse_to_file('unparsed.txt')
+with open('unparsed.txt', 'rb') as f:
+    print('Big unparse_to_file: same text: {}'.format(f.read() == expected))
+
+print('main.py: Done.')
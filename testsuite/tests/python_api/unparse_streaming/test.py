@@ -0,0 +1,31 @@
+"""
+Test streaming unparsing in the Python binding (to a callback and to a file)
+and in the Ada API, including for texts that are flushed in several chunks.
+"""
+
+from langkit.dsl import ASTNode, Field
+
+from utils import build_and_run
+
+
+class FooNode(ASTNode):
+    pass
+
+
+class RootNode(FooNode):
+    ident = Field()
+    number = Field()
+
+
+class Identifier(FooNode):
+    token_node = True
+
+
+class Number(FooNode):
+    token_node = True
+
+
+build_and_run(lkt_file='expected_concrete_syntax.lkt', py_script='main.py',
+              ada_main='main.adb', generate_unparser=True,
+              types_from_lkt=True)
+print('Done')
@@ -0,0 +1,105 @@
+import io
+import json
+import struct
+import sys
+
+import libfoolang
+
+
+def parse(source):
+    unit = ctx.get_from_buffer('foo.txt', source)
+    if unit.diagnostics:
+        for d in unit.diagnostics:
+            print(d)
+        sys.exit(1)
+    return unit.root
+
+
+def decode_binary(data):
+    """
+    Print the content of the result of write_binary.
+    """
+    offset = [0]
+
+    def read(fmt):
+        result = struct.unpack_from(fmt, data, offset[0])
+        offset[0] += struct.calcsize(fmt)
+        return result
+
+    assert data[:4] == b'LKBT'
+    offset[0] = 4
+    version, flags, kinds_count = read('<BBH')
+    print('version={} flags={}'.format(version, flags))
+    kinds = {}
+    for _ in range(kinds_count):
+        code, length = read('<HH')
+        kinds[code] = data[offset[0]:offset[0] + length].decode('utf-8')
+        offset[0] += length
+
+    # Stack of numbers of children left to read for each parent
+    stack = []
+    while offset[0] < len(data):
+        indent = '  ' * len(stack)
+        kind, = read('<H')
+        if kind == 0:
+            line = '<null>'
+            children_count = 0
+        else:
+            children_count, = read('<I')
+            line = '{} ({} children)'.format(kinds[kind], children_count)
+            if flags & 1:
+                line += ' {}:{}-{}:{}'.format(*read('<IIII'))
+            if flags & 2:
+                length, = read('<I')
+                if length != 0xffffffff:
+                    text = data[offset[0]:offset[0] + length].decode('utf-8')
+                    offset[0] += length
+                    line += ' {}'.format(json.dumps(text))
+        print(indent + line)
+
+        if stack:
+            stack[-1] -= 1
+        stack.append(children_count)
+        while stack and stack[-1] == 0:
+            stack.pop()
+    assert not stack
+
+
+ctx = libfoolang.AnalysisContext()
+root = parse(b'example a (example b)')
+
+print('== to_json ==')
+assert root.to_json() == json.dumps(root.to_data())
+print(root.to_json())
+
+# to_json must reflect overrides of to_data
+libfoolang.Name.to_data = lambda self: self.text
+print(root.to_json())
+del libfoolang.Name.to_data
+print('')
+
+print('== write_json ==')
+for kwargs in [{}, {'text': True}, {'kind': True, 'sloc': True,
+                                    'text': True}]:
+    output = io.StringIO()
+    root.write_json(output, **kwargs)
+    print('{}:'.format(', '.join(sorted(kwargs)) or 'default'))
+    print(json.dumps(json.loads(output.getvalue()), indent=2))
+print('')
+
+print('== write_binary ==')
+for kwargs in [{}, {'sloc': True, 'text': True}]:
+    output = io.BytesIO()
+    root.write_binary(output, **kwargs)
+    decode_binary(output.getvalue())
+print('')
+
+print('== Deep trees ==')
+depth = 500
+deep_root = parse(b'example (' * depth + b'example' + b')' * depth)
+output = io.StringIO()
+deep_root.write_json(output)
+print(output.getvalue().count('[') == depth + 1)
+print('')
+
+print('main.py: Done.')